@@ -1,7 +1,16 @@
-from typing import Literal, TypeAlias
+import bz2
+import gzip
+import io
+from collections.abc import Iterator
+from itertools import islice
+from pathlib import Path
+from typing import IO, Literal, TypeAlias, cast
+
+from rdflib import Graph
+from rdflib.util import guess_format
 
 MIMETypes: TypeAlias = Literal[
-    "application/rdf+xml", "text/turtle", "application/n-triple", "application/n-quads", "application/trig"
+    "application/rdf+xml", "text/turtle", "application/n-triples", "application/n-quads", "application/trig"
 ]
 
 
@@ -23,12 +32,72 @@ def rdflib_to_mime_types(rdflib_format: str) -> str | None:
         "xml": "application/rdf+xml",
         "rdf": "application/rdf+xml",
         "owl": "application/rdf+xml",
-        "n3": "application/n-triple",
+        "n3": "application/n-triples",
         "ttl": "text/turtle",
         "turtle": "text/turtle",
-        "nt": "application/n-triple",
+        "nt": "application/n-triples",
         "nq": "application/n-quads",
         "nquads": "application/n-quads",
         "trig": "application/trig",
     }
     return mapping.get(rdflib_format, None)
+
+
+_COMPRESSIONS = {".gz": "gzip", ".bz2": "bz2"}
+
+
+def rdf_file_format(filepath: Path) -> tuple[str | None, str | None]:
+    """Guess the RDFLib format and the compression of an RDF file from its suffixes.
+
+    Args:
+        filepath (Path): The path to the RDF file, for example `graph.ttl` or `graph.nt.gz`.
+
+    Returns:
+        tuple[str | None, str | None]: The RDFLib format and the compression, either "gzip", "bz2" or None.
+    """
+    compression = _COMPRESSIONS.get(filepath.suffix.lower())
+    if compression is not None:
+        filepath = filepath.with_suffix("")
+    return guess_format(str(filepath)), compression
+
+
+def open_rdf_file(filepath: Path) -> IO[bytes]:
+    """Open an RDF file for reading in binary mode, decompressing gzip and bz2 compressed files."""
+    compression = _COMPRESSIONS.get(filepath.suffix.lower())
+    if compression == "gzip":
+        return cast(IO[bytes], gzip.open(filepath, "rb"))
+    if compression == "bz2":
+        return cast(IO[bytes], bz2.open(filepath, "rb"))
+    return filepath.open("rb")
+
+
+def convert_to_ntriples(source: Path, rdflib_format: str, destination: Path, base_uri: str | None = None) -> Path:
+    """Parse an RDF file and write its triples as N-Triples.
+
+    This is used as a job in a process pool, to parse the files of a directory concurrently.
+
+    Args:
+        source (Path): The RDF file, optionally compressed.
+        rdflib_format (str): The RDFLib format of the file.
+        destination (Path): The N-Triples file to write.
+        base_uri (str, optional): The base URI used to resolve relative URIs in the file.
+
+    Returns:
+        Path: The N-Triples file.
+    """
+    graph = Graph()
+    with open_rdf_file(source) as file:
+        graph.parse(file, format=rdflib_format, publicID=base_uri)
+    graph.serialize(destination, format="nt", encoding="utf-8")
+    return destination
+
+
+def read_ntriples_chunks(filepath: Path, chunk_size: int) -> Iterator[str]:
+    """Read an N-Triples file, optionally compressed, in chunks of at most chunk_size lines.
+
+    N-Triples has one triple per line, so every chunk can be parsed on its own.
+    """
+    with open_rdf_file(filepath) as file:
+        lines = io.TextIOWrapper(file, encoding="utf-8")
+        while chunk := list(islice(lines, chunk_size)):
+            yield "".join(chunk)
@@ -44,10 +44,11 @@ class AssetsExtractor(ClassicCDFBaseExtractor[Asset]):
         limit: int | None = None,
         unpack_metadata: bool = True,
         skip_metadata_values: Set[str] | None = DEFAULT_SKIP_METADATA_VALUES,
+        incremental: bool = False,
     ):
         total = client.assets.aggregate_count(filter=AssetFilter(data_set_ids=[{"externalId": data_set_external_id}]))
 
-        return cls(
+        extractor = cls(
             client.assets(data_set_external_ids=data_set_external_id),
             namespace,
             to_type,
@@ -56,6 +57,14 @@ class AssetsExtractor(ClassicCDFBaseExtractor[Asset]):
             unpack_metadata=unpack_metadata,
             skip_metadata_values=skip_metadata_values,
         )
+        if incremental:
+            extractor._set_incremental(
+                f"data_set={data_set_external_id}",
+                lambda watermark: client.assets(
+                    data_set_external_ids=data_set_external_id, last_updated_time={"min": watermark}
+                ),
+            )
+        return extractor
 
     @classmethod
     def from_hierarchy(
@@ -67,12 +76,13 @@ class AssetsExtractor(ClassicCDFBaseExtractor[Asset]):
         limit: int | None = None,
         unpack_metadata: bool = True,
         skip_metadata_values: Set[str] | None = DEFAULT_SKIP_METADATA_VALUES,
+        incremental: bool = False,
     ):
         total = client.assets.aggregate_count(
             filter=AssetFilter(asset_subtree_ids=[{"externalId": root_asset_external_id}])
         )
 
-        return cls(
+        extractor = cls(
             cast(
                 Iterable[Asset],
                 client.assets(asset_subtree_external_ids=root_asset_external_id),
@@ -84,6 +94,14 @@ class AssetsExtractor(ClassicCDFBaseExtractor[Asset]):
             unpack_metadata=unpack_metadata,
             skip_metadata_values=skip_metadata_values,
         )
+        if incremental:
+            extractor._set_incremental(
+                f"hierarchy={root_asset_external_id}",
+                lambda watermark: client.assets(
+                    asset_subtree_external_ids=root_asset_external_id, last_updated_time={"min": watermark}
+                ),
+            )
+        return extractor
 
     @classmethod
     def from_file(
@@ -11,6 +11,7 @@ from rdflib import XSD, Literal, Namespace, URIRef
 from cognite.neat._constants import DEFAULT_NAMESPACE
 from cognite.neat._graph.extractors._base import BaseExtractor
 from cognite.neat._graph.models import Triple
+from cognite.neat._issues.errors import NeatValueError
 from cognite.neat._utils.auxiliary import string_to_ideal_type
 
 T_CogniteResource = TypeVar("T_CogniteResource", bound=CogniteResource)
@@ -61,6 +62,12 @@ class ClassicCDFBaseExtractor(BaseExtractor, ABC, Generic[T_CogniteResource]):
             a JSON string.
         skip_metadata_values (set[str] | frozenset[str] | None, optional): If you are unpacking metadata, then
            values in this set will be skipped.
+
+    Extractors created with `incremental=True` have a `watermark_scope`, which identifies the data set or hierarchy
+    they extract. When written to the NeatGraphStore, the store records the largest `last_updated_time` of the
+    extracted items as a watermark for the scope in its provenance. On the next write with the same scope, only the
+    items updated after the watermark are fetched, and they replace the existing triples of the same instances. Note
+    that an incremental extraction does not detect items that have been deleted in CDF.
     """
 
     _default_rdf_type: str
@@ -83,6 +90,28 @@ class ClassicCDFBaseExtractor(BaseExtractor, ABC, Generic[T_CogniteResource]):
         self.limit = min(limit, total) if limit and total else limit
         self.unpack_metadata = unpack_metadata
         self.skip_metadata_values = skip_metadata_values
+        self.watermark_scope: str | None = None
+        # The largest last updated time, in milliseconds since epoch, of the extracted items.
+        self.last_updated_time: int | None = None
+        self._items_updated_since: Callable[[int], Iterable[T_CogniteResource]] | None = None
+
+    def _set_incremental(self, scope: str, items_updated_since: Callable[[int], Iterable[T_CogniteResource]]) -> None:
+        self.watermark_scope = f"{type(self).__name__}({scope})"
+        self._items_updated_since = items_updated_since
+
+    def extract_updated_since(self, watermark: int) -> None:
+        """Limits the extraction to the items updated since the watermark.
+
+        The watermark is inclusive, such that items updated in the same millisecond as the last item of the
+        previous extraction are not missed.
+
+        Args:
+            watermark: Last updated time in milliseconds since epoch.
+        """
+        if self._items_updated_since is None:
+            raise NeatValueError(f"{type(self).__name__} is not incremental, use incremental=True to create it")
+        self.items = self._items_updated_since(watermark)
+        self.total = None
 
     def extract(self) -> Iterable[Triple]:
         """Extracts an asset with the given asset_id."""
@@ -101,6 +130,8 @@ class ClassicCDFBaseExtractor(BaseExtractor, ABC, Generic[T_CogniteResource]):
             to_iterate = self.items
         for no, asset in enumerate(to_iterate):
             yield from self._item2triples(asset)
+            if self.watermark_scope is not None and (last_updated_time := getattr(asset, "last_updated_time", None)):
+                self.last_updated_time = max(self.last_updated_time or last_updated_time, last_updated_time)
             if self.limit and no >= self.limit:
                 break
 
@@ -1,6 +1,9 @@
+import queue
+import threading
 from collections import defaultdict
-from collections.abc import Iterable, Sequence
-from typing import ClassVar, NamedTuple
+from collections.abc import Callable, Iterable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, ClassVar, NamedTuple
 
 from cognite.client import CogniteClient
 from rdflib import Namespace
@@ -8,7 +11,7 @@ from rdflib import Namespace
 from cognite.neat._constants import DEFAULT_NAMESPACE
 from cognite.neat._graph.extractors._base import BaseExtractor
 from cognite.neat._graph.models import Triple
-from cognite.neat._utils.collection_ import chunker
+from cognite.neat._utils.collection_ import chunker, chunker_iterable
 from cognite.neat._utils.rdf_ import remove_namespace_from_uri
 
 from ._assets import AssetsExtractor
@@ -34,6 +37,10 @@ class _ClassicCoreType(NamedTuple):
     api_name: str
 
 
+# Kinds of messages sent from the worker threads in the concurrent mode of the ClassicGraphExtractor.
+_BATCH, _DONE, _ERROR = range(3)
+
+
 class ClassicGraphExtractor(BaseExtractor):
     """This extractor extracts all classic CDF Resources.
 
@@ -72,6 +79,10 @@ class ClassicGraphExtractor(BaseExtractor):
         data_set_external_id (str, optional): The data set external id to extract from. Defaults to None.
         root_asset_external_id (str, optional): The root asset external id to extract from. Defaults to None.
         namespace (Namespace, optional): The namespace to use. Defaults to DEFAULT_NAMESPACE.
+        max_workers (int, optional): The maximal number of concurrent requests to CDF. Defaults to 1, which
+            extracts all resources one after another. With more workers, the resource types in step 1 and the
+            chunks of external ids in steps 2-5 are fetched in parallel, and their triples are merged into one
+            stream in the order they arrive. Keep this low enough to stay within the CDF rate limits.
     """
 
     # These are the core resource types in the classic CDF.
@@ -89,13 +100,19 @@ class ClassicGraphExtractor(BaseExtractor):
         data_set_external_id: str | None = None,
         root_asset_external_id: str | None = None,
         namespace: Namespace | None = None,
+        max_workers: int = 1,
     ):
         self._client = client
+        if max_workers < 1:
+            raise ValueError(f"max_workers must be a positive integer, got {max_workers}")
         if sum([bool(data_set_external_id), bool(root_asset_external_id)]) != 1:
             raise ValueError("Exactly one of data_set_external_id or root_asset_external_id must be set.")
         self._root_asset_external_id = root_asset_external_id
         self._data_set_external_id = data_set_external_id
         self._namespace = namespace or DEFAULT_NAMESPACE
+        self._max_workers = max_workers
+        # Protects the bookkeeping below, which is updated from the worker threads in concurrent mode.
+        self._lock = threading.Lock()
 
         self._source_external_ids_by_type: dict[InstanceIdPrefix, set[str]] = defaultdict(set)
         self._target_external_ids_by_type: dict[InstanceIdPrefix, set[str]] = defaultdict(set)
@@ -114,7 +131,10 @@ class ClassicGraphExtractor(BaseExtractor):
         yield from self._extract_data_sets()
 
     def _extract_core_start_nodes(self):
-        for core_node in self._classic_node_types:
+        yield from self._run(self._core_start_node_job(core_node) for core_node in self._classic_node_types)
+
+    def _core_start_node_job(self, core_node: _ClassicCoreType) -> Callable[[], Iterable[Triple]]:
+        def job() -> Iterable[Triple]:
             if self._data_set_external_id:
                 extractor = core_node.extractor_cls.from_dataset(
                     self._client, self._data_set_external_id, self._namespace, unpack_metadata=False
@@ -128,68 +148,167 @@ class ClassicGraphExtractor(BaseExtractor):
 
             yield from self._extract_with_logging_label_dataset(extractor, core_node.resource_type)
 
+        return job
+
     def _extract_start_node_relationships(self):
-        for start_resource_type, source_external_ids in self._source_external_ids_by_type.items():
-            start_type = start_resource_type.removesuffix("_")
-            for chunk in self._chunk(list(source_external_ids), description=f"Extracting {start_type} relationships"):
-                relationship_iterator = self._client.relationships(
-                    source_external_ids=list(chunk), source_types=[start_type]
-                )
-                extractor = RelationshipsExtractor(relationship_iterator, self._namespace, unpack_metadata=False)
-                # This is a private attribute, but we need to set it to log the target nodes.
-                extractor._log_target_nodes = True
+        yield from self._run(
+            self._relationship_job(start_resource_type.removesuffix("_"), chunk)
+            for start_resource_type, source_external_ids in self._source_external_ids_by_type.items()
+            for chunk in self._chunk(
+                list(source_external_ids),
+                description=f"Extracting {start_resource_type.removesuffix('_')} relationships",
+            )
+        )
+
+    def _relationship_job(self, start_type: str, chunk: Sequence[str]) -> Callable[[], Iterable[Triple]]:
+        def job() -> Iterable[Triple]:
+            relationship_iterator = self._client.relationships(
+                source_external_ids=list(chunk), source_types=[start_type]
+            )
+            extractor = RelationshipsExtractor(relationship_iterator, self._namespace, unpack_metadata=False)
+            # This is a private attribute, but we need to set it to log the target nodes.
+            extractor._log_target_nodes = True
 
-                yield from extractor.extract()
+            yield from extractor.extract()
 
-                # After the extraction is done, we need to update all the new target nodes so
-                # we can extract them in the next step.
+            # After the extraction is done, we need to update all the new target nodes so
+            # we can extract them in the next step.
+            with self._lock:
                 for end_type, target_external_ids in extractor._target_external_ids_by_type.items():
                     for external_id in target_external_ids:
                         # We only want to extract the target nodes that are not already extracted.
-                        # Even though _source_external_ids_by_type is a defaultdict, we have to check if the key exists.
-                        # This is because we might not have extracted any nodes of that type yet, and looking up
-                        # a key that does not exist will create it. We are iterating of this dictionary, and
-                        # we do not want to create new keys while iterating.
+                        # Even though _source_external_ids_by_type is a defaultdict, we have to check if the key
+                        # exists. This is because we might not have extracted any nodes of that type yet, and
+                        # looking up a key that does not exist will create it. We are iterating of this dictionary,
+                        # and we do not want to create new keys while iterating.
                         if (
                             end_type not in self._source_external_ids_by_type
                             or external_id not in self._source_external_ids_by_type[end_type]
                         ):
                             self._target_external_ids_by_type[end_type].add(external_id)
 
+        return job
+
     def _extract_core_end_nodes(self):
-        for core_node in self._classic_node_types:
-            target_external_ids = self._target_external_ids_by_type[core_node.resource_type]
-            api = getattr(self._client, core_node.api_name)
+        yield from self._run(
+            self._core_end_node_job(core_node, chunk)
+            for core_node in self._classic_node_types
             for chunk in self._chunk(
-                list(target_external_ids),
+                list(self._target_external_ids_by_type[core_node.resource_type]),
                 description=f"Extracting end nodes {core_node.resource_type.removesuffix('_')}",
-            ):
-                resource_iterator = api.retrieve_multiple(external_ids=list(chunk), ignore_unknown_ids=True)
-                extractor = core_node.extractor_cls(resource_iterator, self._namespace, unpack_metadata=False)
-                yield from self._extract_with_logging_label_dataset(extractor)
+            )
+        )
+
+    def _core_end_node_job(self, core_node: _ClassicCoreType, chunk: Sequence[str]) -> Callable[[], Iterable[Triple]]:
+        def job() -> Iterable[Triple]:
+            api = getattr(self._client, core_node.api_name)
+            resource_iterator = api.retrieve_multiple(external_ids=list(chunk), ignore_unknown_ids=True)
+            extractor = core_node.extractor_cls(resource_iterator, self._namespace, unpack_metadata=False)
+            yield from self._extract_with_logging_label_dataset(extractor)
+
+        return job
 
     def _extract_labels(self):
-        for chunk in self._chunk(list(self._labels), description="Extracting labels"):
+        yield from self._run(
+            self._label_job(chunk) for chunk in self._chunk(list(self._labels), description="Extracting labels")
+        )
+
+    def _label_job(self, chunk: Sequence[str]) -> Callable[[], Iterable[Triple]]:
+        def job() -> Iterable[Triple]:
             label_iterator = self._client.labels.retrieve(external_id=list(chunk), ignore_unknown_ids=True)
             yield from LabelsExtractor(label_iterator, self._namespace).extract()
 
+        return job
+
     def _extract_data_sets(self):
-        for chunk in self._chunk(list(self._data_set_ids), description="Extracting data sets"):
+        yield from self._run(
+            self._data_set_job(chunk)
+            for chunk in self._chunk(list(self._data_set_ids), description="Extracting data sets")
+        )
+
+    def _data_set_job(self, chunk: Sequence[int]) -> Callable[[], Iterable[Triple]]:
+        def job() -> Iterable[Triple]:
             data_set_iterator = self._client.data_sets.retrieve_multiple(ids=list(chunk), ignore_unknown_ids=True)
             yield from DataSetExtractor(data_set_iterator, self._namespace, unpack_metadata=False).extract()
 
+        return job
+
+    def _run(self, jobs: Iterable[Callable[[], Iterable[Triple]]]) -> Iterable[Triple]:
+        """Runs the extraction jobs and merges their triples into one stream.
+
+        With a single worker, the jobs run one after another in the calling thread. Otherwise, at most
+        max_workers jobs run at the same time in a thread pool, and their triples are passed on in batches
+        through a bounded queue, such that a slow consumer does not let the fetched data pile up in memory.
+        """
+        if self._max_workers == 1:
+            for job in jobs:
+                yield from job()
+            return None
+
+        batches: queue.Queue[tuple[int, Any]] = queue.Queue(maxsize=4 * self._max_workers)
+        stop = threading.Event()
+
+        def put(item: tuple[int, Any]) -> bool:
+            while not stop.is_set():
+                try:
+                    batches.put(item, timeout=0.1)
+                except queue.Full:
+                    continue
+                return True
+            return False
+
+        def run(job: Callable[[], Iterable[Triple]]) -> None:
+            try:
+                for batch in chunker_iterable(job(), 1000):
+                    if not put((_BATCH, batch)):
+                        return None
+            except BaseException as e:
+                put((_ERROR, e))
+            else:
+                put((_DONE, None))
+
+        job_iterator = iter(jobs)
+        running = 0
+        with ThreadPoolExecutor(max_workers=self._max_workers, thread_name_prefix="neat-classic") as executor:
+            try:
+                for job in job_iterator:
+                    executor.submit(run, job)
+                    running += 1
+                    if running == self._max_workers:
+                        break
+                while running:
+                    kind, item = batches.get()
+                    if kind == _BATCH:
+                        yield from item
+                        continue
+                    elif kind == _ERROR:
+                        raise item
+                    running -= 1
+                    # A worker is free, start the next job.
+                    if (job := next(job_iterator, None)) is not None:
+                        executor.submit(run, job)
+                        running += 1
+            finally:
+                stop.set()
+
     def _extract_with_logging_label_dataset(
         self, extractor: ClassicCDFBaseExtractor, resource_type: InstanceIdPrefix | None = None
     ) -> Iterable[Triple]:
+        if self._max_workers > 1:
+            # The progress bars of rich cannot be shown from several threads at the same time.
+            extractor.total = None
         for triple in extractor.extract():
             if triple[1] == self._namespace.external_id and resource_type is not None:
-                self._source_external_ids_by_type[resource_type].add(remove_namespace_from_uri(triple[2]))
+                with self._lock:
+                    self._source_external_ids_by_type[resource_type].add(remove_namespace_from_uri(triple[2]))
             elif triple[1] == self._namespace.label:
-                self._labels.add(remove_namespace_from_uri(triple[2]).removeprefix(InstanceIdPrefix.label))
+                with self._lock:
+                    self._labels.add(remove_namespace_from_uri(triple[2]).removeprefix(InstanceIdPrefix.label))
             elif triple[1] == self._namespace.dataset:
-                self._data_set_ids.add(
-                    int(remove_namespace_from_uri(triple[2]).removeprefix(InstanceIdPrefix.data_set))
-                )
+                with self._lock:
+                    self._data_set_ids.add(
+                        int(remove_namespace_from_uri(triple[2]).removeprefix(InstanceIdPrefix.data_set))
+                    )
             yield triple
 
     @staticmethod
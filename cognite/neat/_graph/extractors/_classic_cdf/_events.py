@@ -42,10 +42,11 @@ class EventsExtractor(ClassicCDFBaseExtractor[Event]):
         limit: int | None = None,
         unpack_metadata: bool = True,
         skip_metadata_values: Set[str] | None = DEFAULT_SKIP_METADATA_VALUES,
+        incremental: bool = False,
     ):
         total = client.events.aggregate_count(filter=EventFilter(data_set_ids=[{"externalId": data_set_external_id}]))
 
-        return cls(
+        extractor = cls(
             client.events(data_set_external_ids=data_set_external_id),
             namespace,
             to_type,
@@ -54,6 +55,14 @@ class EventsExtractor(ClassicCDFBaseExtractor[Event]):
             unpack_metadata=unpack_metadata,
             skip_metadata_values=skip_metadata_values,
         )
+        if incremental:
+            extractor._set_incremental(
+                f"data_set={data_set_external_id}",
+                lambda watermark: client.events(
+                    data_set_external_ids=data_set_external_id, last_updated_time={"min": watermark}
+                ),
+            )
+        return extractor
 
     @classmethod
     def from_hierarchy(
@@ -65,12 +74,13 @@ class EventsExtractor(ClassicCDFBaseExtractor[Event]):
         limit: int | None = None,
         unpack_metadata: bool = True,
         skip_metadata_values: Set[str] | None = DEFAULT_SKIP_METADATA_VALUES,
+        incremental: bool = False,
     ):
         total = client.events.aggregate_count(
             filter=EventFilter(asset_subtree_ids=[{"externalId": root_asset_external_id}])
         )
 
-        return cls(
+        extractor = cls(
             client.events(asset_subtree_external_ids=[root_asset_external_id]),
             namespace,
             to_type,
@@ -79,6 +89,14 @@ class EventsExtractor(ClassicCDFBaseExtractor[Event]):
             unpack_metadata=unpack_metadata,
             skip_metadata_values=skip_metadata_values,
         )
+        if incremental:
+            extractor._set_incremental(
+                f"hierarchy={root_asset_external_id}",
+                lambda watermark: client.events(
+                    asset_subtree_external_ids=[root_asset_external_id], last_updated_time={"min": watermark}
+                ),
+            )
+        return extractor
 
     @classmethod
     def from_file(
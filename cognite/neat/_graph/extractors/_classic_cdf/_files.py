@@ -43,8 +43,9 @@ class FilesExtractor(ClassicCDFBaseExtractor[FileMetadata]):
         limit: int | None = None,
         unpack_metadata: bool = True,
         skip_metadata_values: Set[str] | None = DEFAULT_SKIP_METADATA_VALUES,
+        incremental: bool = False,
     ):
-        return cls(
+        extractor = cls(
             client.files(data_set_external_ids=data_set_external_id),
             namespace=namespace,
             to_type=to_type,
@@ -52,6 +53,14 @@ class FilesExtractor(ClassicCDFBaseExtractor[FileMetadata]):
             unpack_metadata=unpack_metadata,
             skip_metadata_values=skip_metadata_values,
         )
+        if incremental:
+            extractor._set_incremental(
+                f"data_set={data_set_external_id}",
+                lambda watermark: client.files(
+                    data_set_external_ids=data_set_external_id, last_updated_time={"min": watermark}
+                ),
+            )
+        return extractor
 
     @classmethod
     def from_hierarchy(
@@ -63,12 +72,13 @@ class FilesExtractor(ClassicCDFBaseExtractor[FileMetadata]):
         limit: int | None = None,
         unpack_metadata: bool = True,
         skip_metadata_values: Set[str] | None = DEFAULT_SKIP_METADATA_VALUES,
+        incremental: bool = False,
     ):
         total = client.files.aggregate(
             filter=FileMetadataFilter(asset_subtree_ids=[{"externalId": root_asset_external_id}])
         )[0].count
 
-        return cls(
+        extractor = cls(
             client.files(asset_subtree_external_ids=[root_asset_external_id]),
             namespace,
             to_type,
@@ -77,6 +87,14 @@ class FilesExtractor(ClassicCDFBaseExtractor[FileMetadata]):
             unpack_metadata=unpack_metadata,
             skip_metadata_values=skip_metadata_values,
         )
+        if incremental:
+            extractor._set_incremental(
+                f"hierarchy={root_asset_external_id}",
+                lambda watermark: client.files(
+                    asset_subtree_external_ids=[root_asset_external_id], last_updated_time={"min": watermark}
+                ),
+            )
+        return extractor
 
     @classmethod
     def from_file(
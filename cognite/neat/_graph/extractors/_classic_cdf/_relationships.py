@@ -70,8 +70,9 @@ class RelationshipsExtractor(ClassicCDFBaseExtractor[Relationship]):
         limit: int | None = None,
         unpack_metadata: bool = True,
         skip_metadata_values: Set[str] | None = DEFAULT_SKIP_METADATA_VALUES,
+        incremental: bool = False,
     ):
-        return cls(
+        extractor = cls(
             client.relationships(data_set_external_ids=data_set_external_id),
             namespace=namespace,
             to_type=to_type,
@@ -79,6 +80,14 @@ class RelationshipsExtractor(ClassicCDFBaseExtractor[Relationship]):
             unpack_metadata=unpack_metadata,
             skip_metadata_values=skip_metadata_values,
         )
+        if incremental:
+            extractor._set_incremental(
+                f"data_set={data_set_external_id}",
+                lambda watermark: client.relationships(
+                    data_set_external_ids=data_set_external_id, last_updated_time={"min": watermark}
+                ),
+            )
+        return extractor
 
     @classmethod
     def from_file(
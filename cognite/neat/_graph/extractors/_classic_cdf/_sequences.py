@@ -42,11 +42,12 @@ class SequencesExtractor(ClassicCDFBaseExtractor[Sequence]):
         limit: int | None = None,
         unpack_metadata: bool = True,
         skip_metadata_values: Set[str] | None = DEFAULT_SKIP_METADATA_VALUES,
+        incremental: bool = False,
     ):
         total = client.sequences.aggregate_count(
             filter=SequenceFilter(data_set_ids=[{"externalId": data_set_external_id}])
         )
-        return cls(
+        extractor = cls(
             client.sequences(data_set_external_ids=data_set_external_id),
             total=total,
             namespace=namespace,
@@ -55,6 +56,14 @@ class SequencesExtractor(ClassicCDFBaseExtractor[Sequence]):
             unpack_metadata=unpack_metadata,
             skip_metadata_values=skip_metadata_values,
         )
+        if incremental:
+            extractor._set_incremental(
+                f"data_set={data_set_external_id}",
+                lambda watermark: client.sequences(
+                    data_set_external_ids=data_set_external_id, last_updated_time={"min": watermark}
+                ),
+            )
+        return extractor
 
     @classmethod
     def from_hierarchy(
@@ -66,12 +75,13 @@ class SequencesExtractor(ClassicCDFBaseExtractor[Sequence]):
         limit: int | None = None,
         unpack_metadata: bool = True,
         skip_metadata_values: Set[str] | None = DEFAULT_SKIP_METADATA_VALUES,
+        incremental: bool = False,
     ):
         total = client.sequences.aggregate_count(
             filter=SequenceFilter(asset_subtree_ids=[{"externalId": root_asset_external_id}])
         )
 
-        return cls(
+        extractor = cls(
             client.sequences(asset_subtree_external_ids=[root_asset_external_id]),
             namespace,
             to_type,
@@ -80,6 +90,14 @@ class SequencesExtractor(ClassicCDFBaseExtractor[Sequence]):
             unpack_metadata=unpack_metadata,
             skip_metadata_values=skip_metadata_values,
         )
+        if incremental:
+            extractor._set_incremental(
+                f"hierarchy={root_asset_external_id}",
+                lambda watermark: client.sequences(
+                    asset_subtree_external_ids=[root_asset_external_id], last_updated_time={"min": watermark}
+                ),
+            )
+        return extractor
 
     @classmethod
     def from_file(
@@ -43,12 +43,13 @@ class TimeSeriesExtractor(ClassicCDFBaseExtractor[TimeSeries]):
         limit: int | None = None,
         unpack_metadata: bool = True,
         skip_metadata_values: Set[str] | None = DEFAULT_SKIP_METADATA_VALUES,
+        incremental: bool = False,
     ):
         total = client.time_series.aggregate_count(
             filter=TimeSeriesFilter(data_set_ids=[{"externalId": data_set_external_id}])
         )
 
-        return cls(
+        extractor = cls(
             client.time_series(data_set_external_ids=data_set_external_id),
             total=total,
             namespace=namespace,
@@ -57,6 +58,14 @@ class TimeSeriesExtractor(ClassicCDFBaseExtractor[TimeSeries]):
             unpack_metadata=unpack_metadata,
             skip_metadata_values=skip_metadata_values,
         )
+        if incremental:
+            extractor._set_incremental(
+                f"data_set={data_set_external_id}",
+                lambda watermark: client.time_series(
+                    data_set_external_ids=data_set_external_id, last_updated_time={"min": watermark}
+                ),
+            )
+        return extractor
 
     @classmethod
     def from_hierarchy(
@@ -68,12 +77,13 @@ class TimeSeriesExtractor(ClassicCDFBaseExtractor[TimeSeries]):
         limit: int | None = None,
         unpack_metadata: bool = True,
         skip_metadata_values: Set[str] | None = DEFAULT_SKIP_METADATA_VALUES,
+        incremental: bool = False,
     ):
         total = client.time_series.aggregate_count(
             filter=TimeSeriesFilter(asset_subtree_ids=[{"externalId": root_asset_external_id}])
         )
 
-        return cls(
+        extractor = cls(
             client.time_series(asset_external_ids=[root_asset_external_id]),
             namespace,
             to_type,
@@ -82,6 +92,14 @@ class TimeSeriesExtractor(ClassicCDFBaseExtractor[TimeSeries]):
             unpack_metadata=unpack_metadata,
             skip_metadata_values=skip_metadata_values,
         )
+        if incremental:
+            extractor._set_incremental(
+                f"hierarchy={root_asset_external_id}",
+                lambda watermark: client.time_series(
+                    asset_external_ids=[root_asset_external_id], last_updated_time={"min": watermark}
+                ),
+            )
+        return extractor
 
     @classmethod
     def from_file(
@@ -3,10 +3,9 @@ from pathlib import Path
 from typing import cast
 
 from rdflib import URIRef
-from rdflib.util import guess_format
 
 from cognite.neat._constants import DEFAULT_BASE_URI
-from cognite.neat._graph._shared import rdflib_to_mime_types
+from cognite.neat._graph._shared import rdf_file_format, rdflib_to_mime_types
 from cognite.neat._graph.extractors._base import BaseExtractor
 from cognite.neat._graph.models import Triple
 from cognite.neat._issues._base import IssueList
@@ -16,10 +15,15 @@ from cognite.neat._issues.errors import FileNotFoundNeatError, FileTypeUnexpecte
 class RdfFileExtractor(BaseExtractor):
     """Extract data from RDF files into Neat.
 
+    The file can be gzip or bz2 compressed, for example `graph.ttl.gz`. The path can also be a directory,
+    in which case all the RDF files in the directory are extracted.
+
     Args:
-        filepath (Path): The path to the RDF file.
-        mime_type (MIMETypes, optional): The MIME type of the RDF file. Defaults to "application/rdf+xml".
+        filepath (Path): The path to the RDF file, or to a directory of RDF files.
         base_uri (URIRef, optional): The base URI to use. Defaults to None.
+        max_workers (int, optional): The maximal number of processes used to parse the files of a directory
+            concurrently. Defaults to 1, which parses the files one by one. Not used for Oxigraph stores,
+            which parse the files with their own parser.
     """
 
     def __init__(
@@ -27,21 +31,36 @@ class RdfFileExtractor(BaseExtractor):
         filepath: Path,
         base_uri: URIRef = DEFAULT_BASE_URI,
         issue_list: IssueList | None = None,
+        max_workers: int = 1,
     ):
+        if max_workers < 1:
+            raise ValueError(f"max_workers must be a positive integer, got {max_workers}")
         self.issue_list = issue_list or IssueList(title=f"{filepath.name}")
 
         self.filepath = filepath
-        self.mime_type = rdflib_to_mime_types(cast(str, guess_format(str(self.filepath))))
+        self.max_workers = max_workers
         self.base_uri = base_uri
+        self.mime_type: str | None = None
+        self.compression: str | None = None
+        if self.filepath.is_dir():
+            has_rdf_files = any(
+                rdflib_to_mime_types(cast(str, rdf_file_format(file)[0]))
+                for file in self.filepath.iterdir()
+                if file.is_file()
+            )
+        else:
+            rdflib_format, self.compression = rdf_file_format(self.filepath)
+            self.mime_type = rdflib_to_mime_types(cast(str, rdflib_format))
+            has_rdf_files = self.mime_type is not None
 
         if not self.filepath.exists():
             self.issue_list.append(FileNotFoundNeatError(self.filepath))
 
-        if not self.mime_type:
+        if not has_rdf_files:
             self.issue_list.append(
                 FileTypeUnexpectedError(
                     self.filepath,
-                    frozenset([".rdf", ".ttl", ".nt", ".n3", ".owl", ".nq", ".trig"]),
+                    frozenset([".rdf", ".ttl", ".nt", ".n3", ".owl", ".nq", ".trig", ".gz", ".bz2"]),
                 )
             )
 
@@ -1,5 +1,7 @@
 from abc import ABC, abstractmethod
-from collections.abc import Hashable, Iterable
+from collections import deque
+from collections.abc import Hashable, Iterable, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 from typing import ClassVar, Generic, TypeVar
 
@@ -49,13 +51,26 @@ class CDFLoader(BaseLoader[T_Output]):
     _UPLOAD_BATCH_SIZE: ClassVar[int] = 1000
 
     def load_into_cdf(
-        self, client: CogniteClient, dry_run: bool = False, check_client: bool = True
+        self, client: CogniteClient, dry_run: bool = False, check_client: bool = True, max_workers: int = 1
     ) -> UploadResultList:
-        return UploadResultList(self.load_into_cdf_iterable(client, dry_run, check_client))
+        return UploadResultList(self.load_into_cdf_iterable(client, dry_run, check_client, max_workers))
 
     def load_into_cdf_iterable(
-        self, client: CogniteClient, dry_run: bool = False, check_client: bool = True
+        self, client: CogniteClient, dry_run: bool = False, check_client: bool = True, max_workers: int = 1
     ) -> Iterable[UploadResult]:
+        """Loads the graph into CDF in batches.
+
+        Args:
+            client: The Cognite client to use.
+            dry_run: Whether to do a dry run, by default False.
+            check_client: Whether to check that the client has the required capabilities, by default True.
+            max_workers: The maximal number of batches uploaded at the same time, by default 1. With more than one
+                worker, the next batches are read from the graph while the previous ones are uploading. The upload
+                results are still yielded in the order of the batches, and all batches of a class are uploaded
+                before the first batch of the next class.
+        """
+        if max_workers < 1:
+            raise ValueError(f"max_workers must be a positive integer, got {max_workers}")
         if check_client:
             missing_capabilities = client.iam.verify_capabilities(self._get_required_capabilities())
             if missing_capabilities:
@@ -66,6 +81,39 @@ class CDFLoader(BaseLoader[T_Output]):
                 yield upload_result
                 return
 
+        if max_workers == 1:
+            for items, issues, _ in self._create_batches():
+                yield from self._upload_to_cdf(client, items, dry_run, issues)
+            return
+
+        uploading: deque[tuple[Future[list[UploadResult]], list[T_Output]]] = deque()
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="neat-upload") as executor:
+            try:
+                for items, issues, is_end_of_class in self._create_batches():
+                    if self._depends_on(items, [batch for _, batch in uploading]):
+                        while uploading:
+                            yield from uploading.popleft()[0].result()
+                    while len(uploading) >= max_workers:
+                        yield from uploading.popleft()[0].result()
+                    uploading.append(
+                        (executor.submit(self._upload_batch_to_cdf, client, items, dry_run, issues), items)
+                    )
+                    # The next class can depend on this one, for example, assets on their parents.
+                    while uploading and (is_end_of_class or uploading[0][0].done()):
+                        yield from uploading.popleft()[0].result()
+                while uploading:
+                    yield from uploading.popleft()[0].result()
+            finally:
+                for future, _ in uploading:
+                    future.cancel()
+
+    def _create_batches(self) -> Iterable[tuple[list[T_Output], IssueList, bool]]:
+        """Reads the items from the graph and groups them into batches for upload.
+
+        Yields:
+            The items of the batch, the issues found while reading them, and whether the batch is the
+            last one of a class.
+        """
         issues = IssueList()
         items: list[T_Output] = []
         for result in self._load(stop_on_exception=False):
@@ -78,11 +126,24 @@ class CDFLoader(BaseLoader[T_Output]):
                 items.append(result)  # type: ignore[arg-type]
 
             if len(items) >= self._UPLOAD_BATCH_SIZE or result is _END_OF_CLASS:
-                yield from self._upload_to_cdf(client, items, dry_run, issues)
+                yield items, issues, result is _END_OF_CLASS
                 issues = IssueList()
                 items = []
         if items:
-            yield from self._upload_to_cdf(client, items, dry_run, issues)
+            yield items, issues, False
+
+    def _upload_batch_to_cdf(
+        self, client: CogniteClient, items: list[T_Output], dry_run: bool, read_issues: NeatIssueList
+    ) -> list[UploadResult]:
+        return list(self._upload_to_cdf(client, items, dry_run, read_issues))
+
+    def _depends_on(self, items: list[T_Output], uploading: Sequence[list[T_Output]]) -> bool:
+        """Whether the batch has to wait for the batches that are currently uploading.
+
+        This is only used when uploading with several workers. By default, the batches of a class
+        are independent of each other.
+        """
+        return False
 
     @abstractmethod
     def _get_required_capabilities(self) -> list[Capability]:
@@ -278,6 +278,16 @@ class AssetLoader(CDFLoader[AssetWrite]):
             ),
         ]
 
+    def _depends_on(self, items: list[AssetWrite], uploading: Sequence[list[AssetWrite]]) -> bool:
+        """Assets have to wait for the upload of their parents, which can be in a previous batch of the same class."""
+        parent_ids = {item.parent_external_id for item in items if isinstance(item, AssetWrite)}
+        parent_ids.discard(None)
+        if not parent_ids:
+            return False
+        return any(
+            isinstance(item, AssetWrite) and item.external_id in parent_ids for batch in uploading for item in batch
+        )
+
     def _upload_to_cdf(
         self,
         client: CogniteClient,
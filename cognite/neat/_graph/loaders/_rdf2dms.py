@@ -1,7 +1,9 @@
+import copy
 import json
-from collections.abc import Iterable, Sequence
+from collections import OrderedDict
+from collections.abc import Callable, Iterable, Sequence
 from pathlib import Path
-from typing import Any, get_args
+from typing import Any, ClassVar, TypeAlias, get_args
 
 import yaml
 from cognite.client import CogniteClient
@@ -12,7 +14,8 @@ from cognite.client.data_classes.data_modeling.data_types import ListablePropert
 from cognite.client.data_classes.data_modeling.ids import InstanceId
 from cognite.client.data_classes.data_modeling.views import SingleEdgeConnection
 from cognite.client.exceptions import CogniteAPIError
-from pydantic import BaseModel, ValidationInfo, create_model, field_validator
+from pydantic import BaseModel, TypeAdapter, ValidationInfo, create_model, field_validator
+from pydantic_core import PydanticUndefined
 from rdflib import RDF
 
 from cognite.neat._graph._tracking import LogTracker, Tracker
@@ -33,6 +36,10 @@ from cognite.neat._utils.upload import UploadResult
 
 from ._base import CDFLoader
 
+_ValidationClasses: TypeAlias = tuple[
+    type[BaseModel], dict[str, tuple[str, dm.EdgeConnection]], NeatIssueList, "_PropertiesParser"
+]
+
 
 class DMSLoader(CDFLoader[dm.InstanceApply]):
     """Loads Instances to Cognite Data Fusion Data Model Service from NeatGraph.
@@ -46,6 +53,11 @@ class DMSLoader(CDFLoader[dm.InstanceApply]):
         tracker (type[Tracker] | None): The tracker to use. Defaults to None.
     """
 
+    # The validation classes are expensive to create, so the most recently used are reused across loads of
+    # the same view. They are keyed by the properties of the view, such that an updated view gets new classes.
+    _validation_classes_by_key: ClassVar[OrderedDict[tuple[dm.ViewId, str, str], _ValidationClasses]] = OrderedDict()
+    _max_validation_classes: ClassVar[int] = 128
+
     def __init__(
         self,
         graph_store: NeatGraphStore,
@@ -110,14 +122,14 @@ class DMSLoader(CDFLoader[dm.InstanceApply]):
         for view in self.data_model.views:
             view_id = view.as_id()
             tracker.start(repr(view_id))
-            pydantic_cls, edge_by_type, issues = self._create_validation_classes(view)  # type: ignore[var-annotated]
+            pydantic_cls, edge_by_type, issues, properties_parser = self._get_validation_classes(view)
             yield from issues
             tracker.issue(issues)
             class_name = self.class_by_view_id.get(view.as_id(), view.external_id)
 
             for identifier, properties in self.graph_store.read(class_name):
                 try:
-                    yield self._create_node(identifier, properties, pydantic_cls, view_id)
+                    yield self._create_node(identifier, properties, pydantic_cls, view_id, properties_parser)
                 except ValueError as e:
                     error = ResourceCreationError(identifier, "node", error=str(e))
                     tracker.issue(error)
@@ -147,9 +159,25 @@ class DMSLoader(CDFLoader[dm.InstanceApply]):
             else:
                 yaml.safe_dump(dumped, f, sort_keys=False)
 
-    def _create_validation_classes(
-        self, view: dm.View
-    ) -> tuple[type[BaseModel], dict[str, tuple[str, dm.EdgeConnection]], NeatIssueList]:
+    def _get_validation_classes(self, view: dm.View) -> _ValidationClasses:
+        """Returns the validation classes of the view, creating them if they are not already cached.
+
+        The cache keeps the validation classes of the most recently used views, up to _max_validation_classes.
+        """
+        properties = json.dumps(
+            {prop_name: prop.dump() for prop_name, prop in view.properties.items()}, sort_keys=True, default=str
+        )
+        key = (view.as_id(), properties, self.instance_space)
+        if (validation_classes := self._validation_classes_by_key.get(key)) is not None:
+            self._validation_classes_by_key.move_to_end(key)
+            return validation_classes
+        validation_classes = self._create_validation_classes(view)
+        self._validation_classes_by_key[key] = validation_classes
+        if len(self._validation_classes_by_key) > self._max_validation_classes:
+            self._validation_classes_by_key.popitem(last=False)
+        return validation_classes
+
+    def _create_validation_classes(self, view: dm.View) -> _ValidationClasses:
         issues = IssueList()
         field_definitions: dict[str, tuple[type, Any]] = {}
         edge_by_property: dict[str, tuple[str, dm.EdgeConnection]] = {}
@@ -214,13 +242,15 @@ class DMSLoader(CDFLoader[dm.InstanceApply]):
         validators["parse_list"] = field_validator("*", mode="before")(parse_list)  # type: ignore[assignment, arg-type]
 
         if direct_relation_by_property:
+            # Not referring to self, as the validation classes are cached on the class and outlive the loader.
+            instance_space = self.instance_space
 
             def parse_direct_relation(cls, value: list, info: ValidationInfo) -> dict | list[dict]:
                 # We validate above that we only get one value for single direct relations.
                 if list.__name__ in _get_field_value_types(cls, info):
-                    return [{"space": self.instance_space, "externalId": v} for v in value]
+                    return [{"space": instance_space, "externalId": v} for v in value]
                 elif value:
-                    return {"space": self.instance_space, "externalId": value[0]}
+                    return {"space": instance_space, "externalId": value[0]}
                 return {}
 
             validators["parse_direct_relation"] = field_validator(*direct_relation_by_property.keys(), mode="before")(  # type: ignore[assignment]
@@ -228,7 +258,10 @@ class DMSLoader(CDFLoader[dm.InstanceApply]):
             )
 
         pydantic_cls = create_model(view.external_id, __validators__=validators, **field_definitions)  # type: ignore[arg-type, call-overload]
-        return pydantic_cls, edge_by_property, issues
+        properties_parser = _PropertiesParser(
+            pydantic_cls, set(json_fields), set(direct_relation_by_property), self.instance_space
+        )
+        return pydantic_cls, edge_by_property, issues, properties_parser
 
     def _create_node(
         self,
@@ -236,15 +269,17 @@ class DMSLoader(CDFLoader[dm.InstanceApply]):
         properties: dict[str | InstanceType, list[str]],
         pydantic_cls: type[BaseModel],
         view_id: dm.ViewId,
+        properties_parser: "_PropertiesParser | None" = None,
     ) -> dm.InstanceApply:
         type_ = properties.pop(RDF.type, [None])[0]
-        created = pydantic_cls.model_validate(properties)
+        if properties_parser is None or (node_properties := properties_parser.parse(properties)) is None:
+            node_properties = dict(pydantic_cls.model_validate(properties).model_dump().items())
 
         return dm.NodeApply(
             space=self.instance_space,
             external_id=identifier,
             type=dm.DirectRelationReference(view_id.space, type_) if type_ is not None else None,
-            sources=[dm.NodeOrEdgeData(source=view_id, properties=dict(created.model_dump().items()))],
+            sources=[dm.NodeOrEdgeData(source=view_id, properties=node_properties)],
         )
 
     def _create_edges(
@@ -329,3 +364,100 @@ class DMSLoader(CDFLoader[dm.InstanceApply]):
 
 def _get_field_value_types(cls, info):
     return [type_.__name__ for type_ in get_args(cls.model_fields[info.field_name].annotation)]
+
+
+class _CannotParse(Exception):
+    """Raised when a property value cannot be parsed without the pydantic validation class."""
+
+
+class _PropertiesParser:
+    """Parses the properties of an instance into the properties of a node, without creating a pydantic model.
+
+    For every field of the validation class of a view, a parse function is compiled that does the same as the
+    validators of the field: direct relations, single values given as lists, JSON strings, and finally the type
+    coercion of pydantic. The result is the same as validating and dumping the pydantic model. If a value
+    cannot be parsed, for example, because it is missing or invalid, parse returns None such that the caller
+    can fall back to the pydantic model, which gives the same result and error messages.
+
+    Args:
+        pydantic_cls: The validation class of the view.
+        json_fields: The fields with JSON values.
+        direct_relation_fields: The fields with direct relations.
+        instance_space: The space of the direct relations.
+    """
+
+    def __init__(
+        self,
+        pydantic_cls: type[BaseModel],
+        json_fields: set[str],
+        direct_relation_fields: set[str],
+        instance_space: str,
+    ) -> None:
+        self._required: list[str] = []
+        self._defaults: dict[str, Any] = {}
+        self._parse_by_field: dict[str, Callable[[Any], Any]] = {}
+        for field_name, field in pydantic_cls.model_fields.items():
+            if field.is_required():
+                self._required.append(field_name)
+            elif field.default is not PydanticUndefined:
+                self._defaults[field_name] = field.default
+            self._parse_by_field[field_name] = self._create_parse_function(
+                field.annotation,
+                is_json=field_name in json_fields,
+                is_direct_relation=field_name in direct_relation_fields,
+                instance_space=instance_space,
+            )
+
+    @staticmethod
+    def _create_parse_function(
+        annotation: Any, is_json: bool, is_direct_relation: bool, instance_space: str
+    ) -> Callable[[Any], Any]:
+        # Same check as the validators of the pydantic class, which only see nullable lists as lists.
+        is_list = list.__name__ in [type_.__name__ for type_ in get_args(annotation)]
+        is_text = annotation is str or annotation == str | None
+        # Calling the compiled pydantic-core validator directly avoids the overhead of the TypeAdapter wrapper.
+        validate = TypeAdapter(annotation).validator.validate_python
+
+        def parse(value: Any) -> Any:
+            if is_direct_relation:
+                if is_list:
+                    value = [{"space": instance_space, "externalId": v} for v in value]
+                elif value:
+                    value = {"space": instance_space, "externalId": value[0]}
+                else:
+                    value = {}
+            if isinstance(value, list) and not is_list:
+                if len(value) != 1:
+                    raise _CannotParse()
+                value = value[0]
+            if is_json and not isinstance(value, dict):
+                if not isinstance(value, str):
+                    raise _CannotParse()
+                try:
+                    value = json.loads(value)
+                except json.JSONDecodeError as error:
+                    raise _CannotParse() from error
+            if is_text and isinstance(value, str):
+                # Pydantic converts subclasses of str, like rdflib Literals, to plain strings.
+                return str.__str__(value)
+            try:
+                return validate(value)
+            except ValueError as error:
+                raise _CannotParse() from error
+
+        return parse
+
+    def parse(self, properties: dict[str | InstanceType, list[str]]) -> dict[str, Any] | None:
+        """Parses the properties, returns None if they have to be validated by the pydantic class."""
+        if any(field_name not in properties for field_name in self._required):
+            return None
+        parsed: dict[str, Any] = {}
+        try:
+            for field_name, parse in self._parse_by_field.items():
+                if field_name in properties:
+                    parsed[field_name] = parse(properties[field_name])
+                elif field_name in self._defaults:
+                    parsed[field_name] = copy.deepcopy(self._defaults[field_name])
+        except _CannotParse:
+            return None
+        return parsed
@@ -1,3 +1,5 @@
 from ._base import Queries
+from ._cache import QueryCache, QueryCacheInfo
+from ._compiled import CompiledQuery, compile_query
 
-__all__ = ["Queries"]
+__all__ = ["CompiledQuery", "Queries", "QueryCache", "QueryCacheInfo", "compile_query"]
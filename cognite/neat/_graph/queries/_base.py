@@ -1,45 +1,165 @@
 import warnings
 from collections import defaultdict
-from collections.abc import Iterable
-from typing import Literal, cast, overload
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
+from itertools import groupby
+from operator import itemgetter
+from typing import TYPE_CHECKING, Literal, cast, overload
 
-from rdflib import RDF, Graph, Namespace, URIRef
+from rdflib import RDF, BNode, ConjunctiveGraph, Graph, Namespace, URIRef
 from rdflib import Literal as RdfLiteral
+from rdflib.graph import ReadOnlyGraphAggregate
 from rdflib.query import ResultRow
+from rdflib.term import Node
 
 from cognite.neat._constants import UNKNOWN_TYPE
 from cognite.neat._graph.models import InstanceType
+from cognite.neat._issues.errors import NeatValueError
 from cognite.neat._rules._constants import EntityTypes
 from cognite.neat._rules.models.entities import ClassEntity
 from cognite.neat._rules.models.information import InformationRules
 from cognite.neat._utils.rdf_ import remove_namespace_from_uri
 
+from ._cache import QueryCache
+from ._compiled import CompiledQuery, compile_query
 from ._construct import build_construct_query
 
+if TYPE_CHECKING:
+    from cognite.neat._store._statistics import GraphStatistics
 
-class Queries:
-    """Helper class for storing standard queries for the graph store."""
 
-    def __init__(self, graph: Graph, rules: InformationRules | None = None):
+_TRIPLES_OF_INSTANCE = compile_query(
+    "SELECT ?instance ?prop ?value WHERE { ?instance ?prop ?value . } ORDER BY ?prop ?value"
+)
+
+_BLANK_NODE_INSTANCES_OF_CLASS = compile_query(
+    "SELECT DISTINCT ?subject WHERE { ?subject a ?class . FILTER(isBlank(?subject)) }"
+)
+
+_TRIPLES_OF_BLANK_NODE_INSTANCES_OF_CLASS = compile_query(
+    "SELECT ?instance ?prop ?value WHERE { ?instance a ?class . FILTER(isBlank(?instance)) "
+    "?instance ?prop ?value . } ORDER BY ?instance ?prop ?value"
+)
+
+_MULTI_VALUE_TYPE_PROPERTY = compile_query(
+    """SELECT ?sourceType ?property
+              (GROUP_CONCAT(DISTINCT STR(?valueType); SEPARATOR=",") AS ?valueTypes)
+
+       WHERE {
+           ?s ?property ?o .
+           ?s a ?sourceType .
+           OPTIONAL { ?o a ?type }
+
+           # Key part to determine value type: either object, data or unknown
+           BIND(   IF(isLiteral(?o),DATATYPE(?o),
+                   IF(BOUND(?type), ?type,
+                                   ?unknownType)) AS ?valueType)
+       }
+
+       GROUP BY ?sourceType ?property
+       HAVING (COUNT(DISTINCT ?valueType) > 1)"""
+)
+
+
+class Queries:
+    """Helper class for storing standard queries for the graph store.
+
+    Args:
+        graph: The graph to query.
+        rules: The rules of the graph store, if any.
+        statistics: Statistics index of the graph store. If given, the summary queries read from the index
+            instead of scanning the graph.
+        cache: Cache of query results.
+        generation: Returns the generation of the graph, which must change with every change of the graph.
+            The cached results are keyed by the generation, so results are only cached when it is given.
+    """
+
+    def __init__(
+        self,
+        graph: Graph,
+        rules: InformationRules | None = None,
+        statistics: "GraphStatistics | None" = None,
+        cache: QueryCache | None = None,
+        generation: Callable[[], int] | None = None,
+    ):
         self.graph = graph
         self.rules = rules
+        self.statistics = statistics
+        self.cache = cache
+        self.generation = generation
+
+    def scope(self, named_graphs: Sequence[URIRef]) -> "Queries":
+        """Returns the queries limited to the given named graphs of the graph store.
+
+        Args:
+            named_graphs: URIs of the named graphs to query.
+        """
+        if not isinstance(self.graph, ConjunctiveGraph):
+            raise NeatValueError("Cannot scope queries, the graph store is not partitioned into named graphs")
+        if not named_graphs:
+            raise NeatValueError("Cannot scope queries to an empty list of named graphs")
+        graphs = [Graph(store=self.graph.store, identifier=named_graph) for named_graph in named_graphs]
+        # A single named graph is queried directly by the store, while a union of named graphs is
+        # evaluated by rdflib on top of the store.
+        return Queries(graphs[0] if len(graphs) == 1 else ReadOnlyGraphAggregate(graphs), self.rules)
+
+    def query(
+        self,
+        query: str | CompiledQuery,
+        use_cache: bool = True,
+        bindings: Mapping[str, Node] | None = None,
+    ) -> list[ResultRow] | bool:
+        """Executes a SELECT or ASK query against the graph.
+
+        Args:
+            query: The SPARQL query, either as text or compiled.
+            use_cache: Whether the result can be read from and written to the query cache. Set to False for
+                ad-hoc queries that are not expected to be repeated.
+            bindings: Values of the variables of a compiled query, by variable name.
+
+        Returns:
+            The rows of a SELECT query, or the answer of an ASK query.
+        """
+        if not use_cache or self.cache is None or self.generation is None:
+            return self._execute(query, bindings)
+        text = query.text if isinstance(query, CompiledQuery) else query
+        key = (text, tuple((bindings or {}).items()), self.generation())
+        if (result := self.cache.get(key)) is None:
+            result = self._execute(query, bindings)
+            self.cache.put(key, result)
+        return result
+
+    def _execute(self, query: str | CompiledQuery, bindings: Mapping[str, Node] | None) -> list[ResultRow] | bool:
+        if isinstance(query, CompiledQuery):
+            result = query.run(self.graph, **(bindings or {}))
+        else:
+            result = self.graph.query(query)
+        if result.type == "ASK":
+            return bool(result.askAnswer)
+        return cast(list[ResultRow], list(result))
 
     def summarize_instances(self) -> list[tuple]:
         """Summarize instances in the graph store by class and count"""
-
-        query_statement = """ SELECT ?class (COUNT(?instance) AS ?instanceCount)
+        if self.statistics is not None:
+            return [
+                (remove_namespace_from_uri(class_uri), count)
+                for class_uri, count in self.statistics.instances_by_type.most_common()
+            ]
+
+        query_statement = compile_query(
+            """ SELECT ?class (COUNT(?instance) AS ?instanceCount)
                              WHERE {
                              ?instance a ?class .
                              }
                              GROUP BY ?class
                              ORDER BY DESC(?instanceCount) """
+        )
 
         return [
             (
                 remove_namespace_from_uri(cast(URIRef, cast(tuple, res)[0])),
                 cast(RdfLiteral, cast(tuple, res)[1]).value,
             )
-            for res in list(self.graph.query(query_statement))
+            for res in list(query_statement.run(self.graph))
         ]
 
     def list_instances_ids_of_class(self, class_uri: URIRef, limit: int = -1) -> list[URIRef]:
@@ -51,11 +171,54 @@ class Queries:
 
         Returns:
             List of class instance URIs
+
+        See `iterate_instances_ids_of_class` for reading the instances of a large class page by page.
+        """
+        query = compile_query(
+            "SELECT DISTINCT ?subject WHERE { ?subject a ?class . }" + ("" if limit == -1 else f" LIMIT {int(limit)}")
+        )
+        return [cast(tuple, res)[0] for res in cast(list[ResultRow], self.query(query, bindings={"class": class_uri}))]
+
+    def iterate_instances_ids_of_class(self, class_uri: URIRef, page_size: int = 10_000) -> Iterator[URIRef]:
+        """Iterates over the instance ids of a given class, page by page
+
+        The ids are fetched in pages ordered by id, where every page starts after the last id of the previous
+        page. Thus, the memory used is bounded by the page size regardless of the number of instances, and
+        no page is skipped over as with OFFSET paging. Blank nodes cannot be compared as keys, so instances
+        identified by blank nodes are fetched with one query after the pages.
+
+        Args:
+            class_uri: Class for which instances are to be found
+            page_size: Number of instance ids to fetch per query, by default 10_000
+
+        Returns:
+            Iterator of class instance URIs, ordered by URI, followed by the blank node instances
         """
-        query_statement = "SELECT DISTINCT ?subject WHERE { ?subject a <class> .} LIMIT X".replace(
-            "class", class_uri
-        ).replace("LIMIT X", "" if limit == -1 else f"LIMIT {limit}")
-        return [cast(tuple, res)[0] for res in list(self.graph.query(query_statement))]
+        if page_size < 1:
+            raise ValueError(f"Page size must be a positive integer, got {page_size}")
+        first_page, next_page = (
+            compile_query(
+                f"SELECT DISTINCT ?subject WHERE {{ ?subject a ?class . FILTER(isIRI(?subject){after}) }} "
+                f"ORDER BY ?subject LIMIT {int(page_size)}"
+            )
+            for after in ["", self._AFTER_LAST.format(variable="subject")]
+        )
+        bindings: dict[str, Node] = {"class": class_uri}
+        query = first_page
+        while True:
+            page = cast(list[ResultRow], self.query(query, use_cache=False, bindings=bindings))
+            for row in page:
+                yield cast(URIRef, row[0])
+            if len(page) < page_size:
+                break
+            query, bindings["last"] = next_page, RdfLiteral(str(page[-1][0]))
+
+        blank_nodes = self.query(_BLANK_NODE_INSTANCES_OF_CLASS, use_cache=False, bindings={"class": class_uri})
+        for row in cast(list[ResultRow], blank_nodes):
+            yield cast(URIRef, row[0])
+
+    # IRIs cannot be compared with > in SPARQL, so the keyset is compared as string
+    _AFTER_LAST = " && STR(?{variable}) > ?last"
 
     def list_instances_of_type(self, class_uri: URIRef) -> list[ResultRow]:
         """Get all triples for instances of a given class
@@ -66,13 +229,65 @@ class Queries:
         Returns:
             List of triples for instances of the given class
         """
-        query = (
-            f"SELECT ?instance ?prop ?value "
-            f"WHERE {{ ?instance rdf:type <{class_uri}> . ?instance ?prop ?value . }} order by ?instance "
+        query = compile_query(
+            "SELECT ?instance ?prop ?value WHERE { ?instance a ?class . ?instance ?prop ?value . } ORDER BY ?instance"
         )
 
         # Select queries gives an iterable of result rows
-        return cast(list[ResultRow], list(self.graph.query(query)))
+        return list(cast(list[ResultRow], self.query(query, bindings={"class": class_uri})))
+
+    def iterate_instances_of_type(self, class_uri: URIRef, page_size: int = 10_000) -> Iterator[ResultRow]:
+        """Iterates over the triples of the instances of a given class, page by page
+
+        The triples are fetched in pages ordered by instance, where every page starts after the last instance
+        completed by the previous page, so the memory used is bounded by the page size. All triples of an
+        instance are consecutive. Blank nodes cannot be compared as keys, so the triples of instances
+        identified by blank nodes are fetched with one query after the pages.
+
+        Args:
+            class_uri: Class for which instances are to be found
+            page_size: Number of triples to fetch per query, by default 10_000
+
+        Returns:
+            Iterator of instance, property and value rows, ordered by instance, followed by the rows of the
+            blank node instances
+        """
+        if page_size < 1:
+            raise ValueError(f"Page size must be a positive integer, got {page_size}")
+        first_page, next_page = (
+            compile_query(
+                f"SELECT ?instance ?prop ?value WHERE {{ ?instance a ?class . FILTER(isIRI(?instance){after}) "
+                f"?instance ?prop ?value . }} ORDER BY ?instance ?prop ?value LIMIT {int(page_size)}"
+            )
+            for after in ["", self._AFTER_LAST.format(variable="instance")]
+        )
+        bindings: dict[str, Node] = {"class": class_uri}
+        query = first_page
+        while True:
+            page = cast(list[ResultRow], self.query(query, use_cache=False, bindings=bindings))
+            if len(page) < page_size:
+                yield from page
+                break
+            # The triples of the last instance of a full page can continue on the next page,
+            # so the next page starts with this instance.
+            last_instance = cast(URIRef, page[-1][0])
+            complete = [row for row in page if row[0] != last_instance]
+            if complete:
+                yield from complete
+                bindings["last"] = RdfLiteral(str(complete[-1][0]))
+            else:
+                # The instance has more triples than fit in a page
+                yield from cast(
+                    list[ResultRow],
+                    self.query(_TRIPLES_OF_INSTANCE, use_cache=False, bindings={"instance": last_instance}),
+                )
+                bindings["last"] = RdfLiteral(str(last_instance))
+            query = next_page
+
+        yield from cast(
+            list[ResultRow],
+            self.query(_TRIPLES_OF_BLANK_NODE_INSTANCES_OF_CLASS, use_cache=False, bindings={"class": class_uri}),
+        )
 
     def triples_of_type_instances(self, rdf_type: str | URIRef) -> list[tuple[str, str, str]]:
         """Get all triples of a given type.
@@ -90,13 +305,11 @@ class Queries:
             )
             return []
 
-        query = (
-            "SELECT ?instance ?prop ?value "
-            f"WHERE {{ ?instance a <{rdf_uri}> . ?instance ?prop ?value . }} "
-            "order by ?instance"
+        query = compile_query(
+            "SELECT ?instance ?prop ?value WHERE { ?instance a ?class . ?instance ?prop ?value . } ORDER BY ?instance"
         )
 
-        result = self.graph.query(query)
+        result = cast(list[ResultRow], self.query(query, bindings={"class": rdf_uri}))
 
         # We cannot include the RDF.type in case there is a neat:type property
         return [remove_namespace_from_uri(list(triple)) for triple in result if triple[1] != RDF.type]  # type: ignore[misc, index, arg-type]
@@ -110,8 +323,10 @@ class Queries:
         Returns:
             True if property exists, False otherwise
         """
-        query = f"SELECT DISTINCT ?t WHERE {{ ?s <{property_uri}> ?o ; a ?t}} Limit 1"
-        return cast(list[URIRef], [t[0] for t in self.graph.query(query)])  # type: ignore[index]
+        query = compile_query("SELECT DISTINCT ?t WHERE { ?s ?property ?o ; a ?t } LIMIT 1")
+        return [
+            cast(URIRef, t[0]) for t in cast(list[ResultRow], self.query(query, bindings={"property": property_uri}))
+        ]
 
     def has_namespace(self, namespace: Namespace) -> bool:
         """Check if a namespace exists in the graph store
@@ -122,8 +337,8 @@ class Queries:
         Returns:
             True if namespace exists, False otherwise
         """
-        query = f"ASK WHERE {{ ?s ?p ?o . FILTER(STRSTARTS(STR(?p), STR(<{namespace}>))) }}"
-        return bool(self.graph.query(query))
+        query = compile_query("ASK WHERE { ?s ?p ?o . FILTER(STRSTARTS(STR(?p), ?namespace)) }")
+        return bool(self.query(query, bindings={"namespace": RdfLiteral(str(namespace))}))
 
     def has_type(self, type_: URIRef) -> bool:
         """Check if a type exists in the graph store
@@ -134,8 +349,8 @@ class Queries:
         Returns:
             True if type exists, False otherwise
         """
-        query = f"ASK WHERE {{ ?s a <{type_}> }}"
-        return bool(self.graph.query(query))
+        query = compile_query("ASK WHERE { ?s a ?type }")
+        return bool(self.query(query, bindings={"type": type_}))
 
     def describe(
         self,
@@ -144,7 +359,7 @@ class Queries:
         property_renaming_config: dict | None = None,
         property_types: dict[str, EntityTypes] | None = None,
     ) -> tuple[str, dict[str | InstanceType, list[str]]] | None:
-        """DESCRIBE instance for a given class from the graph store
+        """Describe instance for a given class from the graph store, using the triples with the instance as subject
 
         Args:
             instance_id: Instance id for which we want to generate query
@@ -156,9 +371,71 @@ class Queries:
         Returns:
             Dictionary of instance properties
         """
+        if isinstance(instance_id, BNode):
+            # Blank nodes cannot be bound in a query, so their triples are read from the graph.
+            predicate_objects = self.graph.predicate_objects(instance_id)
+        else:
+            result = cast(list[ResultRow], _TRIPLES_OF_INSTANCE.run(self.graph, instance=instance_id))
+            predicate_objects = ((predicate, object_) for _, predicate, object_ in result)  # type: ignore[misc]
+        return self._instance_properties(
+            instance_id,
+            predicate_objects,  # type: ignore[arg-type]
+            instance_type,
+            property_renaming_config,
+            property_types,
+        )
+
+    def describe_instances_of_class(
+        self,
+        class_uri: URIRef,
+        instance_type: str | None = None,
+        property_renaming_config: dict | None = None,
+        property_types: dict[str, EntityTypes] | None = None,
+        page_size: int = 10_000,
+    ) -> Iterable[tuple[str, dict[str | InstanceType, list[str]]]]:
+        """DESCRIBE all instances of a given class using paged SELECT queries
+
+        This is the batched counterpart of `describe`. Instead of one DESCRIBE query per instance,
+        the triples of all instances of the class are fetched in pages ordered by subject, see
+        `iterate_instances_of_type`, and consecutive rows of the same subject are grouped into one instance.
+
+        Args:
+            class_uri: Class for which instances are to be described
+            instance_type: Type of the instances, default None (will be inferred from triples)
+            property_renaming_config: Dictionary to rename properties, default None (no renaming)
+            property_types: Dictionary of property types, default None (helper for removal of namespace)
+            page_size: Number of triples to fetch per query, by default 10_000
+
+        Returns:
+            Iterable of instance identifier and instance properties
+        """
+        if page_size < 1:
+            raise ValueError(f"Page size must be a positive integer, got {page_size}")
+
+        triples = self.iterate_instances_of_type(class_uri, page_size)
+        # Triples are ordered by subject, thus all triples of an instance are consecutive
+        for instance_id, rows in groupby(triples, key=itemgetter(0)):
+            if res := self._instance_properties(
+                cast(URIRef, instance_id),
+                ((cast(URIRef, predicate), cast(URIRef | RdfLiteral, object_)) for _, predicate, object_ in rows),
+                instance_type,
+                property_renaming_config,
+                property_types,
+            ):
+                yield res
+
+    @staticmethod
+    def _instance_properties(
+        instance_id: URIRef,
+        predicate_objects: Iterable[tuple[URIRef, URIRef | RdfLiteral]],
+        instance_type: str | None = None,
+        property_renaming_config: dict | None = None,
+        property_types: dict[str, EntityTypes] | None = None,
+    ) -> tuple[str, dict[str | InstanceType, list[str]]] | None:
+        """Converts the predicate-object pairs of an instance to instance properties"""
         property_values: dict[str, list[str]] = defaultdict(list)
         identifier = remove_namespace_from_uri(instance_id, validation="prefix")
-        for _, predicate, object_ in cast(list[ResultRow], self.graph.query(f"DESCRIBE <{instance_id}>")):
+        for predicate, object_ in predicate_objects:
             if object_.lower() in [
                 "",
                 "none",
@@ -267,8 +544,10 @@ class Queries:
         Returns:
             List of triples
         """
-        query = f"SELECT ?subject ?predicate ?object WHERE {{ ?subject ?predicate ?object }} LIMIT {limit}"
-        return cast(list[ResultRow], list(self.graph.query(query)))
+        query = compile_query(
+            f"SELECT ?subject ?predicate ?object WHERE {{ ?subject ?predicate ?object }} LIMIT {int(limit)}"
+        )
+        return list(cast(list[ResultRow], self.query(query)))
 
     @overload
     def list_types(self, remove_namespace: Literal[False] = False, limit: int = 25) -> list[ResultRow]: ...
@@ -286,8 +565,8 @@ class Queries:
         Returns:
             List of types
         """
-        query = f"SELECT DISTINCT ?type WHERE {{ ?subject a ?type }} LIMIT {limit}"
-        result = cast(list[ResultRow], list(self.graph.query(query)))
+        query = compile_query(f"SELECT DISTINCT ?type WHERE {{ ?subject a ?type }} LIMIT {int(limit)}")
+        result = list(cast(list[ResultRow], self.query(query)))
         if remove_namespace:
             return [remove_namespace_from_uri(res[0]) for res in result]
         return result
@@ -295,22 +574,11 @@ class Queries:
     def multi_value_type_property(
         self,
     ) -> Iterable[tuple[URIRef, URIRef, list[URIRef]]]:
-        query = """SELECT ?sourceType ?property
-                          (GROUP_CONCAT(DISTINCT STR(?valueType); SEPARATOR=",") AS ?valueTypes)
-
-                   WHERE {{
-                       ?s ?property ?o .
-                       ?s a ?sourceType .
-                       OPTIONAL {{ ?o a ?type }}
-
-                       # Key part to determine value type: either object, data or unknown
-                       BIND(   IF(isLiteral(?o),DATATYPE(?o),
-                               IF(BOUND(?type), ?type,
-                                               <{unknownType}>)) AS ?valueType)
-                   }}
-
-                   GROUP BY ?sourceType ?property
-                   HAVING (COUNT(DISTINCT ?valueType) > 1)"""
+        if self.statistics is not None:
+            for (source_type, property_), value_types in self.statistics.value_types.items():
+                if len(value_types) > 1:
+                    yield source_type, property_, list(value_types)
+            return None
 
         for (
             source_type,
@@ -318,6 +586,6 @@ class Queries:
             value_types,
         ) in cast(
             ResultRow,
-            self.graph.query(query.format(unknownType=str(UNKNOWN_TYPE))),
+            _MULTI_VALUE_TYPE_PROPERTY.run(self.graph, unknownType=UNKNOWN_TYPE),
         ):
             yield cast(URIRef, source_type), cast(URIRef, property_), [URIRef(uri) for uri in value_types.split(",")]
@@ -0,0 +1,75 @@
+import sys
+from collections import OrderedDict
+from collections.abc import Hashable
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass(frozen=True)
+class QueryCacheInfo:
+    hits: int
+    misses: int
+    entries: int
+    size_bytes: int
+
+
+class QueryCache:
+    """Least recently used cache of query results.
+
+    The results are keyed by the query text and the generation of the graph they were computed on, so
+    a change to the graph makes the results computed before it unreachable. They are then evicted as
+    new results are added.
+
+    Args:
+        max_entries: Maximum number of results kept in the cache.
+        max_bytes: Maximum total estimated size of the results kept in the cache. Results larger than this
+            are not cached.
+    """
+
+    def __init__(self, max_entries: int = 256, max_bytes: int = 64 * 1024**2):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._results: OrderedDict[Hashable, tuple[Any, int]] = OrderedDict()
+        self._size_bytes = 0
+
+    def get(self, key: Hashable) -> Any | None:
+        """Returns the cached result for the key, or None if it is not cached."""
+        if (cached := self._results.get(key)) is None:
+            self.misses += 1
+            return None
+        self._results.move_to_end(key)
+        self.hits += 1
+        return cached[0]
+
+    def put(self, key: Hashable, result: Any) -> None:
+        """Caches the result for the key, evicting the least recently used results if the cache is full."""
+        size = _estimate_size(result)
+        if size > self.max_bytes or self.max_entries <= 0:
+            return
+        if (previous := self._results.pop(key, None)) is not None:
+            self._size_bytes -= previous[1]
+        self._results[key] = (result, size)
+        self._size_bytes += size
+        while len(self._results) > self.max_entries or self._size_bytes > self.max_bytes:
+            _, (_, evicted_size) = self._results.popitem(last=False)
+            self._size_bytes -= evicted_size
+
+    def clear(self) -> None:
+        """Removes all results from the cache and resets the statistics."""
+        self._results.clear()
+        self._size_bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def info(self) -> QueryCacheInfo:
+        """Returns the hit and miss statistics and the current size of the cache."""
+        return QueryCacheInfo(self.hits, self.misses, len(self._results), self._size_bytes)
+
+
+def _estimate_size(result: Any) -> int:
+    # Query results are (lists of) rows of rdflib terms, which are strings.
+    if isinstance(result, list | tuple):
+        return sys.getsizeof(result) + sum(_estimate_size(item) for item in result)
+    return sys.getsizeof(result)
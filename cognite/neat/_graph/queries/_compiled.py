@@ -0,0 +1,135 @@
+import re
+from collections.abc import Mapping
+from functools import lru_cache
+from typing import Any, cast
+
+from rdflib import BNode, Graph, Literal, Namespace, URIRef, Variable
+from rdflib.plugins.sparql import prepareQuery
+from rdflib.plugins.sparql.algebra import reorderTriples, traverse
+from rdflib.plugins.sparql.parserutils import CompValue, Expr
+from rdflib.plugins.sparql.sparql import Query
+from rdflib.query import Result
+from rdflib.term import Identifier, Node
+
+from cognite.neat._issues.errors import NeatValueError
+
+# Stores which evaluate SPARQL with their own query engine, and are thus given the query as text
+_STORES_WITH_QUERY_ENGINE = frozenset({"OxigraphStore", "SPARQLStore", "SPARQLUpdateStore"})
+
+_WHERE = re.compile(r"\bWHERE\s*\{", re.IGNORECASE)
+
+
+class CompiledQuery:
+    """A SPARQL query which is compiled once, and run with values bound to its variables.
+
+    Graphs evaluated by rdflib run the query parsed and translated to algebra on first use, with the values
+    passed as initial bindings. rdflib orders the triple patterns of the algebra such that the patterns with
+    the most constants are evaluated first, and as bound variables are constants when the query is run, the
+    patterns are ordered once for every set of bound variables. Stores with their own query engine, Oxigraph
+    and remote SPARQL endpoints, are given the query text with the values in a VALUES clause at the start of
+    the WHERE clause. The values are serialized as N3 terms, so they cannot change the structure of the query.
+
+    Args:
+        text: The SPARQL query. Values are bound to its variables when it is run, instead of being
+            substituted into the text.
+        init_ns: Prefixes used by the query.
+    """
+
+    def __init__(self, text: str, init_ns: Mapping[str, Namespace] | None = None) -> None:
+        if not (where := _WHERE.search(text)):
+            raise NeatValueError(f"Cannot compile query without a WHERE clause: {text}")
+        self.text = text
+        self.init_ns = dict(init_ns or {})
+        self._values_at = where.end()
+        self._prologue = "".join(f"PREFIX {prefix}: <{namespace}>\n" for prefix, namespace in self.init_ns.items())
+        self._prepared: Query | None = None
+        self._prepared_by_bound: dict[frozenset[tuple[str, bool]], Query] = {}
+
+    @property
+    def prepared(self) -> Query:
+        """The query parsed and translated to SPARQL algebra."""
+        if self._prepared is None:
+            self._prepared = prepareQuery(self.text, initNs=self.init_ns)
+        return self._prepared
+
+    def run(self, graph: Graph, **bindings: Node) -> Result:
+        """Runs the query against a graph.
+
+        Args:
+            graph: The graph to query.
+            **bindings: Values of the variables of the query, by variable name.
+        """
+        if type(graph.store).__name__ in _STORES_WITH_QUERY_ENGINE:
+            return graph.query(self.with_values(bindings))
+        bound = frozenset((name, isinstance(value, Literal)) for name, value in bindings.items())
+        return graph.query(self._prepared_for(bound), initBindings=cast(Mapping[str, Identifier], bindings))
+
+    def _prepared_for(self, bound: frozenset[tuple[str, bool]]) -> Query:
+        # rdflib prefers patterns with a literal object, so whether a value is a literal is part of the key
+        if not bound:
+            return self.prepared
+        if (query := self._prepared_by_bound.get(bound)) is None:
+            query = Query(self.prepared.prologue, _copy_algebra(self.prepared.algebra))
+            traverse(query.algebra, visitPost=lambda node: _reorder_patterns(node, bound))
+            self._prepared_by_bound[bound] = query
+        return query
+
+    def with_values(self, bindings: Mapping[str, Node]) -> str:
+        """The query text with the values of the variables in a VALUES clause."""
+        if not bindings:
+            return self._prologue + self.text
+        variables = " ".join(f"?{name}" for name in bindings)
+        values = " ".join(_to_sparql(value) for value in bindings.values())
+        return (
+            f"{self._prologue}{self.text[: self._values_at]} VALUES ({variables}) {{ ({values}) }}"
+            f"{self.text[self._values_at :]}"
+        )
+
+
+def _copy_algebra(node: Any) -> Any:
+    if isinstance(node, CompValue):
+        values = {key: _copy_algebra(value) for key, value in node.items()}
+        if isinstance(node, Expr):
+            copy: CompValue = Expr(node.name, node._evalfn.__func__ if node._evalfn is not None else None, **values)
+        else:
+            copy = CompValue(node.name, **values)
+        # rdflib keeps parts of the algebra as attributes, such as the translated pattern of EXISTS
+        for key, value in vars(node).items():
+            if key not in vars(copy) and key != "ctx":
+                setattr(copy, key, _copy_algebra(value))
+        return copy
+    if isinstance(node, list):
+        return [_copy_algebra(value) for value in node]
+    return node
+
+
+def _reorder_patterns(node: object, bound: frozenset[tuple[str, bool]]) -> None:
+    if not (isinstance(node, CompValue) and node.name == "BGP"):
+        return None
+    # The bound variables are replaced by placeholder constants while the patterns are ordered.
+    placeholders: dict[Variable, Identifier] = {
+        Variable(name): (Literal if is_literal else URIRef)(f"urn:neat:bound:{name}") for name, is_literal in bound
+    }
+    variables = {placeholder: variable for variable, placeholder in placeholders.items()}
+    triples = [tuple(placeholders.get(term, term) for term in triple) for triple in node.triples]
+    node["triples"] = [tuple(variables.get(term, term) for term in triple) for triple in reorderTriples(triples)]
+    return None
+
+
+def _to_sparql(value: Node) -> str:
+    if isinstance(value, BNode):
+        raise NeatValueError(f"Cannot bind blank node {value} in a query")
+    try:
+        return value.n3()  # type: ignore[attr-defined]
+    except Exception as e:
+        # rdflib refuses to serialize IRIs with characters that are not allowed in an IRI
+        raise NeatValueError(f"Cannot bind {value!r} in a query: {e}") from e
+
+
+@lru_cache(maxsize=1024)
+def compile_query(text: str) -> CompiledQuery:
+    """Returns the compiled query of a query text, every distinct text is compiled once.
+
+    This is the registry of the queries of neat. Queries with prefixes declare them in the text.
+    """
+    return CompiledQuery(text)
@@ -84,7 +84,7 @@ def get_predicate_id(
     prefixes = prefixes or get_default_prefixes()
 
     query = """
-
+        insertPrefixes
         SELECT ?predicateTypeID
         WHERE {
             ?subjectInstanceID a subjectTypeID .
@@ -7,7 +7,7 @@ from ._classic_cdf import (
     AssetTimeSeriesConnector,
     RelationshipToSchemaTransformer,
 )
-from ._rdfpath import AddSelfReferenceProperty
+from ._rdfpath import AddSelfReferenceProperty, ReduceHopTraversal
 from ._value_type import SplitMultiValueProperty
 
 __all__ = [
@@ -18,6 +18,7 @@ __all__ = [
     "AssetEventConnector",
     "AssetRelationshipConnector",
     "AddSelfReferenceProperty",
+    "ReduceHopTraversal",
     "SplitMultiValueProperty",
     "RelationshipToSchemaTransformer",
 ]
@@ -30,6 +31,7 @@ Transformers = (
     | AssetEventConnector
     | AssetRelationshipConnector
     | AddSelfReferenceProperty
+    | ReduceHopTraversal
     | SplitMultiValueProperty
     | RelationshipToSchemaTransformer
 )
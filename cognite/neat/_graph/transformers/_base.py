@@ -1,14 +1,28 @@
 from abc import ABC, abstractmethod
+from collections.abc import Iterable
 from typing import ClassVar
 
 from rdflib import Graph
 
+from cognite.neat._graph.models import Triple
+
 
 class BaseTransformer(ABC):
     description: str
     _use_only_once: bool
     _need_changes: ClassVar[frozenset[str]] = frozenset()
+    # Number of triples added and removed by the last transformation,
+    # None if the transformer does not keep track of its changes.
+    triples_added: int | None = None
+    triples_removed: int | None = None
 
     @abstractmethod
     def transform(self, graph: Graph) -> None:
         raise NotImplementedError()
+
+
+def _add_triples(graph: Graph, triples: Iterable[Triple]) -> int:
+    """Adds triples to the graph in one bulk operation, and returns the number of new triples"""
+    new_triples = [triple for triple in triples if triple not in graph]
+    graph.addN((subject, predicate, object_, graph) for subject, predicate, object_ in new_triples)
+    return len(new_triples)
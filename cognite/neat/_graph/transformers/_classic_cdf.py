@@ -1,28 +1,55 @@
 import warnings
+from collections import defaultdict, deque
+from collections.abc import Iterable, Sequence
 from typing import cast
 
 from rdflib import RDF, Graph, Literal, Namespace, URIRef
-from rdflib.query import ResultRow
 
 from cognite.neat._constants import CLASSIC_CDF_NAMESPACE, DEFAULT_NAMESPACE
 from cognite.neat._graph import extractors
-from cognite.neat._issues.warnings import ResourceNotFoundWarning
+from cognite.neat._graph.models import Triple
+from cognite.neat._graph.queries import compile_query
+from cognite.neat._issues.warnings import NeatValueWarning, ResourceNotFoundWarning
 from cognite.neat._utils.rdf_ import remove_namespace_from_uri
 
-from ._base import BaseTransformer
+from ._base import BaseTransformer, _add_triples
 
 
 class AddAssetDepth(BaseTransformer):
+    """Adds depth of asset in the asset hierarchy to the graph.
+
+    The parent edges are loaded once and the depths are computed with a single breadth-first traversal
+    from the top of each hierarchy. Root assets have depth 1, their children depth 2, and so on.
+
+    Assets that are part of a parent cycle do not get a depth, and assets whose hierarchy does not end
+    in a root asset (orphans) are reported. Both are reported as warnings.
+
+    Args:
+        asset_type: The type of the assets, by default neat:Asset
+        root_prop: The property pointing to the root of the asset, by default neat:root
+        parent_prop: The property pointing to the parent of the asset, by default neat:parent
+        depth_typing: Optional mapping from depth to a new type of the assets at that depth
+    """
+
     description: str = "Adds depth of asset in the asset hierarchy to the graph"
     _use_only_once: bool = True
     _need_changes = frozenset({str(extractors.AssetsExtractor.__name__)})
 
-    _parent_template: str = """SELECT ?child ?parent WHERE {{
-                              <{asset_id}> <{parent_prop}> ?child .
-                              OPTIONAL{{?child <{parent_prop}>+ ?parent .}}}}"""
+    _assets_query = compile_query("""SELECT DISTINCT ?asset_id WHERE {?asset_id a ?asset_type}""")
 
-    _root_template: str = """SELECT ?root WHERE {{
-                             <{asset_id}> <{root_prop}> ?root .}}"""
+    _parents_query = compile_query("""SELECT ?child ?parent WHERE {?child ?parent_prop ?parent}""")
+
+    _roots_query = compile_query(
+        """SELECT ?asset_id ?root WHERE {
+                              ?asset_id a ?asset_type .
+                              ?asset_id ?root_prop ?root .}"""
+    )
+
+    _types_query = compile_query(
+        """SELECT ?asset_id ?type WHERE {
+                              ?asset_id a ?asset_type .
+                              ?asset_id a ?type .}"""
+    )
 
     def __init__(
         self,
@@ -38,41 +65,102 @@ class AddAssetDepth(BaseTransformer):
 
     def transform(self, graph: Graph) -> None:
         """Adds depth of asset in the asset hierarchy to the graph."""
-        for result in graph.query(f"SELECT DISTINCT ?asset_id WHERE {{?asset_id a <{self.asset_type}>}}"):
-            asset_id = cast(tuple, result)[0]
-            if depth := self.get_depth(graph, asset_id, self.root_prop, self.parent_prop):
-                graph.add((asset_id, DEFAULT_NAMESPACE.depth, Literal(depth)))
-
-                if self.depth_typing and (type_ := self.depth_typing.get(depth, None)):
-                    # remove existing type
-                    graph.remove((asset_id, RDF.type, None))
-
-                    # add new type
-                    graph.add((asset_id, RDF.type, DEFAULT_NAMESPACE[type_]))
+        assets = {
+            cast(URIRef, cast(tuple, result)[0]) for result in self._assets_query.run(graph, asset_type=self.asset_type)
+        }
+        depth_by_asset = self.get_depths(graph, assets, self.root_prop, self.parent_prop, self.asset_type)
+
+        to_add: list[Triple] = [
+            (asset_id, DEFAULT_NAMESPACE.depth, Literal(depth)) for asset_id, depth in depth_by_asset.items()
+        ]
+        to_remove: list[Triple] = []
+        if self.depth_typing:
+            type_by_asset = {
+                asset_id: DEFAULT_NAMESPACE[type_]
+                for asset_id, depth in depth_by_asset.items()
+                if (type_ := self.depth_typing.get(depth, None))
+            }
+            # remove existing types
+            for result in self._types_query.run(graph, asset_type=self.asset_type):
+                asset_id, existing_type = cast(tuple[URIRef, URIRef], result)
+                if asset_id in type_by_asset:
+                    to_remove.append((asset_id, RDF.type, existing_type))
+            # add new types
+            to_add.extend((asset_id, RDF.type, type_) for asset_id, type_ in type_by_asset.items())
+
+        for triple in to_remove:
+            graph.remove(triple)
+        self.triples_removed = len(to_remove)
+        self.triples_added = _add_triples(graph, to_add)
 
     @classmethod
-    def get_depth(
+    def get_depths(
         cls,
         graph: Graph,
-        asset_id: URIRef,
+        assets: set[URIRef],
         root_prop: URIRef,
         parent_prop: URIRef,
-    ) -> int | None:
-        """Get asset depth in the asset hierarchy."""
-
-        # Handles non-root assets
-        if result := list(graph.query(cls._parent_template.format(asset_id=asset_id, parent_prop=parent_prop))):
-            return len(cast(list[tuple], result)) + 2 if cast(list[tuple], result)[0][1] else 2
-
-        # Handles root assets
-        elif (
-            (result := list(graph.query(cls._root_template.format(asset_id=asset_id, root_prop=root_prop))))
-            and len(cast(list[tuple], result)) == 1
-            and cast(list[tuple], result)[0][0] == asset_id
-        ):
-            return 1
-        else:
-            return None
+        asset_type: URIRef,
+    ) -> dict[URIRef, int]:
+        """Get depth of the given assets in the asset hierarchy."""
+        parent_by_child: dict[URIRef, URIRef] = {}
+        children_by_parent: dict[URIRef, list[URIRef]] = defaultdict(list)
+        for result in cls._parents_query.run(graph, parent_prop=parent_prop):
+            child, parent = cast(tuple[URIRef, URIRef], result)
+            if child in parent_by_child:
+                # an asset can only have one parent
+                continue
+            parent_by_child[child] = parent
+            children_by_parent[parent].append(child)
+
+        roots_by_asset: dict[URIRef, list[URIRef]] = defaultdict(list)
+        for result in cls._roots_query.run(graph, asset_type=asset_type, root_prop=root_prop):
+            asset_id, root = cast(tuple[URIRef, URIRef], result)
+            roots_by_asset[asset_id].append(root)
+        roots = {asset_id for asset_id, root_ids in roots_by_asset.items() if root_ids == [asset_id]}
+
+        # The top of a hierarchy is any node without a parent, this includes parents
+        # that are not present in the graph.
+        tops = [node for node in (assets | children_by_parent.keys()) if node not in parent_by_child]
+
+        depth_by_asset: dict[URIRef, int] = {}
+        visited: set[URIRef] = set()
+        orphans: list[URIRef] = []
+        for top in tops:
+            visited.add(top)
+            if top in roots:
+                depth_by_asset[top] = 1
+            elif top in assets:
+                # Asset without a parent, which is not a root
+                orphans.append(top)
+            is_rooted = top in roots
+            # Number of ancestors + 1 gives the depth of an asset
+            queue: deque[tuple[URIRef, int]] = deque((child, 2) for child in children_by_parent.get(top, []))
+            while queue:
+                node, depth = queue.popleft()
+                visited.add(node)
+                if node in assets:
+                    depth_by_asset[node] = depth
+                    if not is_rooted:
+                        orphans.append(node)
+                queue.extend((child, depth + 1) for child in children_by_parent.get(node, []))
+
+        if orphans:
+            warnings.warn(
+                NeatValueWarning(f"{len(orphans)} assets are not connected to a root asset: {_humanize(orphans)}"),
+                stacklevel=2,
+            )
+        # All nodes that cannot be reached from the top of a hierarchy are part of, or below, a cycle
+        if cycles := [asset_id for asset_id in assets if asset_id not in visited]:
+            warnings.warn(
+                NeatValueWarning(
+                    f"{len(cycles)} assets are part of a cycle in the asset hierarchy and "
+                    f"have not been assigned a depth: {_humanize(cycles)}"
+                ),
+                stacklevel=2,
+            )
+
+        return depth_by_asset
 
 
 class AssetTimeSeriesConnector(BaseTransformer):
@@ -84,9 +172,12 @@ class AssetTimeSeriesConnector(BaseTransformer):
             str(extractors.TimeSeriesExtractor.__name__),
         }
     )
-    _asset_template: str = """SELECT ?asset_id WHERE {{
-                              <{timeseries_id}> <{asset_prop}> ?asset_id .
-                              ?asset_id a <{asset_type}>}}"""
+    _asset_query = compile_query(
+        """SELECT ?timeseries_id ?asset_id WHERE {
+                              ?timeseries_id a ?timeseries_type .
+                              ?timeseries_id ?asset_prop ?asset_id .
+                              ?asset_id a ?asset_type}"""
+    )
 
     def __init__(
         self,
@@ -99,23 +190,15 @@ class AssetTimeSeriesConnector(BaseTransformer):
         self.asset_prop = asset_prop or DEFAULT_NAMESPACE.asset
 
     def transform(self, graph: Graph) -> None:
-        for ts_id_result in graph.query(
-            f"SELECT DISTINCT ?timeseries_id WHERE {{?timeseries_id a <{self.timeseries_type}>}}"
-        ):
-            timeseries_id: URIRef = cast(tuple, ts_id_result)[0]
-
-            if asset_id_res := list(
-                graph.query(
-                    self._asset_template.format(
-                        timeseries_id=timeseries_id,
-                        asset_prop=self.asset_prop,
-                        asset_type=self.asset_type,
-                    )
-                )
-            ):
-                # timeseries can be connected to only one asset in the graph
-                asset_id = cast(list[tuple], asset_id_res)[0][0]
-                graph.add((asset_id, DEFAULT_NAMESPACE.timeSeries, timeseries_id))
+        results = self._asset_query.run(
+            graph,
+            timeseries_type=self.timeseries_type,
+            asset_prop=self.asset_prop,
+            asset_type=self.asset_type,
+        )
+        # timeseries can be connected to only one asset in the graph
+        self.triples_added = _connect_assets(graph, results, DEFAULT_NAMESPACE.timeSeries, single_asset=True)
+        self.triples_removed = 0
 
 
 class AssetSequenceConnector(BaseTransformer):
@@ -127,9 +210,12 @@ class AssetSequenceConnector(BaseTransformer):
             str(extractors.SequencesExtractor.__name__),
         }
     )
-    _asset_template: str = """SELECT ?asset_id WHERE {{
-                              <{sequence_id}> <{asset_prop}> ?asset_id .
-                              ?asset_id a <{asset_type}>}}"""
+    _asset_query = compile_query(
+        """SELECT ?sequence_id ?asset_id WHERE {
+                              ?sequence_id a ?sequence_type .
+                              ?sequence_id ?asset_prop ?asset_id .
+                              ?asset_id a ?asset_type}"""
+    )
 
     def __init__(
         self,
@@ -142,23 +228,15 @@ class AssetSequenceConnector(BaseTransformer):
         self.asset_prop = asset_prop or DEFAULT_NAMESPACE.asset
 
     def transform(self, graph: Graph) -> None:
-        for sequency_id_result in graph.query(
-            f"SELECT DISTINCT ?sequence_id WHERE {{?sequence_id a <{self.sequence_type}>}}"
-        ):
-            sequence_id: URIRef = cast(tuple, sequency_id_result)[0]
-
-            if asset_id_res := list(
-                graph.query(
-                    self._asset_template.format(
-                        sequence_id=sequence_id,
-                        asset_prop=self.asset_prop,
-                        asset_type=self.asset_type,
-                    )
-                )
-            ):
-                # sequence can be connected to only one asset in the graph
-                asset_id = cast(list[tuple], asset_id_res)[0][0]
-                graph.add((asset_id, DEFAULT_NAMESPACE.sequence, sequence_id))
+        results = self._asset_query.run(
+            graph,
+            sequence_type=self.sequence_type,
+            asset_prop=self.asset_prop,
+            asset_type=self.asset_type,
+        )
+        # sequence can be connected to only one asset in the graph
+        self.triples_added = _connect_assets(graph, results, DEFAULT_NAMESPACE.sequence, single_asset=True)
+        self.triples_removed = 0
 
 
 class AssetFileConnector(BaseTransformer):
@@ -170,9 +248,12 @@ class AssetFileConnector(BaseTransformer):
             str(extractors.FilesExtractor.__name__),
         }
     )
-    _asset_template: str = """SELECT ?asset_id WHERE {{
-                              <{file_id}> <{asset_prop}> ?asset_id .
-                              ?asset_id a <{asset_type}>}}"""
+    _asset_query = compile_query(
+        """SELECT ?file_id ?asset_id WHERE {
+                              ?file_id a ?file_type .
+                              ?file_id ?asset_prop ?asset_id .
+                              ?asset_id a ?asset_type}"""
+    )
 
     def __init__(
         self,
@@ -185,21 +266,15 @@ class AssetFileConnector(BaseTransformer):
         self.asset_prop = asset_prop or DEFAULT_NAMESPACE.asset
 
     def transform(self, graph: Graph) -> None:
-        for sequency_id_result in graph.query(f"SELECT DISTINCT ?file_id WHERE {{?file_id a <{self.file_type}>}}"):
-            file_id: URIRef = cast(tuple, sequency_id_result)[0]
-
-            if assets_id_res := list(
-                graph.query(
-                    self._asset_template.format(
-                        file_id=file_id,
-                        asset_prop=self.asset_prop,
-                        asset_type=self.asset_type,
-                    )
-                )
-            ):
-                # files can be connected to multiple assets in the graph
-                for (asset_id,) in cast(list[tuple], assets_id_res):
-                    graph.add((asset_id, DEFAULT_NAMESPACE.file, file_id))
+        results = self._asset_query.run(
+            graph,
+            file_type=self.file_type,
+            asset_prop=self.asset_prop,
+            asset_type=self.asset_type,
+        )
+        # files can be connected to multiple assets in the graph
+        self.triples_added = _connect_assets(graph, results, DEFAULT_NAMESPACE.file, single_asset=False)
+        self.triples_removed = 0
 
 
 class AssetEventConnector(BaseTransformer):
@@ -211,9 +286,12 @@ class AssetEventConnector(BaseTransformer):
             str(extractors.EventsExtractor.__name__),
         }
     )
-    _asset_template: str = """SELECT ?asset_id WHERE {{
-                              <{event_id}> <{asset_prop}> ?asset_id .
-                              ?asset_id a <{asset_type}>}}"""
+    _asset_query = compile_query(
+        """SELECT ?event_id ?asset_id WHERE {
+                              ?event_id a ?event_type .
+                              ?event_id ?asset_prop ?asset_id .
+                              ?asset_id a ?asset_type}"""
+    )
 
     def __init__(
         self,
@@ -226,21 +304,15 @@ class AssetEventConnector(BaseTransformer):
         self.asset_prop = asset_prop or DEFAULT_NAMESPACE.asset
 
     def transform(self, graph: Graph) -> None:
-        for event_id_result in graph.query(f"SELECT DISTINCT ?event_id WHERE {{?event_id a <{self.event_type}>}}"):
-            event_id: URIRef = cast(tuple, event_id_result)[0]
-
-            if assets_id_res := list(
-                graph.query(
-                    self._asset_template.format(
-                        event_id=event_id,
-                        asset_prop=self.asset_prop,
-                        asset_type=self.asset_type,
-                    )
-                )
-            ):
-                # files can be connected to multiple assets in the graph
-                for (asset_id,) in cast(list[tuple], assets_id_res):
-                    graph.add((asset_id, DEFAULT_NAMESPACE.event, event_id))
+        results = self._asset_query.run(
+            graph,
+            event_type=self.event_type,
+            asset_prop=self.asset_prop,
+            asset_type=self.asset_type,
+        )
+        # events can be connected to multiple assets in the graph
+        self.triples_added = _connect_assets(graph, results, DEFAULT_NAMESPACE.event, single_asset=False)
+        self.triples_removed = 0
 
 
 class AssetRelationshipConnector(BaseTransformer):
@@ -252,14 +324,18 @@ class AssetRelationshipConnector(BaseTransformer):
             str(extractors.RelationshipsExtractor.__name__),
         }
     )
-    _asset_template: str = """SELECT ?source ?target WHERE {{
-                              <{relationship_id}> <{relationship_source_xid_prop}> ?source_xid .
-                              ?source <{asset_xid_property}> ?source_xid .
-                              ?source a <{asset_type}> .
+    _asset_query = compile_query(
+        """SELECT ?relationship_id ?source ?target WHERE {
+                              ?relationship_id a ?relationship_type .
 
-                              <{relationship_id}> <{relationship_target_xid_prop}> ?target_xid .
-                              ?target <{asset_xid_property}> ?target_xid .
-                              ?target a <{asset_type}> .}}"""
+                              ?relationship_id ?relationship_source_xid_prop ?source_xid .
+                              ?source ?asset_xid_property ?source_xid .
+                              ?source a ?asset_type .
+
+                              ?relationship_id ?relationship_target_xid_prop ?target_xid .
+                              ?target ?asset_xid_property ?target_xid .
+                              ?target a ?asset_type .}"""
+    )
 
     def __init__(
         self,
@@ -276,47 +352,39 @@ class AssetRelationshipConnector(BaseTransformer):
         self.asset_xid_property = asset_xid_property or DEFAULT_NAMESPACE.external_id
 
     def transform(self, graph: Graph) -> None:
-        for relationship_id_result in graph.query(
-            f"SELECT DISTINCT ?relationship_id WHERE {{?relationship_id a <{self.relationship_type}>}}"
-        ):
-            relationship_id: URIRef = cast(tuple, relationship_id_result)[0]
-
-            if assets_id_res := list(
-                graph.query(
-                    self._asset_template.format(
-                        relationship_id=relationship_id,
-                        asset_xid_property=self.asset_xid_property,
-                        relationship_source_xid_prop=self.relationship_source_xid_prop,
-                        relationship_target_xid_prop=self.relationship_target_xid_prop,
-                        asset_type=self.asset_type,
-                    )
-                )
-            ):
-                # files can be connected to multiple assets in the graph
-                for source_asset_id, target_asset_id in cast(list[tuple], assets_id_res):
-                    # create a relationship between the two assets
-                    graph.add(
-                        (
-                            source_asset_id,
-                            DEFAULT_NAMESPACE.relationship,
-                            relationship_id,
-                        )
-                    )
-                    graph.add(
-                        (
-                            target_asset_id,
-                            DEFAULT_NAMESPACE.relationship,
-                            relationship_id,
-                        )
-                    )
-
-                    # add source and target to the relationship
-                    graph.add((relationship_id, DEFAULT_NAMESPACE.source, source_asset_id))
-                    graph.add((relationship_id, DEFAULT_NAMESPACE.target, target_asset_id))
-
-                    # remove properties that are not needed, specifically the external ids
-                    graph.remove((relationship_id, self.relationship_source_xid_prop, None))
-                    graph.remove((relationship_id, self.relationship_target_xid_prop, None))
+        _args = {
+            "relationship_type": self.relationship_type,
+            "relationship_source_xid_prop": self.relationship_source_xid_prop,
+            "relationship_target_xid_prop": self.relationship_target_xid_prop,
+            "asset_xid_property": self.asset_xid_property,
+            "asset_type": self.asset_type,
+        }
+
+        to_add: set[Triple] = set()
+        connected_relationships: set[URIRef] = set()
+        for result in self._asset_query.run(graph, **_args):
+            relationship_id, source_asset_id, target_asset_id = cast(tuple[URIRef, URIRef, URIRef], result)
+            # create a relationship between the two assets
+            to_add.add((source_asset_id, DEFAULT_NAMESPACE.relationship, relationship_id))
+            to_add.add((target_asset_id, DEFAULT_NAMESPACE.relationship, relationship_id))
+
+            # add source and target to the relationship
+            to_add.add((relationship_id, DEFAULT_NAMESPACE.source, source_asset_id))
+            to_add.add((relationship_id, DEFAULT_NAMESPACE.target, target_asset_id))
+            connected_relationships.add(relationship_id)
+
+        # remove properties that are not needed, specifically the external ids
+        to_remove: set[Triple] = {
+            (relationship_id, xid_prop, xid)
+            for relationship_id in connected_relationships
+            for xid_prop in [self.relationship_source_xid_prop, self.relationship_target_xid_prop]
+            for xid in cast(Iterable[URIRef | Literal], graph.objects(relationship_id, xid_prop))
+        }
+
+        self.triples_added = _add_triples(graph, to_add)
+        for triple in to_remove:
+            graph.remove(triple)
+        self.triples_removed = len(to_remove)
 
 
 class RelationshipToSchemaTransformer(BaseTransformer):
@@ -327,6 +395,11 @@ class RelationshipToSchemaTransformer(BaseTransformer):
     are replaced by a simple relationship between the source and target nodes. Relationships with
     properties are replaced by a schema that contains the properties as attributes.
 
+    The relationships are read with one query, and their source and target are looked up in an index of
+    the entities by external id, built once per entity type. Relationships whose source or target does not
+    exist are left unchanged, with one warning per missing entity. The triples of every replaced relationship
+    are removed with one pattern.
+
     Args:
         limit: The minimum number of relationships that need to be present for it
             to be converted into a schema. Default is 1.
@@ -345,103 +418,146 @@ class RelationshipToSchemaTransformer(BaseTransformer):
     _use_only_once: bool = True
     _need_changes = frozenset({str(extractors.RelationshipsExtractor.__name__)})
 
-    _count_by_source_target = """PREFIX classic: <{namespace}>
-
-SELECT (COUNT(?instance) AS ?instanceCount)
-WHERE {{
-  ?instance a classic:Relationship .
-  ?instance classic:source_type classic:{source_type} .
-  ?instance classic:target_type classic:{target_type} .
-}}"""
-
-    _instances = """PREFIX classic: <{namespace}>
-
-SELECT ?instance
-WHERE {{
-    ?instance a classic:Relationship .
-    ?instance classic:source_type classic:{source_type} .
-    ?instance classic:target_type classic:{target_type} .
-}}"""
-    _lookup_entity_query = """PREFIX classic: <{namespace}>
-
-SELECT ?entity
-WHERE {{
-    ?entity a classic:{entity_type} .
-    ?entity classic:external_id "{external_id}" .
-}}"""
+    _relationships_query = compile_query(
+        """SELECT ?relationship ?property ?value
+WHERE {
+    ?relationship a ?relationship_type .
+    ?relationship ?property ?value .
+}"""
+    )
+    _entities_query = compile_query(
+        """SELECT ?entity ?external_id
+WHERE {
+    ?entity a ?entity_type .
+    ?entity ?external_id_prop ?external_id .
+}"""
+    )
 
     def transform(self, graph: Graph) -> None:
-        for source_type in self._RELATIONSHIP_NODE_TYPES:
-            for target_type in self._RELATIONSHIP_NODE_TYPES:
-                query = self._count_by_source_target.format(
-                    namespace=self._namespace, source_type=source_type, target_type=target_type
+        node_type_by_uri = {self._namespace[node_type]: node_type for node_type in self._RELATIONSHIP_NODE_TYPES}
+
+        # All relationships are read in one query, grouped by relationship.
+        object_by_predicates_by_relationship: dict[URIRef, dict[str, URIRef | Literal]] = defaultdict(dict)
+        triples_by_relationship: dict[URIRef, list[Triple]] = defaultdict(list)
+        for result in self._relationships_query.run(graph, relationship_type=self._namespace["Relationship"]):
+            relationship_id, predicate, object_ = cast(tuple[URIRef, URIRef, URIRef | Literal], result)
+            object_by_predicates_by_relationship[relationship_id][remove_namespace_from_uri(predicate)] = object_
+            triples_by_relationship[relationship_id].append((relationship_id, predicate, object_))
+
+        relationships_by_source_target: dict[tuple[str, str], list[URIRef]] = defaultdict(list)
+        for relationship_id, object_by_predicates in object_by_predicates_by_relationship.items():
+            source_type = node_type_by_uri.get(cast(URIRef, object_by_predicates.get("source_type")))
+            target_type = node_type_by_uri.get(cast(URIRef, object_by_predicates.get("target_type")))
+            if source_type and target_type:
+                relationships_by_source_target[(source_type, target_type)].append(relationship_id)
+
+        entity_by_external_id_by_type: dict[str, dict[str, URIRef | None]] = {}
+        unresolved: dict[tuple[str, str], list[URIRef]] = defaultdict(list)
+        to_add: list[Triple] = []
+        to_remove: list[URIRef] = []
+        for (source_type, target_type), relationship_ids in relationships_by_source_target.items():
+            if len(relationship_ids) < self._limit:
+                continue
+            for node_type in (source_type, target_type):
+                if node_type not in entity_by_external_id_by_type:
+                    entity_by_external_id_by_type[node_type] = self._entity_by_external_id(graph, node_type)
+            predicate = self._predicate(target_type)
+            for relationship_id in relationship_ids:
+                object_by_predicates = object_by_predicates_by_relationship[relationship_id]
+                source_id = self._resolve(
+                    entity_by_external_id_by_type[source_type], object_by_predicates["source_external_id"]
                 )
-                for instance_count in graph.query(query):
-                    if int(instance_count[0]) < self._limit:  # type: ignore[index, arg-type]
-                        continue
-                    query = self._instances.format(
-                        namespace=self._namespace, source_type=source_type, target_type=target_type
-                    )
-                    for result in graph.query(query):
-                        instance_id = cast(URIRef, result[0])  # type: ignore[index, misc]
-                        self._convert_relationship_to_schema(graph, instance_id, source_type, target_type)
-
-    def _convert_relationship_to_schema(
-        self, graph: Graph, instance_id: URIRef, source_type: str, target_type: str
-    ) -> None:
-        result = cast(list[ResultRow], list(graph.query(f"DESCRIBE <{instance_id}>")))
-        object_by_predicates = cast(
-            dict[str, URIRef | Literal], {remove_namespace_from_uri(row[1]): row[2] for row in result}
-        )
-        source_external_id = cast(URIRef, object_by_predicates["source_external_id"])
-        target_source_id = cast(URIRef, object_by_predicates["target_external_id"])
-        try:
-            source_id = self._lookup_entity(graph, source_type, source_external_id)
-        except ValueError:
-            warnings.warn(ResourceNotFoundWarning(source_external_id, "class", str(instance_id), "class"), stacklevel=2)
-            return None
-        try:
-            target_id = self._lookup_entity(graph, target_type, target_source_id)
-        except ValueError:
-            warnings.warn(ResourceNotFoundWarning(target_source_id, "class", str(instance_id), "class"), stacklevel=2)
-            return None
-        external_id = str(object_by_predicates["external_id"])
-        # If there is properties on the relationship, we create a new intermediate node
-        self._create_node(graph, object_by_predicates, external_id, source_id, target_id, self._predicate(target_type))
-
-        for triple in result:
-            graph.remove(triple)  # type: ignore[arg-type]
-
-    def _lookup_entity(self, graph: Graph, entity_type: str, external_id: str) -> URIRef:
-        query = self._lookup_entity_query.format(
-            namespace=self._namespace, entity_type=entity_type, external_id=external_id
-        )
-        result = list(graph.query(query))
-        if len(result) == 1:
-            return cast(URIRef, result[0][0])  # type: ignore[index]
-        raise ValueError(f"Could not find entity with external_id {external_id} and type {entity_type}")
+                if source_id is None:
+                    unresolved[(source_type, str(object_by_predicates["source_external_id"]))].append(relationship_id)
+                    continue
+                target_id = self._resolve(
+                    entity_by_external_id_by_type[target_type], object_by_predicates["target_external_id"]
+                )
+                if target_id is None:
+                    unresolved[(target_type, str(object_by_predicates["target_external_id"]))].append(relationship_id)
+                    continue
+                external_id = str(object_by_predicates["external_id"])
+                to_add.extend(self._create_node(object_by_predicates, external_id, source_id, target_id, predicate))
+                to_remove.append(relationship_id)
+
+        # One warning per missing entity, listing the relationships referring to it.
+        for (_, external_id), relationship_ids in unresolved.items():
+            warnings.warn(
+                ResourceNotFoundWarning(external_id, "class", _humanize(relationship_ids), "class"), stacklevel=2
+            )
+
+        # All triples of a replaced relationship are removed with one pattern.
+        for relationship_id in to_remove:
+            graph.remove((relationship_id, None, None))
+        self.triples_removed = sum(len(triples_by_relationship[relationship_id]) for relationship_id in to_remove)
+        self.triples_added = _add_triples(graph, to_add)
+
+    def _entity_by_external_id(self, graph: Graph, entity_type: str) -> dict[str, URIRef | None]:
+        """Index of the entities of a type by external id, external ids shared by several entities map to None."""
+        entity_by_external_id: dict[str, URIRef | None] = {}
+        for result in self._entities_query.run(
+            graph, entity_type=self._namespace[entity_type], external_id_prop=self._namespace["external_id"]
+        ):
+            entity_id, external_id = cast(tuple[URIRef, Literal], result)
+            key = str(external_id)
+            entity_by_external_id[key] = None if key in entity_by_external_id else entity_id
+        return entity_by_external_id
+
+    @staticmethod
+    def _resolve(entity_by_external_id: dict[str, URIRef | None], external_id: URIRef | Literal) -> URIRef | None:
+        return entity_by_external_id.get(str(external_id))
 
     def _create_node(
         self,
-        graph: Graph,
         objects_by_predicates: dict[str, URIRef | Literal],
         external_id: str,
         source_id: URIRef,
         target_id: URIRef,
         predicate: URIRef,
-    ) -> None:
-        """Creates a new intermediate node for the relationship with properties."""
-        # Create new node
+    ) -> list[Triple]:
+        """Creates the triples of a new intermediate node for the relationship with properties."""
         instance_id = self._namespace[external_id]
-        graph.add((instance_id, RDF.type, self._namespace["Edge"]))
+        triples: list[Triple] = [(instance_id, RDF.type, self._namespace["Edge"])]
         for prop_name, object_ in objects_by_predicates.items():
             if prop_name in self._NOT_PROPERTIES:
                 continue
-            graph.add((instance_id, self._namespace[prop_name], object_))
+            triples.append((instance_id, self._namespace[prop_name], object_))
 
         # Connect the new node to the source and target nodes
-        graph.add((source_id, predicate, instance_id))
-        graph.add((instance_id, self._namespace["end_node"], target_id))
+        triples.append((source_id, predicate, instance_id))
+        triples.append((instance_id, self._namespace["end_node"], target_id))
+        return triples
 
     def _predicate(self, target_type: str) -> URIRef:
         return self._namespace[f"relationship{target_type.capitalize()}"]
+
+
+def _connect_assets(graph: Graph, results: Iterable, predicate: URIRef, single_asset: bool) -> int:
+    """Connects assets to the resources returned by a (resource_id, asset_id) join query.
+
+    Args:
+        graph: The graph to add the connections to
+        results: Rows of a SELECT query returning resource ids and the ids of the assets they point to
+        predicate: The predicate used to connect the asset to the resource
+        single_asset: Whether a resource can be connected to only one asset, in which case the
+            first asset returned for the resource is used
+
+    Returns:
+        Number of triples added to the graph
+    """
+    to_add: dict[Triple, None] = {}
+    connected: set[URIRef] = set()
+    for result in results:
+        resource_id, asset_id = cast(tuple[URIRef, URIRef], result)
+        if single_asset:
+            if resource_id in connected:
+                continue
+            connected.add(resource_id)
+        to_add[(asset_id, predicate, resource_id)] = None
+    return _add_triples(graph, to_add)
+
+
+def _humanize(ids: Sequence[URIRef], max_items: int = 10) -> str:
+    """Short, readable representation of a potentially long list of ids"""
+    shown = ", ".join(remove_namespace_from_uri(id_) for id_ in ids[:max_items])
+    return f"{shown}, ..." if len(ids) > max_items else shown
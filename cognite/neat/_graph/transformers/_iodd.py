@@ -15,7 +15,7 @@ class IODDTwoHopFlattener(TwoHopFlattener):
     )
 
     def __init__(self):
-        super().__init__(destination_node_type=IODD.TextObject, property_predicate=IODD.value, property_name="value")
+        super().__init__(destination_node_type=IODD.TextObject, property_predicate=IODD.value)
 
 
 class IODDPruneDanglingNodes(PruneDanglingNodes):
@@ -1,8 +1,13 @@
-from rdflib import Graph, Namespace, URIRef
-from rdflib.query import ResultRow
-from rdflib.term import Identifier
+import warnings
+from typing import cast
 
-from ._base import BaseTransformer
+from rdflib import RDF, Graph, Literal, Namespace, URIRef
+from rdflib.term import Node
+
+from cognite.neat._graph.models import Triple
+from cognite.neat._graph.queries import compile_query
+
+from ._base import BaseTransformer, _add_triples
 
 
 # TODO: Handle the cse when value is None, which will not make the TextObject resolve
@@ -14,6 +19,8 @@ class TwoHopFlattener(BaseTransformer):
     to go via the intermediate node.
     The user can also provide a flag to decide if the intermediate node should be removed from the graph or not
     after connecting the target property to the source node.
+    All paths are read with one query, the new connections are added in bulk, and each intermediate node is
+    removed once, so the flattening is linear in the number of paths.
 
         Ex. TwoHopFlattener:
 
@@ -21,64 +28,69 @@ class TwoHopFlattener(BaseTransformer):
         node(A, rdf:type(Pump)) -(predicate("vendor"))>
                                 node(B, rdf:type(TextObject)) -(predicate("value"))> Literal("CompanyX")
 
-        Graph after flattening nodes with destination_node_type = rdf:type(TextObject), property_predicate = :value,
-        and property_name = "value":
+        Graph after flattening nodes with destination_node_type = rdf:type(TextObject) and
+        property_predicate = :value:
 
         node(A, rdf:type(Pump)) -(predicate("vendor"))> Literal("CompanyX")
 
     Args:
         destination_node_type: RDF.type of edge Node
         property_predicate: Predicate to use when resolving the value from the edge node
-        property_name: name of the property that the intermediate node is pointing to
+        property_name: Deprecated and not used, the property is given by property_predicate.
         delete_connecting_node: bool if the intermediate Node and Edge between source Node
                                 and target property should be deleted. Defaults to True.
     """
 
     description: str = "Prunes the graph of specified node types that do not have connections to other nodes."
-    _query_template: str = """SELECT ?sourceNode ?property ?destinationNode ?value WHERE {{
+    _query = compile_query(
+        """SELECT ?sourceNode ?property ?destinationNode ?value WHERE {
                                      ?sourceNode ?property ?destinationNode .
-                                     ?destinationNode a <{destination_node_type}> .
-                                     ?destinationNode <{property_predicate}> ?{property_name} . }}"""
+                                     ?destinationNode a ?destination_node_type .
+                                     ?destinationNode ?property_predicate ?value . }"""
+    )
 
     def __init__(
         self,
         destination_node_type: URIRef,
         property_predicate: Namespace,
-        property_name: str,
+        property_name: str | None = None,
         delete_connecting_node: bool = True,
     ):
+        if property_name is not None:
+            warnings.warn(
+                "property_name of TwoHopFlattener is deprecated and not used, the property is given by "
+                "property_predicate",
+                DeprecationWarning,
+                stacklevel=2,
+            )
         self.destination_node_type = destination_node_type
         self.property_predicate = property_predicate
         self.property_name = property_name
         self.delete_connecting_node = delete_connecting_node
 
     def transform(self, graph: Graph) -> None:
-        nodes_to_delete: list[Identifier] = []
-
-        graph_traversals = list(
-            graph.query(
-                self._query_template.format(
-                    destination_node_type=self.destination_node_type,
-                    property_predicate=self.property_predicate,
-                    property_name=self.property_name,
-                )
+        to_add: set[Triple] = set()
+        nodes_to_delete: set[URIRef] = set()
+        for path in self._query.run(
+            graph,
+            destination_node_type=self.destination_node_type,
+            property_predicate=URIRef(self.property_predicate),
+        ):
+            source_node, predicate, destination_node, property_value = cast(
+                tuple[URIRef, URIRef, URIRef, URIRef | Literal], path
             )
-        )
-
-        for path in graph_traversals:
-            if isinstance(path, ResultRow):
-                source_node, predicate, destination_node, property_value = path.asdict().values()
+            # Create new connection from source node to value
+            to_add.add((source_node, predicate, property_value))
+            nodes_to_delete.add(destination_node)
 
-                # Create new connection from source node to value
-                graph.add((source_node, predicate, property_value))
-                nodes_to_delete.append(destination_node)
-
-            if self.delete_connecting_node:
-                for node in nodes_to_delete:
-                    # Remove edge triples to node
-                    graph.remove((None, None, node))
-                    # Remove node triple
-                    graph.remove((node, None, None))
+        self.triples_added = _add_triples(graph, to_add)
+        self.triples_removed = 0
+        if self.delete_connecting_node:
+            for node in nodes_to_delete:
+                # Remove edge triples to node, and then the triples of the node
+                for pattern in [(None, None, node), (node, None, None)]:
+                    self.triples_removed += sum(1 for _ in graph.triples(pattern))  # type: ignore[arg-type]
+                    graph.remove(pattern)  # type: ignore[arg-type]
 
 
 class PruneDanglingNodes(BaseTransformer):
@@ -97,30 +109,56 @@ class PruneDanglingNodes(BaseTransformer):
 
         node(A, rd:type(Pump)) -> node(B, rdf:type(Disc))
 
+    The number of incoming connections of the nodes of the specified types are counted in one scan of the graph.
+    Nodes without incoming connections are removed together with their triples, which can leave the nodes they
+    pointed to without incoming connections. These are removed in the next round, until no dangling nodes
+    are left or the maximum number of rounds is reached.
+
     Args:
         node_prune_types: list of RDF types to prune from the Graph if they are stand-alone Nodes
+        max_rounds: Maximum number of pruning rounds, by default None, which prunes until no dangling nodes
+            are left. A single round removes the nodes that are dangling before pruning.
+
+    Attributes:
+        removed_by_round: The number of nodes and the number of triples removed in each round of the
+            last transformation.
     """
 
     description: str = "Prunes the graph of specified rdf types that do not have connections to other nodes."
-    _query_template = """
-                    SELECT ?subject
-                    WHERE {{
-                        ?subject a <{rdf_type}> .
-                        FILTER NOT EXISTS {{ ?s ?p ?subject }}
-                    }}
-            """
 
     def __init__(
         self,
         node_prune_types: list[URIRef],
+        max_rounds: int | None = None,
     ):
+        if max_rounds is not None and max_rounds < 1:
+            raise ValueError(f"max_rounds must be a positive integer, got {max_rounds}")
         self.node_prune_types = node_prune_types
+        self.max_rounds = max_rounds
+        self.removed_by_round: list[tuple[int, int]] = []
 
     def transform(self, graph: Graph) -> None:
-        for object_type in self.node_prune_types:
-            nodes_without_neighbours = list(graph.query(self._query_template.format(rdf_type=object_type)))
-
-            for node in nodes_without_neighbours:
+        candidates = {node for type_ in self.node_prune_types for node in graph.subjects(RDF.type, type_)}
+        in_degree: dict[Node, int] = dict.fromkeys(candidates, 0)
+        for _, _, object_ in graph:
+            if object_ in in_degree:
+                in_degree[object_] += 1
+
+        self.removed_by_round = []
+        dangling = [node for node, degree in in_degree.items() if degree == 0]
+        while dangling and (self.max_rounds is None or len(self.removed_by_round) < self.max_rounds):
+            triples_removed = 0
+            next_dangling: list[Node] = []
+            for node in dangling:
+                del in_degree[node]
+                for object_ in list(graph.objects(node)):
+                    triples_removed += 1
+                    if object_ in in_degree:
+                        in_degree[object_] -= 1
+                        if in_degree[object_] == 0:
+                            next_dangling.append(object_)
                 # Remove node and its property triples in the graph
-                if isinstance(node, ResultRow):
-                    graph.remove(triple=(node["subject"], None, None))
+                graph.remove((node, None, None))
+            self.removed_by_round.append((len(dangling), triples_removed))
+            dangling = next_dangling
+        self.triples_removed = sum(triples for _, triples in self.removed_by_round)
@@ -1,16 +1,64 @@
-from rdflib import Graph
+import warnings
+from collections.abc import Iterable
+from typing import cast
 
+from rdflib import Graph, Literal, URIRef
+
+from cognite.neat._graph.models import Triple
+from cognite.neat._graph.queries._shared import generate_prefix_header, hop2property_path
+from cognite.neat._issues.warnings import NeatValueWarning
 from cognite.neat._rules.analysis import InformationAnalysis
-from cognite.neat._rules.models._rdfpath import RDFPath, SingleProperty
+from cognite.neat._rules.models._rdfpath import Hop, RDFPath, SingleProperty
 from cognite.neat._rules.models.information import InformationRules
 
-from ._base import BaseTransformer
+from ._base import BaseTransformer, _add_triples
 
 
 class ReduceHopTraversal(BaseTransformer):
-    """ReduceHopTraversal is a transformer that reduces the number of hops to direct connection."""
+    """ReduceHopTraversal is a transformer that reduces the number of hops to direct connection.
+
+    The values reached by every `Hop` rdfpath in the rules are materialized as a direct property of the
+    instances of the origin class, named by the property of the rules. The rules are not changed, the graph
+    store records the transformation in its provenance and reads the materialized properties instead of
+    refusing the `Hop` rdfpaths.
+
+    Args:
+        rules: The rules with Hop rdfpaths.
+    """
+
+    description: str = "Materializes multi-hop rdfpaths of the rules as direct properties"
+    _use_only_once: bool = True
+    _need_changes = frozenset({})
+
+    def __init__(self, rules: InformationRules):
+        self.rules = rules
+        self.properties = [
+            property_
+            for property_ in rules.properties
+            if property_.transformation and isinstance(property_.transformation.traversal, Hop)
+        ]
+
+    def transform(self, graph: Graph) -> None:
+        prefixes = {**self.rules.prefixes, self.rules.metadata.prefix: self.rules.metadata.namespace}
+        to_add: list[Triple] = []
+        for property_ in self.properties:
+            hop = cast(Hop, cast(RDFPath, property_.transformation).traversal)
+            new_property = self.rules.metadata.namespace[property_.property_]
+            try:
+                property_path = hop2property_path(graph, hop, prefixes)
+            except ValueError as e:
+                warnings.warn(NeatValueWarning(f"Cannot materialize {hop} of {property_.property_}: {e}"), stacklevel=2)
+                continue
+            query = (
+                f"{generate_prefix_header(prefixes)}"
+                f"SELECT ?origin ?value WHERE {{ ?origin a {hop.class_.id} . ?origin {property_path} ?value . }}"
+            )
+            to_add.extend(
+                (origin, new_property, value)
+                for origin, value in cast(Iterable[tuple[URIRef, URIRef | Literal]], graph.query(query))
+            )
 
-    ...
+        self.triples_added = _add_triples(graph, to_add)
 
 
 class AddSelfReferenceProperty(BaseTransformer):
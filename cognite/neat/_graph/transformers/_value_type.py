@@ -1,13 +1,33 @@
-from rdflib import XSD, Graph, URIRef
+from collections import defaultdict
+
+from rdflib import RDF, XSD, Graph, Literal, URIRef
+from rdflib.term import Node
 
 from cognite.neat._constants import UNKNOWN_TYPE
+from cognite.neat._graph.models import Triple
 from cognite.neat._graph.queries import Queries
 from cognite.neat._utils.rdf_ import remove_namespace_from_uri
 
-from ._base import BaseTransformer
+from ._base import BaseTransformer, _add_triples
 
 
 class SplitMultiValueProperty(BaseTransformer):
+    """Splits properties with values of several value types into one property per value type.
+
+    A property of a type has several value types when its values are literals of different datatypes,
+    objects of different types, or objects without a type, which have the unknown value type. The value
+    of such a property is moved to a new property, named by the property and the value type, for example
+    `voltage_float` and `voltage_Voltage`. An object of several types is moved to the property of each type.
+
+    The value types of the properties are computed by one grouped query on Oxigraph, which evaluates SPARQL
+    natively, and by one pass over the triples on other stores, where rdflib evaluates SPARQL in Python.
+    The triples of each split property are then moved in one bulk removal and addition, where the types of
+    every node are looked up once.
+
+    Attributes:
+        triples_by_property: The number of triples moved to each new property in the last transformation.
+    """
+
     description: str = (
         "SplitMultiValueProperty is a transformer that splits a "
         "multi-value property into multiple single-value properties."
@@ -15,52 +35,68 @@ class SplitMultiValueProperty(BaseTransformer):
     _use_only_once: bool = True
     _need_changes = frozenset({})
 
-    _object_property_template: str = """SELECT ?s ?o WHERE{{
-
-                                ?s a <{subject_uri}> .
-                                ?s <{property_uri}> ?o .
-                                ?o a <{object_uri}> .
-
-                            }}"""
-
-    _datatype_property_template: str = """SELECT ?s ?o WHERE {{
-
-                                ?s a <{subject_uri}> .
-                                ?s <{property_uri}> ?o .
-                                FILTER (datatype(?o) = <{object_uri}>)
-
-                                }}"""
-
-    _unknown_property_template: str = """SELECT ?s ?o WHERE {{
-
-                                ?s a <{subject_uri}> .
-                                ?s <{property_uri}> ?o .
-                                FILTER NOT EXISTS {{ ?o a ?objectType }}
-                                }}"""
+    def __init__(self) -> None:
+        self.triples_by_property: dict[URIRef, int] = {}
 
     def transform(self, graph: Graph) -> None:
-        # handle multi value type object properties
-        for subject_uri, property_uri, value_types in Queries(graph).multi_value_type_property():
-            for value_type_uri in value_types:
-                _args = {
-                    "subject_uri": subject_uri,
-                    "property_uri": property_uri,
-                    "object_uri": value_type_uri,
-                }
-
-                # Case 1: Unknown value type
-                if value_type_uri == UNKNOWN_TYPE:
-                    iterator = graph.query(self._unknown_property_template.format(**_args))
-
-                # Case 2: Datatype value type
-                elif value_type_uri.startswith(str(XSD)):
-                    iterator = graph.query(self._datatype_property_template.format(**_args))
-
-                # Case 3: Object value type
-                else:
-                    iterator = graph.query(self._object_property_template.format(**_args))
-
-                for s, o in iterator:  # type: ignore [misc]
-                    graph.remove((s, property_uri, o))
-                    new_property = URIRef(f"{property_uri}_{remove_namespace_from_uri(value_type_uri)}")
-                    graph.add((s, new_property, o))
+        types_by_node: dict[Node, list[URIRef]] = {}
+
+        def types_of(node: Node) -> list[URIRef]:
+            if (types := types_by_node.get(node)) is None:
+                types = types_by_node[node] = list(graph.objects(node, RDF.type))  # type: ignore[arg-type]
+            return types
+
+        def value_types_of(object_: Node) -> list[URIRef]:
+            if isinstance(object_, Literal):
+                return [_datatype(object_)]
+            return types_of(object_) or [UNKNOWN_TYPE]
+
+        # Oxigraph store, do not want to type hint this as it is an optional dependency
+        if type(graph.store).__name__ == "OxigraphStore":
+            value_types_by_type_property = {
+                (subject_type, property_): set(value_types)
+                for subject_type, property_, value_types in Queries(graph).multi_value_type_property()
+            }
+        else:
+            value_types_by_type_property = defaultdict(set)
+            for subject, property_, object_ in graph:
+                if subject_types := types_of(subject):
+                    value_types = value_types_of(object_)
+                    for subject_type in subject_types:
+                        value_types_by_type_property[(subject_type, property_)].update(value_types)  # type: ignore[index]
+
+        split_value_types_by_property: dict[URIRef, dict[URIRef, set[URIRef]]] = defaultdict(dict)
+        for (subject_type, property_), value_types in value_types_by_type_property.items():
+            if len(value_types) > 1:
+                split_value_types_by_property[property_][subject_type] = value_types
+
+        self.triples_by_property = {}
+        self.triples_added = self.triples_removed = 0
+        for property_, value_types_by_subject_type in split_value_types_by_property.items():
+            to_remove: list[Triple] = []
+            to_add: list[Triple] = []
+            for subject, object_ in graph.subject_objects(property_):
+                split_value_types = set().union(
+                    *(value_types_by_subject_type.get(subject_type, set()) for subject_type in types_of(subject))
+                )
+                moved = False
+                for value_type in value_types_of(object_):
+                    if value_type in split_value_types:
+                        new_property = URIRef(f"{property_}_{remove_namespace_from_uri(value_type)}")
+                        to_add.append((subject, new_property, object_))  # type: ignore[arg-type]
+                        self.triples_by_property[new_property] = self.triples_by_property.get(new_property, 0) + 1
+                        moved = True
+                if moved:
+                    to_remove.append((subject, property_, object_))  # type: ignore[arg-type]
+
+            for triple in to_remove:
+                graph.remove(triple)
+            self.triples_removed += len(to_remove)
+            self.triples_added += _add_triples(graph, to_add)
+
+
+def _datatype(literal: Literal) -> URIRef:
+    """The datatype of a literal as given by the SPARQL DATATYPE function"""
+    if literal.datatype is not None:
+        return literal.datatype
+    return RDF.langString if literal.language else XSD.string
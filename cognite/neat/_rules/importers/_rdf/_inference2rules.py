@@ -1,12 +1,18 @@
+import random
 from collections import Counter, defaultdict
+from collections.abc import Iterable
 from datetime import datetime
 from pathlib import Path
-from typing import cast
+from typing import TypeAlias, cast
 
-from rdflib import RDF
+from rdflib import RDF, XSD, Graph, URIRef
 from rdflib import Literal as RdfLiteral
+from rdflib.query import ResultRow
+from rdflib.term import Node
 
 from cognite.neat._constants import DEFAULT_NAMESPACE
+from cognite.neat._graph.queries import compile_query
+from cognite.neat._issues import IssueList
 from cognite.neat._issues.warnings import PropertyValueTypeUndefinedWarning
 from cognite.neat._rules.models._base_rules import MatchType
 from cognite.neat._rules.models.data_types import AnyURI
@@ -15,23 +21,30 @@ from cognite.neat._rules.models.information import (
     InformationMetadata,
 )
 from cognite.neat._store import NeatGraphStore
+from cognite.neat._store._statistics import GraphStatistics
+from cognite.neat._utils.collection_ import chunker_iterable
 from cognite.neat._utils.rdf_ import remove_namespace_from_uri
 
 from ._base import DEFAULT_NON_EXISTING_NODE_TYPE, BaseRDFImporter
 
-ORDERED_CLASSES_QUERY = """SELECT ?class (count(?s) as ?instances )
+ORDERED_CLASSES_QUERY = compile_query(
+    """SELECT ?class (count(?s) as ?instances )
                            WHERE { ?s a ?class . }
                            group by ?class order by DESC(?instances)"""
+)
+
+INSTANCES_OF_CLASS_QUERY = """SELECT ?instance WHERE { ?instance a ?class . }"""
 
-INSTANCES_OF_CLASS_QUERY = """SELECT ?s WHERE { ?s a <class> . }"""
+INSTANCES_PROPERTIES_QUERY = """SELECT ?instance ?property ?dataType ?objectType
+                                WHERE {{VALUES ?instance {{ {instances} }}
+                                        ?instance ?property ?value .
 
-INSTANCE_PROPERTIES_DEFINITION = """SELECT ?property (count(?property) as ?occurrence) ?dataType ?objectType
-                                    WHERE {<instance_id> ?property ?value .
+                                        BIND(datatype(?value) AS ?dataType)
 
-                                           BIND(datatype(?value) AS ?dataType)
+                                        OPTIONAL {{?value a ?objectType .}}}}"""
 
-                                           OPTIONAL {?value rdf:type ?objectType .}}
-                                    GROUP BY ?property ?dataType ?objectType"""
+_PropertyRow: TypeAlias = tuple[Node, URIRef, URIRef | None, URIRef | None]
+_PropertyDefinitions: TypeAlias = Counter[tuple[URIRef, URIRef | None, URIRef | None]]
 
 
 class InferenceImporter(BaseRDFImporter):
@@ -44,10 +57,31 @@ class InferenceImporter(BaseRDFImporter):
     Args:
         issue_list: Issue list to store issues
         graph: Knowledge graph
-        max_number_of_instance: Maximum number of instances to be used in inference
+        max_number_of_instance: Maximum number of instances per class to be used in inference
         prefix: Prefix to be used for the inferred model
+        non_existing_node_type: Value type to be used for properties pointing to nodes that are not in the graph
+        sample_instances: If True, the instances used in inference are a uniform random sample of the instances
+            of each class, instead of the first max_number_of_instance instances. The sample is the same
+            every time for the same graph.
     """
 
+    # Number of selected instances whose triples are read with one query
+    _INSTANCES_CHUNK_SIZE = 1_000
+
+    def __init__(
+        self,
+        issue_list: IssueList,
+        graph: Graph,
+        prefix: str,
+        max_number_of_instance: int,
+        non_existing_node_type: UnknownEntity | AnyURI,
+        sample_instances: bool = False,
+    ) -> None:
+        super().__init__(issue_list, graph, prefix, max_number_of_instance, non_existing_node_type)
+        self.sample_instances = sample_instances
+        # Set when created from a graph store, the classes are then read from the statistics of the store.
+        self._statistics: GraphStatistics | None = None
+
     @classmethod
     def from_graph_store(
         cls,
@@ -55,8 +89,12 @@ class InferenceImporter(BaseRDFImporter):
         prefix: str = "inferred",
         max_number_of_instance: int = -1,
         non_existing_node_type: UnknownEntity | AnyURI = DEFAULT_NON_EXISTING_NODE_TYPE,
+        sample_instances: bool = False,
     ) -> "InferenceImporter":
-        return super().from_graph_store(store, prefix, max_number_of_instance, non_existing_node_type)
+        importer = super().from_graph_store(store, prefix, max_number_of_instance, non_existing_node_type)
+        importer.sample_instances = sample_instances
+        importer._statistics = store.statistics
+        return importer
 
     @classmethod
     def from_file(
@@ -65,8 +103,11 @@ class InferenceImporter(BaseRDFImporter):
         prefix: str = "inferred",
         max_number_of_instance: int = -1,
         non_existing_node_type: UnknownEntity | AnyURI = DEFAULT_NON_EXISTING_NODE_TYPE,
+        sample_instances: bool = False,
     ) -> "InferenceImporter":
-        return super().from_file(filepath, prefix, max_number_of_instance, non_existing_node_type)
+        importer = super().from_file(filepath, prefix, max_number_of_instance, non_existing_node_type)
+        importer.sample_instances = sample_instances
+        return importer
 
     @classmethod
     def from_json_file(
@@ -112,7 +153,7 @@ class InferenceImporter(BaseRDFImporter):
         count_by_value_type_by_property: dict[str, dict[str, int]] = defaultdict(Counter)
 
         # Infers all the classes in the graph
-        for class_uri, no_instances in self.graph.query(ORDERED_CLASSES_QUERY):  # type: ignore[misc]
+        for class_uri, no_instances in self._ordered_classes():
             if (class_id := remove_namespace_from_uri(class_uri)) in classes:
                 # handles cases when class id is already present in classes
                 class_id = f"{class_id}_{len(classes)+1}"
@@ -126,15 +167,8 @@ class InferenceImporter(BaseRDFImporter):
 
         # Infers all the properties of the class
         for class_id, class_definition in classes.items():
-            for (instance,) in self.graph.query(  # type: ignore[misc]
-                INSTANCES_OF_CLASS_QUERY.replace("class", class_definition["reference"])
-                if self.max_number_of_instance < 0
-                else INSTANCES_OF_CLASS_QUERY.replace("class", class_definition["reference"])
-                + f" LIMIT {self.max_number_of_instance}"
-            ):
-                for property_uri, occurrence, data_type_uri, object_type_uri in self.graph.query(  # type: ignore[misc]
-                    INSTANCE_PROPERTIES_DEFINITION.replace("instance_id", instance)
-                ):  # type: ignore[misc]
+            for instance_definitions in self._instances_property_definitions(class_definition["reference"]):
+                for (property_uri, data_type_uri, object_type_uri), occurrence in instance_definitions.items():
                     # this is to skip rdf:type property
                     if property_uri == RDF.type:
                         continue
@@ -164,7 +198,7 @@ class InferenceImporter(BaseRDFImporter):
                     definition = {
                         "class_": class_id,
                         "property_": property_id,
-                        "max_count": cast(RdfLiteral, occurrence).value,
+                        "max_count": occurrence,
                         "value_type": value_type_id,
                         "reference": property_uri,
                     }
@@ -220,6 +254,80 @@ class InferenceImporter(BaseRDFImporter):
             "properties": list(properties.values()),
         }
 
+    def _ordered_classes(self) -> list[tuple[URIRef, int]]:
+        """Classes in the graph with their number of instances, ordered by the number of instances."""
+        if self._statistics is not None:
+            return self._statistics.instances_by_type.most_common()
+        return [
+            (cast(URIRef, class_uri), int(no_instances))
+            for class_uri, no_instances in cast(ResultRow, ORDERED_CLASSES_QUERY.run(self.graph))
+        ]
+
+    def _instances_property_definitions(self, class_uri: URIRef) -> Iterable[_PropertyDefinitions]:
+        """Yields the property definitions of the instances of a class.
+
+        The property definitions of an instance are the occurrences of each combination of property, data type
+        and object type. Without a maximum number of instances, the triples of all instances of the class are
+        streamed with a single query ordered by instance. Otherwise, the instances are selected first, and the
+        triples of the selected instances are read in chunks, such that the memory used is bounded by the
+        number of selected instances.
+
+        Args:
+            class_uri: URI of the class
+
+        Returns:
+            Property definitions of the instances. If sample_instances is set, the instances are a random sample
+            of max_number_of_instance instances, selected by reservoir sampling.
+        """
+        for instances in chunker_iterable(self._select_instances(class_uri), self._INSTANCES_CHUNK_SIZE):
+            yield from self._read_property_definitions(instances)
+
+    def _select_instances(self, class_uri: URIRef) -> Iterable[Node]:
+        """Selects the instances of the class, all of them, the first max_number_of_instance or a random sample."""
+        if self.max_number_of_instance < 0 or not self.sample_instances:
+            limit = f" LIMIT {self.max_number_of_instance}" if self.max_number_of_instance >= 0 else ""
+            query = compile_query(INSTANCES_OF_CLASS_QUERY + limit)
+            return (row[0] for row in cast(Iterable[ResultRow], query.run(self.graph, **{"class": class_uri})))
+
+        # Reservoir sampling, seeded by the class such that the sample is reproducible.
+        random_ = random.Random(str(class_uri))
+        reservoir: list[Node] = []
+        query = compile_query(INSTANCES_OF_CLASS_QUERY)
+        for no, (instance,) in enumerate(cast(Iterable[ResultRow], query.run(self.graph, **{"class": class_uri}))):
+            if no < self.max_number_of_instance:
+                reservoir.append(instance)
+            elif (index := random_.randint(0, no)) < self.max_number_of_instance:
+                reservoir[index] = instance
+        return reservoir
+
+    def _read_property_definitions(self, instances: list[Node]) -> Iterable[_PropertyDefinitions]:
+        """Reads the property definitions of the given instances, in the given order."""
+        definitions_by_instance: dict[Node, _PropertyDefinitions] = {instance: Counter() for instance in instances}
+        uris = [instance for instance in instances if isinstance(instance, URIRef)]
+        rows: list[_PropertyRow] = []
+        if uris:
+            query = INSTANCES_PROPERTIES_QUERY.format(instances=" ".join(uri.n3() for uri in uris))
+            rows.extend(cast(Iterable[_PropertyRow], self.graph.query(query)))
+        # Blank nodes cannot be given as values of a query, so their triples are read from the graph.
+        for instance in instances:
+            if not isinstance(instance, URIRef):
+                rows.extend(self._blank_node_property_rows(instance))
+        for instance, property_, data_type, object_type in rows:
+            definitions_by_instance[instance][(property_, data_type, object_type)] += 1
+        return definitions_by_instance.values()
+
+    def _blank_node_property_rows(self, instance: Node) -> Iterable[_PropertyRow]:
+        """The rows of INSTANCES_PROPERTIES_QUERY for a blank node instance."""
+        for property_, value in self.graph.predicate_objects(instance):
+            if isinstance(value, RdfLiteral):
+                # The datatype of a literal, as given by the SPARQL DATATYPE function
+                data_type = value.datatype or (RDF.langString if value.language else XSD.string)
+                yield instance, cast(URIRef, property_), data_type, None
+            else:
+                object_types: list[Node | None] = [*self.graph.objects(value, RDF.type)]
+                for object_type in object_types or [None]:
+                    yield instance, cast(URIRef, property_), None, cast(URIRef | None, object_type)
+
     def _default_metadata(self):
         return InformationMetadata(
             name="Inferred Model",
@@ -1,3 +1,4 @@
+from pathlib import Path
 from typing import Literal, cast
 
 import pandas as pd
@@ -21,15 +22,28 @@ from .exceptions import intercept_session_exceptions
 
 @intercept_session_exceptions
 class NeatSession:
+    """A session for working with data models and instances in neat.
+
+    Args:
+        client: The CogniteClient used to read from and write to CDF.
+        storage: The type of graph store used for the instances. The compact storage is an in-memory store
+            using a fraction of the memory of the memory storage.
+        verbose: Whether to print progress messages.
+        path: Directory used to persist the session. Requires the oxigraph storage. The instances are kept in an
+            on-disk Oxigraph store, and the verified rules and provenance are written next to it. Creating a session
+            with the path of a previous session reopens it, such that only the missing steps have to be re-run.
+    """
+
     def __init__(
         self,
         client: CogniteClient | None = None,
-        storage: Literal["memory", "oxigraph"] = "oxigraph",
+        storage: Literal["memory", "compact", "oxigraph"] = "oxigraph",
         verbose: bool = True,
+        path: str | Path | None = None,
     ) -> None:
         self._client = client
         self._verbose = verbose
-        self._state = SessionState(store_type=storage)
+        self._state = SessionState(store_type=storage, path=Path(path) if path is not None else None)
         self.read = ReadAPI(self._state, client, verbose)
         self.to = ToAPI(self._state, client, verbose)
         self.prepare = PrepareAPI(self._state, verbose)
@@ -40,11 +54,13 @@ class NeatSession:
             self._state.verified_rules.append(output.rules)
             if isinstance(output.rules, InformationRules):
                 self._state.store.add_rules(output.rules)
+            self._state.persist()
         return output.issues
 
     def convert(self, target: Literal["dms"]) -> None:
         converted = ConvertToRules(DMSRules).transform(self._state.last_verified_rule)
         self._state.verified_rules.append(converted.rules)
+        self._state.persist()
         if self._verbose:
             print(f"Rules converted to {target}")
 
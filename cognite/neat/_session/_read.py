@@ -94,6 +94,7 @@ class RDFReadAPI(BaseReadAPI):
 
         elif type.lower() == "Instances".lower():
             self._state.store.write(extractors.RdfFileExtractor(self._return_filepath(io)))
+            self._state.persist()
             return IssueList()
         else:
             raise ValueError(f"Expected data model or instances, got {type}")
@@ -106,4 +107,5 @@ class RDFExamples:
     @property
     def nordic44(self) -> IssueList:
         self._state.store.write(extractors.RdfFileExtractor(instances_examples.nordic44_knowledge_graph))
+        self._state.persist()
         return IssueList()
@@ -1,27 +1,102 @@
+import json
+import warnings
 from dataclasses import dataclass, field
+from pathlib import Path
 from typing import Literal, cast
 
+from cognite.neat._issues.warnings import NeatValueWarning
 from cognite.neat._rules._shared import ReadRules, VerifiedRules
+from cognite.neat._rules.exporters import YAMLExporter
+from cognite.neat._rules.importers import YAMLImporter
 from cognite.neat._rules.models.dms._rules import DMSRules
 from cognite.neat._rules.models.information._rules import InformationRules
 from cognite.neat._rules.models.information._rules_input import InformationInputRules
+from cognite.neat._rules.transformers import VerifyAnyRules
 from cognite.neat._store import NeatGraphStore
+from cognite.neat._store._provenance import Provenance
 
 from .exceptions import NeatSessionError
 
 
 @dataclass
 class SessionState:
-    store_type: Literal["memory", "oxigraph"]
+    """The state of a NeatSession.
+
+    Args:
+        store_type: The type of graph store used for the instances.
+        path: Directory of a persistent session. The instances are stored in an on-disk Oxigraph store in
+            this directory, with the verified rules and the provenance of the store persisted next to it.
+            If the directory contains a previous session, it is reopened.
+    """
+
+    store_type: Literal["memory", "compact", "oxigraph"]
+    path: Path | None = None
     input_rules: list[ReadRules] = field(default_factory=list)
     verified_rules: list[VerifiedRules] = field(default_factory=list)
     _store: NeatGraphStore | None = field(init=False, default=None)
 
+    _STORE_DIR = "oxigraph"
+    _RULES_DIR = "rules"
+    _PROVENANCE_FILE = "provenance.json"
+
+    def __post_init__(self) -> None:
+        if self.path is None:
+            return
+        if self.store_type != "oxigraph":
+            raise NeatSessionError(f"Persistent sessions require the oxigraph storage, got {self.store_type}")
+        self.path.mkdir(parents=True, exist_ok=True)
+        self.verified_rules.extend(self._load_verified_rules(self.path / self._RULES_DIR))
+        # The store is opened eagerly, such that it is set up with the rules of the previous session.
+        self._store = NeatGraphStore.from_oxi_store(
+            storage_dir=self.path / self._STORE_DIR, rules=self.last_verified_information_rules
+        )
+        provenance_file = self.path / self._PROVENANCE_FILE
+        if provenance_file.exists():
+            previous = Provenance.load_records(json.loads(provenance_file.read_text()))
+            self._store.provenance = Provenance([*previous, *self._store.provenance])
+
+    @staticmethod
+    def _load_verified_rules(rules_dir: Path) -> list[VerifiedRules]:
+        verified_rules: list[VerifiedRules] = []
+        for filepath in sorted(rules_dir.glob("*.yaml")):
+            output = VerifyAnyRules("continue").try_transform(YAMLImporter.from_file(filepath).to_rules())
+            if output.rules is None:
+                warnings.warn(
+                    NeatValueWarning(f"Cannot reopen the rules in {filepath.name}, skipping it and all later rules"),
+                    stacklevel=2,
+                )
+                break
+            verified_rules.append(output.rules)
+        return verified_rules
+
+    def persist(self) -> None:
+        """Writes the verified rules and the provenance of the store to the session path.
+
+        This is a no-op for sessions without a path.
+        """
+        if self.path is None:
+            return
+        rules_dir = self.path / self._RULES_DIR
+        rules_dir.mkdir(exist_ok=True)
+        # Verified rules are only appended to the session, thus, existing files are up to date.
+        for no, rules in enumerate(self.verified_rules):
+            filepath = rules_dir / f"{no:03d}_{type(rules).__name__}.yaml"
+            if not filepath.exists():
+                filepath.write_text(YAMLExporter().export(rules), encoding="utf-8")
+
+        if self._store is not None:
+            records = self._store.provenance.dump_records()
+            (self.path / self._PROVENANCE_FILE).write_text(json.dumps(records, indent=2), encoding="utf-8")
+            # Bulk loaded triples bypass the write-ahead log of Oxigraph
+            self._store.graph.store._inner.flush()  # type: ignore[attr-defined]
+
     @property
     def store(self) -> NeatGraphStore:
         if not self.has_store:
             if self.store_type == "oxigraph":
                 self._store = NeatGraphStore.from_oxi_store()
+            elif self.store_type == "compact":
+                self._store = NeatGraphStore.from_compact_store()
             else:
                 self._store = NeatGraphStore.from_memory_store()
         return cast(NeatGraphStore, self._store)
@@ -1,26 +1,49 @@
+import gzip
+import json
 import sys
+import tempfile
 import warnings
-from collections.abc import Iterable
+from collections.abc import Callable, Iterable, Sequence
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, cast
+from typing import IO, Any, cast
+from urllib.parse import quote
 
 import pandas as pd
+import yaml
 from pandas import Index
-from rdflib import Graph, Namespace, URIRef
-from rdflib.plugins.stores.sparqlstore import SPARQLUpdateStore
+from rdflib import BNode, ConjunctiveGraph, Graph, Literal, Namespace, URIRef
+from rdflib.plugins.stores.memory import Memory
+from rdflib.plugins.stores.sparqlstore import SPARQLStore, SPARQLUpdateStore
+from rdflib.query import ResultRow
+from rdflib.term import Node
 
 from cognite.neat._constants import DEFAULT_NAMESPACE
+from cognite.neat._graph._shared import (
+    convert_to_ntriples,
+    open_rdf_file,
+    rdf_file_format,
+    rdflib_to_mime_types,
+    read_ntriples_chunks,
+)
 from cognite.neat._graph.extractors import RdfFileExtractor, TripleExtractors
+from cognite.neat._graph.extractors._classic_cdf._base import ClassicCDFBaseExtractor
 from cognite.neat._graph.models import InstanceType, Triple
-from cognite.neat._graph.queries import Queries
+from cognite.neat._graph.queries import Queries, QueryCache
 from cognite.neat._graph.transformers import Transformers
+from cognite.neat._issues.errors import NeatValueError
 from cognite.neat._rules.analysis import InformationAnalysis
 from cognite.neat._rules.models import InformationRules
 from cognite.neat._rules.models.entities import ClassEntity
+from cognite.neat._rules.models.information._rules_input import InformationInputRules
 from cognite.neat._utils.auxiliary import local_import
+from cognite.neat._utils.collection_ import chunker_iterable
 
-from ._provenance import Change, Provenance
+from ._compact import CompactStore
+from ._provenance import Change, Profiler, Provenance
+from ._sparql import SparqlUpdateWriter
+from ._statistics import GraphStatistics
 
 if sys.version_info < (3, 11):
     from typing_extensions import Self
@@ -35,10 +58,18 @@ class NeatGraphStore:
     Args:
         graph : Instance of rdflib.Graph class for graph storage
         rules:
+
+    The store keeps a statistics index of the graph, see `GraphStatistics`, which is used for the summary of
+    the store instead of scanning the graph every time. The results of the queries of the store are cached in
+    `query_cache`, keyed by the `generation` of the graph, which is incremented by every change the store
+    makes to the graph. Changes made directly on `graph` must be followed by `graph_changed`.
     """
 
     rdf_store_type: str
 
+    # Number of lines of an N-Triples file parsed at a time
+    _NTRIPLES_CHUNK_SIZE = 100_000
+
     def __init__(
         self,
         graph: Graph,
@@ -48,6 +79,12 @@ class NeatGraphStore:
 
         _start = datetime.now(timezone.utc)
         self.graph = graph
+        # A remote SPARQL endpoint can be changed by others, so its statistics are not kept between uses.
+        self.statistics = GraphStatistics(graph, cache=not isinstance(graph.store, SPARQLStore))
+        self.query_cache = QueryCache()
+        self.generation = 0
+        # Writes to a remote SPARQL store go through the writer, when the store has an update endpoint.
+        self.sparql_writer: SparqlUpdateWriter | None = None
         self.provenance = Provenance(
             [
                 Change.record(
@@ -64,7 +101,22 @@ class NeatGraphStore:
         else:
             self.base_namespace = DEFAULT_NAMESPACE
 
-        self.queries = Queries(self.graph, self.rules)
+        self.queries = self._create_queries()
+
+    def _create_queries(self) -> Queries:
+        # A remote SPARQL endpoint can be changed by others, so its query results are not cached.
+        if not self.statistics.cache:
+            return Queries(self.graph, self.rules, self.statistics)
+        return Queries(self.graph, self.rules, self.statistics, self.query_cache, lambda: self.generation)
+
+    def graph_changed(self) -> None:
+        """Discards the statistics and cached query results of the graph store after a direct change of the graph.
+
+        The graph store only sees the changes it makes itself, such as writes and transformations, so this
+        must be called after changing `graph` directly.
+        """
+        self.generation += 1
+        self.statistics.invalidate()
 
     @property
     def type_(self) -> str:
@@ -76,15 +128,18 @@ class NeatGraphStore:
         way to add rules to the graph store, after the graph store has been initialized.
         """
 
+        _start = datetime.now(timezone.utc)
+        profiler = Profiler()
         self.rules = rules
         self.base_namespace = self.rules.metadata.namespace
-        self.queries = Queries(self.graph, self.rules)
+        self.queries = self._create_queries()
         self.provenance.append(
             Change.record(
                 activity=f"{type(self)}.rules",
-                start=datetime.now(timezone.utc),
+                start=_start,
                 end=datetime.now(timezone.utc),
                 description=f"Added rules to graph store as {type(self.rules).__name__}",
+                profile=profiler.stop(triples_added=0, triples_removed=0),
             )
         )
 
@@ -108,7 +163,15 @@ class NeatGraphStore:
 
     @classmethod
     def from_memory_store(cls, rules: InformationRules | None = None) -> "Self":
-        return cls(Graph(identifier=DEFAULT_NAMESPACE), rules)
+        return cls(ConjunctiveGraph(identifier=DEFAULT_NAMESPACE), rules)
+
+    @classmethod
+    def from_compact_store(cls, rules: InformationRules | None = None) -> "Self":
+        """Creates a NeatGraphStore from an in-memory store which keeps the triples as integer ids in NumPy arrays.
+
+        The store uses a fraction of the memory of the default in-memory store, see `CompactStore`.
+        """
+        return cls(ConjunctiveGraph(store=CompactStore(), identifier=DEFAULT_NAMESPACE), rules)
 
     @classmethod
     def from_sparql_store(
@@ -117,7 +180,21 @@ class NeatGraphStore:
         update_endpoint: str | None = None,
         returnFormat: str = "csv",
         rules: InformationRules | None = None,
+        max_concurrent_updates: int = 4,
+        max_retries: int = 3,
     ) -> "Self":
+        """Creates a NeatGraphStore from a remote SPARQL endpoint.
+
+        Triples are written with one `INSERT DATA` update per batch, see `SparqlUpdateWriter`.
+
+        Args:
+            query_endpoint: URL of the SPARQL query endpoint.
+            update_endpoint: URL of the SPARQL update endpoint, by default the store is read-only.
+            returnFormat: Format of the query results requested from the endpoint, by default "csv".
+            rules: Rules of the graph store.
+            max_concurrent_updates: Maximal number of updates sent to the endpoint at the same time, by default 4.
+            max_retries: Number of times a failed update is retried, by default 3.
+        """
         store = SPARQLUpdateStore(
             query_endpoint=query_endpoint,
             update_endpoint=update_endpoint,
@@ -127,7 +204,12 @@ class NeatGraphStore:
             autocommit=False,
         )
         graph = Graph(store=store, identifier=DEFAULT_NAMESPACE)
-        return cls(graph, rules)
+        neat_store = cls(graph, rules)
+        if update_endpoint is not None:
+            neat_store.sparql_writer = SparqlUpdateWriter(
+                update_endpoint, max_workers=max_concurrent_updates, max_retries=max_retries
+            )
+        return neat_store
 
     @classmethod
     def from_oxi_store(cls, storage_dir: Path | None = None, rules: InformationRules | None = None) -> "Self":
@@ -149,19 +231,187 @@ class NeatGraphStore:
         else:
             raise Exception("Error initializing Oxigraph store")
 
-        graph = Graph(
+        graph = ConjunctiveGraph(
             store=oxrdflib.OxigraphStore(store=oxi_store),
             identifier=DEFAULT_NAMESPACE,
         )
 
         return cls(graph, rules)
 
-    def write(self, extractor: TripleExtractors) -> None:
+    _SNAPSHOT_MANIFEST = "manifest.json"
+    _SNAPSHOT_TRIPLES = "triples.nq.gz"
+    _SNAPSHOT_RULES = "rules.yaml"
+    _SNAPSHOT_PROVENANCE = "provenance.json"
+
+    def snapshot(self, path: Path) -> None:
+        """Writes a snapshot of the graph store to a directory.
+
+        The triples are streamed to a gzip compressed N-Quads file, using the native dump of Oxigraph when
+        available. The rules, provenance and namespace bindings of the store are written next to them.
+        The snapshot can be restored with `NeatGraphStore.restore`.
+
+        Args:
+            path: Directory to write the snapshot to. It is created if it does not exist.
+        """
+        _start = datetime.now(timezone.utc)
+        path.mkdir(parents=True, exist_ok=True)
+
+        with gzip.open(path / self._SNAPSHOT_TRIPLES, "wb") as triples_file:
+            # Oxigraph store, do not want to type hint this as it is an optional dependency
+            if type(self.graph.store).__name__ == "OxigraphStore":
+                self.graph.store._inner.dump(triples_file, "application/n-quads")  # type: ignore[attr-defined]
+            else:
+                # N-Triples is a subset of N-Quads, and is used for stores that are not context aware.
+                format_ = "nquads" if isinstance(self.graph, ConjunctiveGraph) else "nt"
+                self.graph.serialize(destination=cast(IO[bytes], triples_file), format=format_)
+
+        rules_file = path / self._SNAPSHOT_RULES
+        if self.rules is not None:
+            rules_file.write_text(
+                yaml.safe_dump(self.rules.dump(mode="json", exclude_none=True, exclude_unset=True)), encoding="utf-8"
+            )
+        elif rules_file.exists():
+            rules_file.unlink()
+
+        self.provenance.append(
+            Change.record(
+                activity=f"{type(self).__name__}.snapshot",
+                start=_start,
+                end=datetime.now(timezone.utc),
+                description=f"Snapshot of graph store written to {path}",
+            )
+        )
+        (path / self._SNAPSHOT_PROVENANCE).write_text(
+            json.dumps(self.provenance.dump_records(), indent=2), encoding="utf-8"
+        )
+        manifest = {
+            "store_type": self.type_,
+            "created": _start.isoformat(),
+            "format": "application/n-quads",
+            "compression": "gzip",
+            "prefixes": {prefix: str(namespace) for prefix, namespace in self.graph.namespaces()},
+        }
+        (path / self._SNAPSHOT_MANIFEST).write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+
+    @classmethod
+    def restore(cls, path: Path, storage_dir: Path | None = None) -> "Self":
+        """Restores a graph store from a snapshot written with `NeatGraphStore.snapshot`.
+
+        The triples are streamed into the store, using the bulk load of Oxigraph when available, without
+        loading the graph into memory first.
+
+        Args:
+            path: Directory of the snapshot.
+            storage_dir: Directory of an on-disk Oxigraph store to restore into. By default, the snapshot is
+                restored into a new in-memory store of the same type as the store the snapshot was taken of.
+
+        Returns:
+            The restored graph store, with the rules and provenance of the snapshot.
+        """
         _start = datetime.now(timezone.utc)
+        manifest_file = path / cls._SNAPSHOT_MANIFEST
+        if not manifest_file.exists():
+            raise NeatValueError(f"No graph store snapshot found in {path}")
+        manifest = json.loads(manifest_file.read_text(encoding="utf-8"))
+
+        if storage_dir is not None or manifest["store_type"] == "OxigraphStore":
+            store = cls.from_oxi_store(storage_dir)
+        elif manifest["store_type"] == "CompactStore":
+            store = cls.from_compact_store()
+        else:
+            store = cls.from_memory_store()
+
+        with gzip.open(path / cls._SNAPSHOT_TRIPLES, "rb") as triples_file:
+            if type(store.graph.store).__name__ == "OxigraphStore":
+                store.graph.store._inner.bulk_load(triples_file, manifest["format"])  # type: ignore[attr-defined]
+            else:
+                store.graph.parse(cast(IO[bytes], triples_file), format="nquads")
+        store.graph_changed()
+
+        for prefix, namespace in manifest["prefixes"].items():
+            store.graph.bind(prefix, Namespace(namespace))
+
+        provenance_file = path / cls._SNAPSHOT_PROVENANCE
+        if provenance_file.exists():
+            restored = Provenance.load_records(json.loads(provenance_file.read_text(encoding="utf-8")))
+            store.provenance = Provenance([*restored, *store.provenance])
+
+        rules_file = path / cls._SNAPSHOT_RULES
+        if rules_file.exists():
+            raw_rules = yaml.safe_load(rules_file.read_text(encoding="utf-8"))
+            store.add_rules(InformationInputRules.load(raw_rules).as_rules())
+
+        store.provenance.append(
+            Change.record(
+                activity=f"{cls.__name__}.restore",
+                start=_start,
+                end=datetime.now(timezone.utc),
+                description=f"Restored graph store from snapshot {path}",
+            )
+        )
+        return store
+
+    def write(
+        self, extractor: TripleExtractors, batch_size: int = 10_000, named_graph: str | URIRef | None = None
+    ) -> None:
+        """Writes the output of an extractor to the graph store.
+
+        Args:
+            extractor: Extractor producing the triples to be written
+            batch_size: Number of triples written to the graph store per batch, by default 10_000.
+                For remote SPARQL stores, every batch is sent as one update.
+                Not used for RdfFileExtractor, files are parsed directly into the graph store.
+            named_graph: Named graph the triples are written to, either a name or the URI of the graph. By default,
+                every run of an extractor is written to a new named graph, named after the extractor.
+                Not used for SPARQL stores, which are not partitioned into named graphs.
+
+        Incremental classic CDF extractors only extract the items updated since the watermark recorded by the
+        last write with the same scope. The triples of these items replace their existing triples in the named
+        graph of the last write.
+        """
+        _start = datetime.now(timezone.utc)
+        profiler = Profiler()
         success = True
+        description = f"Extracted triples to graph store using {type(extractor).__name__}"
+        triples_added: int | None = None
+        triples_removed: int | None = None
+        watermark: int | None = None
+        new_watermark: tuple[str, int] | None = None
+        target_graph = self._named_graph_uri(named_graph) if named_graph is not None else None
+
+        if isinstance(extractor, ClassicCDFBaseExtractor) and extractor.watermark_scope is not None:
+            last_change = self.provenance.last_incremental_change(extractor.watermark_scope)
+            # The watermark is only valid as long as the triples of the last write are still in the store.
+            if (
+                last_change is not None
+                and last_change.watermark is not None
+                and target_graph in (None, last_change.named_graph)
+                and (last_change.named_graph is None or last_change.named_graph in self.named_graphs)
+            ):
+                watermark = last_change.watermark[1]
+                target_graph = last_change.named_graph
+
+        if self._has_named_graphs and target_graph is None:
+            target_graph = self._new_named_graph_uri(type(extractor).__name__)
+        elif not self._has_named_graphs:
+            target_graph = None
 
         if isinstance(extractor, RdfFileExtractor) and not extractor.issue_list.has_errors:
-            self._parse_file(extractor.filepath, cast(str, extractor.mime_type), extractor.base_uri)
+            # Only the memory and compact stores count the triples of a named graph without iterating over
+            # them, which Oxigraph does, or querying a remote endpoint, as SPARQL stores do.
+            number_of_triples_before = (
+                len(self._graph_of(target_graph)) if isinstance(self.graph.store, Memory | CompactStore) else None
+            )
+            self._parse_file(
+                extractor.filepath,
+                cast(str, extractor.mime_type),
+                extractor.base_uri,
+                target_graph,
+                extractor.max_workers,
+            )
+            if number_of_triples_before is not None:
+                triples_added = len(self._graph_of(target_graph)) - number_of_triples_before
+                triples_removed = 0
         elif isinstance(extractor, RdfFileExtractor):
             success = False
             issue_text = "\n".join([issue.as_message() for issue in extractor.issue_list])
@@ -170,7 +420,23 @@ class NeatGraphStore:
                 stacklevel=2,
             )
         else:
-            self._add_triples(extractor.extract())
+            if isinstance(extractor, ClassicCDFBaseExtractor) and watermark is not None:
+                extractor.extract_updated_since(watermark)
+                updated_since = datetime.fromtimestamp(watermark / 1000, timezone.utc)
+                description += f" incrementally, items updated since {updated_since.isoformat()}"
+            triples_added, triples_removed = self._add_triples(
+                extractor.extract(),
+                batch_size=batch_size,
+                replace_subjects=watermark is not None,
+                named_graph=target_graph,
+            )
+            seconds = (datetime.now(timezone.utc) - _start).total_seconds()
+            rate = f", {triples_added / seconds:,.0f} triples/s" if seconds > 0 else ""
+            description += f" ({triples_added:,} triples written{rate})"
+            if isinstance(extractor, ClassicCDFBaseExtractor) and extractor.watermark_scope is not None:
+                last_updated_time = extractor.last_updated_time or watermark
+                if last_updated_time is not None:
+                    new_watermark = (extractor.watermark_scope, last_updated_time)
 
         if success:
             self.provenance.append(
@@ -178,12 +444,102 @@ class NeatGraphStore:
                     activity=f"{type(extractor).__name__}",
                     start=_start,
                     end=datetime.now(timezone.utc),
-                    description=f"Extracted triples to graph store using {type(extractor).__name__}",
+                    description=description,
+                    watermark=new_watermark,
+                    named_graph=target_graph,
+                    profile=profiler.stop(triples_added, triples_removed),
                 )
             )
 
-    def read(self, class_: str) -> Iterable[tuple[str, dict[str | InstanceType, list[str]]]]:
-        """Read instances for given view from the graph store."""
+    @property
+    def _has_named_graphs(self) -> bool:
+        return isinstance(self.graph, ConjunctiveGraph)
+
+    @property
+    def named_graphs(self) -> list[URIRef]:
+        """The named graphs in the graph store which contain triples."""
+        if not isinstance(self.graph, ConjunctiveGraph):
+            return []
+        return [
+            cast(URIRef, context.identifier)
+            for context in self.graph.contexts()
+            if next(iter(context.triples((None, None, None))), None) is not None
+        ]
+
+    @staticmethod
+    def _named_graph_uri(named_graph: str | URIRef) -> URIRef:
+        if isinstance(named_graph, URIRef):
+            return named_graph
+        return DEFAULT_NAMESPACE[f"graph/{quote(named_graph)}"]
+
+    def _new_named_graph_uri(self, name: str) -> URIRef:
+        used = set(self.provenance.named_graphs) | set(self.named_graphs)
+        uri = self._named_graph_uri(name)
+        no = 2
+        while uri in used:
+            uri = self._named_graph_uri(f"{name}-{no}")
+            no += 1
+        return uri
+
+    def drop(self, named_graph: str | URIRef) -> None:
+        """Removes a named graph, and with it all triples written to it, from the graph store.
+
+        Args:
+            named_graph: The name or the URI of the named graph.
+        """
+        _start = datetime.now(timezone.utc)
+        profiler = Profiler()
+        uri = self._named_graph_uri(named_graph)
+        if uri not in self.named_graphs:
+            raise NeatValueError(f"Named graph {uri} not found in graph store")
+        triples_removed = len(self._graph_of(uri))
+
+        if type(self.graph.store).__name__ == "OxigraphStore":
+            local_import("pyoxigraph", "oxi")
+            import pyoxigraph
+
+            cast(pyoxigraph.Store, self.graph.store._inner).remove_graph(pyoxigraph.NamedNode(uri))  # type: ignore[attr-defined]
+        else:
+            cast(ConjunctiveGraph, self.graph).remove_context(cast(ConjunctiveGraph, self.graph).get_context(uri))
+        self.graph_changed()
+
+        self.provenance.append(
+            Change.record(
+                activity=f"{type(self).__name__}.drop",
+                start=_start,
+                end=datetime.now(timezone.utc),
+                description=f"Dropped named graph {uri}",
+                named_graph=uri,
+                profile=profiler.stop(triples_added=0, triples_removed=triples_removed),
+            )
+        )
+
+    def replace(self, named_graph: str | URIRef, extractor: TripleExtractors, batch_size: int = 10_000) -> None:
+        """Replaces the triples of a named graph with the output of an extractor.
+
+        Args:
+            named_graph: The name or the URI of the named graph.
+            extractor: Extractor producing the new triples of the named graph.
+            batch_size: Number of triples written to the graph store per batch, by default 10_000.
+        """
+        if self._named_graph_uri(named_graph) in self.named_graphs:
+            self.drop(named_graph)
+        self.write(extractor, batch_size=batch_size, named_graph=named_graph)
+
+    def read(
+        self,
+        class_: str,
+        page_size: int | None = 10_000,
+        named_graphs: Sequence[str | URIRef] | None = None,
+    ) -> Iterable[tuple[str, dict[str | InstanceType, list[str]]]]:
+        """Read instances for given view from the graph store.
+
+        Args:
+            class_: Class for which instances are to be read
+            page_size: Number of triples fetched per query when reading instances in batches, by default 10_000.
+                If None, instances are read one by one using a DESCRIBE query per instance.
+            named_graphs: Names or URIs of the named graphs to read from. By default, all named graphs are read.
+        """
 
         if not self.rules:
             warnings.warn("Rules not found in graph store!", stacklevel=2)
@@ -202,7 +558,10 @@ class NeatGraphStore:
             )
             return None
 
-        has_hop_transformations = InformationAnalysis(self.rules).has_hop_transformations()
+        # The values of Hop rdfpaths are read from the properties materialized by ReduceHopTraversal
+        has_hop_transformations = InformationAnalysis(
+            self.rules
+        ).has_hop_transformations() and not self.provenance.activity_took_place("ReduceHopTraversal")
         has_self_reference_transformations = InformationAnalysis(
             self.rules
         ).has_self_reference_property_transformations()
@@ -222,8 +581,9 @@ class NeatGraphStore:
             )
             return None
 
-        # get all the instances for give class_uri
-        instance_ids = self.queries.list_instances_ids_of_class(class_uri)
+        queries = self.queries
+        if named_graphs is not None:
+            queries = queries.scope([self._named_graph_uri(named_graph) for named_graph in named_graphs])
 
         # get potential property renaming config
         property_renaming_config = InformationAnalysis(self.rules).define_property_renaming_config(class_entity)
@@ -231,8 +591,21 @@ class NeatGraphStore:
         # get property types to guide process of removing or not namespaces from results
         property_types = InformationAnalysis(self.rules).property_types(class_entity)
 
+        if page_size is not None:
+            yield from queries.describe_instances_of_class(
+                class_uri,
+                instance_type=class_,
+                property_renaming_config=property_renaming_config,
+                property_types=property_types,
+                page_size=page_size,
+            )
+            return None
+
+        # get all the instances for give class_uri, page by page
+        instance_ids = queries.iterate_instances_ids_of_class(class_uri)
+
         for instance_id in instance_ids:
-            if res := self.queries.describe(
+            if res := queries.describe(
                 instance_id=instance_id,
                 instance_type=class_,
                 property_renaming_config=property_renaming_config,
@@ -245,72 +618,234 @@ class NeatGraphStore:
         filepath: Path,
         mime_type: str = "application/rdf+xml",
         base_uri: URIRef | None = None,
+        named_graph: URIRef | None = None,
+        max_workers: int = 1,
     ) -> None:
         """Imports graph data from file.
 
         Args:
-            filepath : File path to file containing graph data, by default None
-            mime_type : MIME type of graph data, by default "application/rdf+xml"
+            filepath : File path to file containing graph data, optionally gzip or bz2 compressed, or
+                directory of such files
+            mime_type : MIME type of graph data, by default "application/rdf+xml". Not used for directories,
+                the MIME type of every file is guessed from its name.
             base_uri : Add base IRI to graph, by default True
+            named_graph : Named graph the data is imported to, by default the default graph of the store
+            max_workers : Number of processes parsing the files of a directory concurrently, by default 1
         """
+        if filepath.is_dir():
+            self._parse_directory(filepath, base_uri, named_graph, max_workers)
 
         # Oxigraph store, do not want to type hint this as it is an optional dependency
-        if type(self.graph.store).__name__ == "OxigraphStore":
-
-            def parse_to_oxi_store():
-                local_import("pyoxigraph", "oxi")
-                import pyoxigraph
-
-                cast(pyoxigraph.Store, self.graph.store._store).bulk_load(
-                    str(filepath),
-                    mime_type,
-                    base_iri=base_uri,
-                    to_graph=pyoxigraph.NamedNode(self.graph.identifier),
-                )
-                cast(pyoxigraph.Store, self.graph.store._store).optimize()
-
-            parse_to_oxi_store()
+        elif type(self.graph.store).__name__ == "OxigraphStore":
+            self._bulk_load_to_oxi_store(filepath, mime_type, base_uri, named_graph)
+            self.graph.store._inner.optimize()  # type: ignore[attr-defined]
 
         # All other stores
         else:
-            if filepath.is_file():
-                self.graph.parse(filepath, publicID=base_uri)
+            rdflib_format, compression = rdf_file_format(filepath)
+            if rdflib_format == "nt":
+                self._parse_ntriples(filepath, named_graph)
+            elif compression is None:
+                self._graph_of(named_graph).parse(filepath, format=rdflib_format, publicID=base_uri)
             else:
-                for filename in filepath.iterdir():
-                    if filename.is_file():
-                        self.graph.parse(filename, publicID=base_uri)
+                with open_rdf_file(filepath) as file:
+                    self._graph_of(named_graph).parse(file, format=rdflib_format, publicID=base_uri)
+        self.graph_changed()
+
+    def _parse_directory(
+        self, directory: Path, base_uri: URIRef | None, named_graph: URIRef | None, max_workers: int
+    ) -> None:
+        files: list[tuple[Path, str]] = []
+        for filepath in sorted(directory.iterdir()):
+            rdflib_format, _ = rdf_file_format(filepath)
+            if filepath.is_file() and rdflib_format and rdflib_to_mime_types(rdflib_format):
+                files.append((filepath, rdflib_format))
+
+        # Oxigraph parses and loads the files with its own streaming parser.
+        if type(self.graph.store).__name__ == "OxigraphStore":
+            for filepath, rdflib_format in files:
+                mime_type = cast(str, rdflib_to_mime_types(rdflib_format))
+                self._bulk_load_to_oxi_store(filepath, mime_type, base_uri, named_graph)
+            self.graph.store._inner.optimize()  # type: ignore[attr-defined]
+            return
+
+        # N-Triples files are parsed in chunks, the other files are parsed in a pool of processes
+        # and passed on as N-Triples files.
+        to_convert = [(filepath, rdflib_format) for filepath, rdflib_format in files if rdflib_format != "nt"]
+        if max_workers > 1 and len(to_convert) > 1:
+            with tempfile.TemporaryDirectory() as temp_dir, ProcessPoolExecutor(max_workers) as pool:
+                jobs = [
+                    pool.submit(
+                        convert_to_ntriples,
+                        filepath,
+                        rdflib_format,
+                        Path(temp_dir) / f"{no}.nt",
+                        str(base_uri) if base_uri else None,
+                    )
+                    for no, (filepath, rdflib_format) in enumerate(to_convert)
+                ]
+                for job in as_completed(jobs):
+                    ntriples_file = job.result()
+                    self._parse_ntriples(ntriples_file, named_graph)
+                    ntriples_file.unlink()
+        else:
+            for filepath, rdflib_format in to_convert:
+                mime_type = cast(str, rdflib_to_mime_types(rdflib_format))
+                self._parse_file(filepath, mime_type, base_uri, named_graph)
+
+        for filepath, rdflib_format in files:
+            if rdflib_format == "nt":
+                self._parse_ntriples(filepath, named_graph)
 
-    def _add_triples(self, triples: Iterable[Triple], batch_size: int = 10_000):
+    def _bulk_load_to_oxi_store(
+        self, filepath: Path, mime_type: str, base_uri: URIRef | None, named_graph: URIRef | None
+    ) -> None:
+        local_import("pyoxigraph", "oxi")
+        import pyoxigraph
+
+        oxi_store = cast(pyoxigraph.Store, self.graph.store._inner)  # type: ignore[attr-defined]
+        to_graph = pyoxigraph.NamedNode(named_graph or self.graph.identifier)
+        if rdf_file_format(filepath)[1] is None:
+            oxi_store.bulk_load(str(filepath), mime_type, base_iri=base_uri, to_graph=to_graph)
+        else:
+            with open_rdf_file(filepath) as file:
+                oxi_store.bulk_load(file, mime_type, base_iri=base_uri, to_graph=to_graph)
+
+    def _parse_ntriples(self, filepath: Path, named_graph: URIRef | None) -> None:
+        # N-Triples has one triple per line, so a large file is parsed in chunks to bound the memory used.
+        # The blank nodes of a file are shared by its chunks.
+        graph = self._graph_of(named_graph)
+        bnode_context: dict[str, BNode] = {}
+        for chunk in read_ntriples_chunks(filepath, self._NTRIPLES_CHUNK_SIZE):
+            graph.parse(data=chunk, format="nt", bnode_context=bnode_context)
+
+    def _graph_of(self, named_graph: URIRef | None) -> Graph:
+        if named_graph is not None and isinstance(self.graph, ConjunctiveGraph):
+            return self.graph.get_context(named_graph)
+        return self.graph
+
+    def _add_triples(
+        self,
+        triples: Iterable[Triple],
+        batch_size: int = 10_000,
+        replace_subjects: bool = False,
+        named_graph: URIRef | None = None,
+    ) -> tuple[int, int]:
         """Adds triples to the graph store in batches.
 
         Args:
             triples: list of triples to be added to the graph store
-            batch_size: Batch size of triples per commit, by default 10_000
-            verbose: Verbose mode, by default False
-        """
+            batch_size: Number of triples written to the graph store per batch, by default 10_000
+            replace_subjects: Whether to remove the existing triples of the subjects before adding the new ones.
+            named_graph: Named graph the triples are added to, by default the default graph of the store.
 
-        commit_counter = 0
+        Returns:
+            Number of triples written to the graph store and number of existing triples removed from it.
+        """
+        if replace_subjects:
+            self.statistics.invalidate()
+        self.generation += 1
+        try:
+            with self.statistics.write() as count_batch:
+                return self._add_triples_in_batches(triples, batch_size, replace_subjects, named_graph, count_batch)
+        finally:
+            self.generation += 1
+
+    def _add_triples_in_batches(
+        self,
+        triples: Iterable[Triple],
+        batch_size: int,
+        replace_subjects: bool,
+        named_graph: URIRef | None,
+        count_batch: Callable[[list[Triple]], None],
+    ) -> tuple[int, int]:
         number_of_written_triples = 0
+        number_of_removed_triples = 0
+        replaced_subjects: set[Node] = set()
+        graph = self._graph_of(named_graph)
+
+        def remove_existing_triples(batch: list[Triple]) -> None:
+            nonlocal number_of_removed_triples
+            # A subject can span several batches, its triples are only removed the first time it is seen.
+            for subject in dict.fromkeys(subject for subject, _, _ in batch):
+                if subject not in replaced_subjects:
+                    replaced_subjects.add(subject)
+                    number_of_removed_triples += sum(1 for _ in graph.triples((subject, None, None)))
+                    graph.remove((subject, None, None))
+
+        # Remote SPARQL store, every batch is sent as one update instead of one request per triple
+        if self.sparql_writer is not None:
+            with self.sparql_writer.updates() as send:
+                for batch in chunker_iterable(triples, batch_size):
+                    delete_subjects: list[Node] = []
+                    if replace_subjects:
+                        delete_subjects = [
+                            subject
+                            for subject in dict.fromkeys(subject for subject, _, _ in batch)
+                            if subject not in replaced_subjects
+                        ]
+                        replaced_subjects.update(delete_subjects)
+                        number_of_removed_triples += self._count_triples_of(delete_subjects)
+                    count_batch(batch)
+                    send(batch, delete_subjects)
+                    number_of_written_triples += len(batch)
+            return number_of_written_triples, number_of_removed_triples
+
+        # Oxigraph store, do not want to type hint this as it is an optional dependency
+        if type(self.graph.store).__name__ == "OxigraphStore":
+            local_import("pyoxigraph", "oxi")
+            import pyoxigraph
+
+            oxi_store = cast(pyoxigraph.Store, self.graph.store._inner)  # type: ignore[attr-defined]
+            graph_name = pyoxigraph.NamedNode(graph.identifier)
+            # Subjects and predicates repeat a lot within a batch, so their conversion is cached.
+            # The cache is keyed on plain strings, as comparing rdflib terms is slow.
+            uris: dict[str, pyoxigraph.NamedNode] = {}
+            blank_nodes: dict[str, pyoxigraph.BlankNode] = {}
+
+            def to_oxi(term: Node) -> Any:
+                if isinstance(term, URIRef):
+                    if (uri := uris.get(key := str(term))) is None:
+                        uri = uris[key] = pyoxigraph.NamedNode(key)
+                    return uri
+                if isinstance(term, Literal):
+                    datatype = pyoxigraph.NamedNode(term.datatype) if term.datatype else None
+                    return pyoxigraph.Literal(term, language=term.language, datatype=datatype)
+                if (blank_node := blank_nodes.get(key := str(term))) is None:
+                    blank_node = blank_nodes[key] = pyoxigraph.BlankNode(key)
+                return blank_node
+
+            for batch in chunker_iterable(triples, batch_size):
+                if replace_subjects:
+                    remove_existing_triples(batch)
+                count_batch(batch)
+                oxi_store.bulk_extend(
+                    [
+                        pyoxigraph.Quad(to_oxi(subject), to_oxi(predicate), to_oxi(object_), graph_name)
+                        for subject, predicate, object_ in batch
+                    ]
+                )
+                number_of_written_triples += len(batch)
+                uris.clear()
+                blank_nodes.clear()
+            return number_of_written_triples, number_of_removed_triples
 
-        def check_commit(force_commit: bool = False):
-            """Commit nodes to the graph if batch counter is reached or if force_commit is True"""
-            nonlocal commit_counter
-            nonlocal number_of_written_triples
-            if force_commit:
-                number_of_written_triples += commit_counter
-                self.graph.commit()
-                return
-            commit_counter += 1
-            if commit_counter >= batch_size:
-                number_of_written_triples += commit_counter
-                self.graph.commit()
-                commit_counter = 0
-
-        for triple in triples:
-            self.graph.add(triple)
-            check_commit()
-
-        check_commit(force_commit=True)
+        # All other stores
+        for batch in chunker_iterable(triples, batch_size):
+            if replace_subjects:
+                remove_existing_triples(batch)
+            count_batch(batch)
+            self.graph.addN((subject, predicate, object_, graph) for subject, predicate, object_ in batch)
+            self.graph.commit()
+            number_of_written_triples += len(batch)
+        return number_of_written_triples, number_of_removed_triples
+
+    def _count_triples_of(self, subjects: list[Node]) -> int:
+        if not subjects:
+            return 0
+        values = " ".join(subject.n3() for subject in subjects)  # type: ignore[attr-defined]
+        query = f"SELECT (COUNT(?p) AS ?count) WHERE {{ VALUES ?s {{ {values} }} ?s ?p ?o }}"
+        return int(cast(ResultRow, next(iter(self.graph.query(query))))[0])
 
     def transform(self, transformer: Transformers) -> None:
         """Transforms the graph store using a transformer."""
@@ -334,13 +869,24 @@ class NeatGraphStore:
 
         else:
             _start = datetime.now(timezone.utc)
-            transformer.transform(self.graph)
+            profiler = Profiler()
+            try:
+                transformer.transform(self.graph)
+            finally:
+                self.graph_changed()
+            description = transformer.description
+            if transformer.triples_added is not None or transformer.triples_removed is not None:
+                description += (
+                    f" ({transformer.triples_added or 0} triples added,"
+                    f" {transformer.triples_removed or 0} triples removed)"
+                )
             self.provenance.append(
                 Change.record(
                     activity=f"{type(transformer).__name__}",
                     start=_start,
                     end=datetime.now(timezone.utc),
-                    description=transformer.description,
+                    description=description,
+                    profile=profiler.stop(transformer.triples_added, transformer.triples_removed),
                 )
             )
 
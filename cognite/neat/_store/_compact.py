@@ -0,0 +1,307 @@
+import struct
+from collections.abc import Generator, Iterable, Iterator
+from itertools import islice
+from typing import Any, cast
+
+import numpy as np
+from rdflib import Graph, URIRef
+from rdflib.graph import DATASET_DEFAULT_GRAPH_ID
+from rdflib.plugins.stores.memory import Memory
+from rdflib.store import Store
+from rdflib.term import Node
+
+# The quads of an index are stored as 16 byte keys, the four term ids of the quad as big-endian unsigned
+# integers in the order of the index. Comparing the keys as bytes is then the same as comparing the ids
+# one by one, so the keys can be sorted and searched with NumPy.
+_ID = np.dtype(">u4")
+_KEY = np.dtype("S16")
+_KEY_STRUCT = struct.Struct(">IIII")
+
+# Position of subject, predicate, object and graph in the keys of each index.
+_ORDERS: dict[str, tuple[int, int, int, int]] = {
+    "spo": (0, 1, 2, 3),
+    "pos": (1, 2, 0, 3),
+    "osp": (2, 0, 1, 3),
+}
+
+
+def _to_keys(quads: np.ndarray, order: tuple[int, int, int, int]) -> np.ndarray:
+    return np.ascontiguousarray(quads[:, order], dtype=_ID).view(_KEY).ravel()
+
+
+def _to_quads(keys: np.ndarray, order: tuple[int, int, int, int]) -> np.ndarray:
+    permuted = np.frombuffer(keys.tobytes(), dtype=_ID).reshape(-1, 4).astype(np.int64)
+    return permuted if order == _ORDERS["spo"] else permuted[:, [order.index(position) for position in range(4)]]
+
+
+class CompactStore(Store):
+    """In-memory RDF store keeping the triples as integer ids in sorted NumPy arrays.
+
+    Every term is stored once in a dictionary, which maps it to an integer id. A quad of subject, predicate,
+    object and graph is then 16 bytes in each of the SPO, POS and OSP indexes, instead of the nested
+    dictionaries of Python objects used by the rdflib Memory store.
+
+    The indexes are sorted arrays, which are searched with binary search. New quads are collected in an
+    append buffer, which is searched by a scan, and merged into the indexes when it grows beyond
+    an eighth of the size of the indexes. Removed quads are marked as removed, and dropped from the
+    indexes when they make up a fourth of them.
+
+    The store implements the rdflib Store API, so it is queried with SPARQL through rdflib.
+    """
+
+    context_aware = True
+    formula_aware = False
+    graph_aware = True
+    transaction_aware = False
+
+    # The smallest number of buffered quads merged into the indexes.
+    _MIN_MERGE_SIZE = 10_000
+
+    def __init__(self, configuration: str | None = None, identifier: URIRef | None = None):
+        super().__init__(configuration, identifier)
+        self._ids: dict[Node, int] = {}
+        self._terms: list[Node] = []
+        self._indexes = {name: np.empty(0, dtype=_KEY) for name in _ORDERS}
+        self._alive = {name: np.empty(0, dtype=bool) for name in _ORDERS}
+        self._number_of_removed = 0
+        # The buffer holds the SPO keys of the quads that are not in the indexes yet.
+        self._buffer: dict[bytes, None] = {}
+        self._buffer_array: np.ndarray | None = None
+        self._graphs: set[int] = set()
+        self._contexts: dict[int, Graph] = {}
+        # The namespace bindings are kept the same way as in the rdflib Memory store.
+        self._namespaces = Memory()
+
+    def add(self, triple: tuple[Node, Node, Node], context: Graph, quoted: bool = False) -> None:
+        if quoted:
+            raise ValueError("CompactStore is not formula aware")
+        subject, predicate, object_ = triple
+        quad = (self._encode(subject), self._encode(predicate), self._encode(object_), self._encode_graph(context))
+        # NumPy drops the trailing null bytes of keys converted to bytes, so the buffer does the same.
+        key = _KEY_STRUCT.pack(*quad).rstrip(b"\x00")
+        if key not in self._buffer and not self._revive(np.array([quad], dtype=np.int64)).all():
+            self._add_to_buffer([key])
+        super().add(triple, context, quoted)
+
+    def addN(self, quads: Iterable[tuple[Node, Node, Node, Any]]) -> None:
+        quads = list(quads)
+        if not quads:
+            return
+        encode = self._encode
+        ids = np.array(
+            [
+                (encode(subject), encode(predicate), encode(object_), self._encode_graph(context))
+                for subject, predicate, object_, context in quads
+            ],
+            dtype=np.int64,
+        )
+        keys = np.unique(_to_keys(ids, _ORDERS["spo"]))
+        ids = _to_quads(keys, _ORDERS["spo"])
+        in_indexes = self._revive(ids)
+        self._add_to_buffer(key for key in keys[~in_indexes].tolist() if key not in self._buffer)
+        for subject, predicate, object_, context in quads:
+            super().add((subject, predicate, object_), context)
+
+    def remove(self, triple: tuple[Node | None, Node | None, Node | None], context: Graph | None = None) -> None:
+        quads = self._match(triple, context)
+        if len(quads):
+            keys = _to_keys(quads, _ORDERS["spo"])
+            in_buffer = np.array([key in self._buffer for key in keys.tolist()], dtype=bool)
+            for key in keys[in_buffer].tolist():
+                del self._buffer[key]
+            if in_buffer.any():
+                self._buffer_array = None
+            self._mark_removed(quads[~in_buffer])
+        super().remove(triple, context)
+
+    def triples(
+        self, triple_pattern: tuple[Node | None, Node | None, Node | None], context: Graph | None = None
+    ) -> Iterator[tuple[tuple[Node, Node, Node], Iterator[Graph]]]:
+        quads = self._match(triple_pattern, context)
+        if not len(quads):
+            return
+        terms = self._terms
+        if context is not None or (quads[:, 3] == quads[0, 3]).all():
+            for subject, predicate, object_, graph in quads.tolist():
+                yield (terms[subject], terms[predicate], terms[object_]), iter([self._context(graph)])
+            return
+
+        # A triple in several graphs is returned once, with all its graphs.
+        quads = quads[np.lexsort((quads[:, 3], quads[:, 2], quads[:, 1], quads[:, 0]))]
+        is_new_triple = np.ones(len(quads), dtype=bool)
+        is_new_triple[1:] = (quads[1:, :3] != quads[:-1, :3]).any(axis=1)
+        starts = np.flatnonzero(is_new_triple).tolist()
+        rows = quads.tolist()
+        for start, end in zip(starts, [*starts[1:], len(rows)], strict=True):
+            subject, predicate, object_, _ = rows[start]
+            graphs = [self._context(row[3]) for row in rows[start:end]]
+            yield (terms[subject], terms[predicate], terms[object_]), iter(graphs)
+
+    def __len__(self, context: Graph | None = None) -> int:
+        quads = self._match((None, None, None), context)
+        if context is not None:
+            return len(quads)
+        # A triple in several graphs is counted once.
+        quads[:, 3] = 0
+        return len(np.unique(_to_keys(quads, _ORDERS["spo"])))
+
+    def contexts(self, triple: tuple[Node, Node, Node] | None = None) -> Generator[Graph, None, None]:
+        graph_ids = set(np.unique(self._match(triple or (None, None, None), None)[:, 3]).tolist())
+        if triple is None:
+            graph_ids |= self._graphs
+        for graph_id in sorted(graph_ids):
+            yield self._context(graph_id)
+
+    def add_graph(self, graph: Graph) -> None:
+        self._graphs.add(self._encode_graph(graph))
+
+    def remove_graph(self, graph: Graph) -> None:
+        self.remove((None, None, None), graph)
+        self._graphs.discard(self._encode_graph(graph))
+
+    def bind(self, prefix: str, namespace: URIRef, override: bool = True) -> None:
+        self._namespaces.bind(prefix, namespace, override)
+
+    def namespace(self, prefix: str) -> URIRef | None:
+        return self._namespaces.namespace(prefix)
+
+    def prefix(self, namespace: URIRef) -> str | None:
+        return self._namespaces.prefix(namespace)
+
+    def namespaces(self) -> Iterator[tuple[str, URIRef]]:
+        return self._namespaces.namespaces()
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__} with {len(self._terms):,} terms>"
+
+    def _encode(self, term: Node) -> int:
+        if (id_ := self._ids.get(term)) is None:
+            id_ = self._ids[term] = len(self._terms)
+            self._terms.append(term)
+        return id_
+
+    def _encode_graph(self, context: Graph | None) -> int:
+        identifier = context.identifier if context is not None else DATASET_DEFAULT_GRAPH_ID
+        return self._encode(cast(Node, identifier))
+
+    def _context(self, graph_id: int) -> Graph:
+        if (context := self._contexts.get(graph_id)) is None:
+            context = self._contexts[graph_id] = Graph(store=self, identifier=cast(URIRef, self._terms[graph_id]))
+        return context
+
+    def _match(self, triple_pattern: tuple[Node | None, Node | None, Node | None], context: Graph | None) -> np.ndarray:
+        """Returns the ids of the quads matching the pattern, one quad per row."""
+        bound: list[int | None] = []
+        for term in triple_pattern:
+            if term is None:
+                bound.append(None)
+            elif (id_ := self._ids.get(term)) is None:
+                return np.empty((0, 4), dtype=np.int64)
+            else:
+                bound.append(id_)
+        if context is not None:
+            if (graph_id := self._ids.get(cast(Node, context.identifier))) is None:
+                return np.empty((0, 4), dtype=np.int64)
+            bound.append(graph_id)
+        else:
+            bound.append(None)
+
+        if len(self._buffer) > max(self._MIN_MERGE_SIZE, len(self._indexes["spo"]) // 8):
+            self._merge_buffer()
+
+        subject, predicate, object_, _ = bound
+        if subject is not None and (predicate is not None or object_ is None):
+            name = "spo"
+        elif predicate is not None:
+            name = "pos"
+        elif object_ is not None:
+            name = "osp"
+        else:
+            name = "spo"
+        order = _ORDERS[name]
+        prefix = []
+        for position in order:
+            if bound[position] is None:
+                break
+            prefix.append(cast(int, bound[position]))
+
+        index = self._indexes[name]
+        alive = self._alive[name]
+        if prefix:
+            start = struct.pack(f">{len(prefix)}I", *prefix)
+            low = np.searchsorted(index, np.array(start, dtype=_KEY), side="left")
+            high = np.searchsorted(index, np.array(start + b"\xff" * (16 - len(start)), dtype=_KEY), side="right")
+            keys = index[low:high][alive[low:high]]
+        else:
+            keys = index[alive]
+        quads = _to_quads(keys, order)
+
+        if self._buffer:
+            buffered = _to_quads(self._get_buffer_array(), _ORDERS["spo"])
+            is_match = np.ones(len(buffered), dtype=bool)
+            for position, id_ in enumerate(bound):
+                if id_ is not None:
+                    is_match &= buffered[:, position] == id_
+            quads = np.concatenate([quads, buffered[is_match]])
+
+        # The prefix only covers the leading bound terms of the order, the others are filtered here.
+        is_match = np.ones(len(quads), dtype=bool)
+        for position, id_ in enumerate(bound):
+            if id_ is not None and position not in order[: len(prefix)]:
+                is_match &= quads[:, position] == id_
+        return quads[is_match]
+
+    def _get_buffer_array(self) -> np.ndarray:
+        if self._buffer_array is None:
+            self._buffer_array = np.array(list(self._buffer), dtype=_KEY)
+        elif len(self._buffer_array) < len(self._buffer):
+            # The buffer is only appended to since the array was created, so the new keys are at the end.
+            new_keys = list(islice(reversed(self._buffer), len(self._buffer) - len(self._buffer_array)))[::-1]
+            self._buffer_array = np.concatenate([self._buffer_array, np.array(new_keys, dtype=_KEY)])
+        return self._buffer_array
+
+    def _add_to_buffer(self, keys: Iterable[bytes]) -> None:
+        self._buffer.update(dict.fromkeys(keys))
+
+    def _find(self, quads: np.ndarray, name: str) -> tuple[np.ndarray, np.ndarray]:
+        """Returns the positions of the quads in an index, and whether they are found there."""
+        index = self._indexes[name]
+        keys = _to_keys(quads, _ORDERS[name])
+        positions = np.searchsorted(index, keys)
+        found = positions < len(index)
+        found[found] = index[positions[found]] == keys[found]
+        return positions, found
+
+    def _revive(self, quads: np.ndarray) -> np.ndarray:
+        """Marks quads in the indexes as not removed, and returns which of the quads are in the indexes."""
+        positions, found = self._find(quads, "spo")
+        if not found.any():
+            return found
+        revived = found & ~self._alive["spo"][np.where(found, positions, 0)]
+        if revived.any():
+            for name in _ORDERS:
+                self._alive[name][self._find(quads[revived], name)[0]] = True
+            self._number_of_removed -= int(revived.sum())
+        return found
+
+    def _mark_removed(self, quads: np.ndarray) -> None:
+        if not len(quads):
+            return
+        for name in _ORDERS:
+            self._alive[name][self._find(quads, name)[0]] = False
+        self._number_of_removed += len(quads)
+        if self._number_of_removed > len(self._indexes["spo"]) // 4:
+            for name in _ORDERS:
+                self._indexes[name] = self._indexes[name][self._alive[name]]
+                self._alive[name] = np.ones(len(self._indexes[name]), dtype=bool)
+            self._number_of_removed = 0
+
+    def _merge_buffer(self) -> None:
+        quads = _to_quads(self._get_buffer_array(), _ORDERS["spo"])
+        for name, order in _ORDERS.items():
+            keys = np.sort(_to_keys(quads, order))
+            positions = np.searchsorted(self._indexes[name], keys)
+            self._indexes[name] = np.insert(self._indexes[name], positions, keys)
+            self._alive[name] = np.insert(self._alive[name], positions, True)
+        self._buffer.clear()
+        self._buffer_array = None
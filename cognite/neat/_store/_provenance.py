@@ -7,12 +7,15 @@
 # Entity: neat graph store
 
 
+import sys
+import time
 import uuid
 from collections.abc import Sequence
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 from datetime import datetime
-from typing import TypeVar
+from typing import Any, TypeVar
 
+import pandas as pd
 from rdflib import PROV, RDF, Literal, URIRef
 
 from cognite.neat._constants import DEFAULT_NAMESPACE
@@ -63,6 +66,54 @@ class Entity:
         ]
 
 
+@dataclass(frozen=True)
+class ActivityProfile:
+    """Resource use of an activity on the graph store.
+
+    Args:
+        cpu_seconds: CPU time used by the process during the activity.
+        peak_rss_increase: Increase of the peak resident set size of the process during the activity, in bytes.
+            None if it is not available on the platform.
+        triples_added: Number of triples added to the graph store, None if not known.
+        triples_removed: Number of triples removed from the graph store, None if not known.
+    """
+
+    cpu_seconds: float
+    peak_rss_increase: int | None = None
+    triples_added: int | None = None
+    triples_removed: int | None = None
+
+
+def _peak_rss() -> int | None:
+    try:
+        import resource
+    except ImportError:
+        # Not available on Windows
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS reports bytes, other platforms kilobytes
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+class Profiler:
+    """Measures the resource use of an activity, from when the profiler is created until it is stopped."""
+
+    def __init__(self) -> None:
+        self._cpu_start = time.process_time()
+        self._peak_rss_start = _peak_rss()
+
+    def stop(self, triples_added: int | None = None, triples_removed: int | None = None) -> ActivityProfile:
+        peak_rss = _peak_rss()
+        return ActivityProfile(
+            cpu_seconds=time.process_time() - self._cpu_start,
+            peak_rss_increase=(
+                peak_rss - self._peak_rss_start if peak_rss is not None and self._peak_rss_start is not None else None
+            ),
+            triples_added=triples_added,
+            triples_removed=triples_removed,
+        )
+
+
 @dataclass(frozen=True)
 class Change(FrozenNeatObject):
     agent: Agent
@@ -73,12 +124,27 @@ class Change(FrozenNeatObject):
     addition: list[tuple[URIRef, URIRef, URIRef | Literal]] | None = None
     # triples that were removed from the graph store
     subtraction: list[tuple[URIRef, URIRef, URIRef | Literal]] | None = None
+    # scope and last updated time, in milliseconds since epoch, of an incremental extraction
+    watermark: tuple[str, int] | None = None
+    # named graph of the graph store the change was made to
+    named_graph: URIRef | None = None
+    # resource use of the activity
+    profile: ActivityProfile | None = None
 
     def as_triples(self):
         return self.agent.as_triples() + self.activity.as_triples() + self.entity.as_triples()
 
     @classmethod
-    def record(cls, activity: str, start: datetime, end: datetime, description: str):
+    def record(
+        cls,
+        activity: str,
+        start: datetime,
+        end: datetime,
+        description: str,
+        watermark: tuple[str, int] | None = None,
+        named_graph: URIRef | None = None,
+        profile: ActivityProfile | None = None,
+    ):
         """User friendly method to record a change that occurred in the graph store."""
         agent = Agent()
         activity = Activity(
@@ -88,7 +154,7 @@ class Change(FrozenNeatObject):
             ended_at_time=end,
         )
         entity = Entity(was_generated_by=activity, was_attributed_to=agent)
-        return cls(agent, activity, entity, description)
+        return cls(agent, activity, entity, description, watermark=watermark, named_graph=named_graph, profile=profile)
 
     def dump(self, aggregate: bool = True) -> dict[str, str]:
         return {
@@ -109,6 +175,88 @@ class Provenance(NeatList[Change]):
     def activity_took_place(self, activity: str) -> bool:
         return any(change.activity.used == activity for change in self)
 
+    def watermark(self, scope: str) -> int | None:
+        """Returns the last recorded watermark of an incremental extraction with the given scope."""
+        if (change := self.last_incremental_change(scope)) is not None and change.watermark is not None:
+            return change.watermark[1]
+        return None
+
+    def last_incremental_change(self, scope: str) -> Change | None:
+        """Returns the last change recording a watermark of an incremental extraction with the given scope."""
+        for change in reversed(self):
+            if change.watermark is not None and change.watermark[0] == scope:
+                return change
+        return None
+
+    @property
+    def named_graphs(self) -> list[URIRef]:
+        """Named graphs the recorded changes were made to, in the order they were first used."""
+        return list(dict.fromkeys(change.named_graph for change in self if change.named_graph is not None))
+
+    def dump_records(self) -> list[dict[str, Any]]:
+        """Dumps the changes to JSON serializable records, used to persist the provenance to disk."""
+        records: list[dict[str, Any]] = []
+        for change in self:
+            record: dict[str, Any] = {
+                "activity": str(change.activity.used),
+                "start": change.activity.started_at_time.isoformat(),
+                "end": change.activity.ended_at_time.isoformat(),
+                "description": change.description,
+            }
+            if change.watermark is not None:
+                record["watermark"] = list(change.watermark)
+            if change.named_graph is not None:
+                record["named_graph"] = str(change.named_graph)
+            if change.profile is not None:
+                record["profile"] = asdict(change.profile)
+            records.append(record)
+        return records
+
+    @classmethod
+    def load_records(cls, records: list[dict[str, Any]]) -> "Provenance":
+        """Loads the changes from records created with `dump_records`."""
+        return cls(
+            [
+                Change.record(
+                    activity=record["activity"],
+                    start=datetime.fromisoformat(record["start"]),
+                    end=datetime.fromisoformat(record["end"]),
+                    description=record["description"],
+                    watermark=(record["watermark"][0], record["watermark"][1]) if "watermark" in record else None,
+                    named_graph=URIRef(record["named_graph"]) if "named_graph" in record else None,
+                    profile=ActivityProfile(**record["profile"]) if "profile" in record else None,
+                )
+                for record in records
+            ]
+        )
+
+    def profile(self) -> pd.DataFrame:
+        """Returns the duration and resource use of the recorded activities, one row per change.
+
+        The CPU time, peak memory increase and number of triples added and removed are only available for
+        changes recorded with a profile, the other changes have missing values.
+        """
+        rows: list[dict[str, Any]] = []
+        for change in self:
+            seconds = (change.activity.ended_at_time - change.activity.started_at_time).total_seconds()
+            profile = change.profile
+            row: dict[str, Any] = {
+                "Activity": str(change.activity.used),
+                "Start": change.activity.started_at_time,
+                "Seconds": seconds,
+                "CPU seconds": profile.cpu_seconds if profile else None,
+                "Triples added": profile.triples_added if profile else None,
+                "Triples removed": profile.triples_removed if profile else None,
+                "Triples/s": None,
+                "Peak RSS increase [MiB]": (
+                    profile.peak_rss_increase / 1024**2 if profile and profile.peak_rss_increase is not None else None
+                ),
+            }
+            if profile and (profile.triples_added is not None or profile.triples_removed is not None) and seconds > 0:
+                row["Triples/s"] = ((profile.triples_added or 0) + (profile.triples_removed or 0)) / seconds
+            rows.append(row)
+        return pd.DataFrame(rows, columns=list(rows[0]) if rows else None)
+
     def __delitem__(self, *args, **kwargs):
         raise TypeError("Cannot delete change from provenance")
 
@@ -0,0 +1,130 @@
+import time
+from collections.abc import Callable, Iterator, Sequence
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextlib import contextmanager
+
+import requests
+from rdflib import BNode
+from rdflib.term import Node
+from requests.adapters import HTTPAdapter
+
+from cognite.neat._graph.models import Triple
+from cognite.neat._issues.errors import NeatValueError
+
+
+class SparqlUpdateWriter:
+    """Writes triples to a remote SPARQL endpoint with batched SPARQL updates.
+
+    Every batch of triples is sent as one `INSERT DATA` update over a pooled keep-alive HTTP session,
+    with up to `max_workers` updates running at the same time. Updates failing with a connection error or
+    a server error are retried with an exponential backoff, an update of inserted triples can be safely
+    sent again.
+
+    Args:
+        update_endpoint: URL of the SPARQL update endpoint.
+        max_workers: Maximal number of updates sent at the same time, by default 4.
+        max_retries: Number of times a failed update is retried, by default 3.
+        retry_delay: Seconds waited before the first retry, doubled for every following retry, by default 1.0.
+        timeout: Seconds to wait for the response to an update, by default 300.
+    """
+
+    # Server errors and rate limiting are worth a retry, other errors are caused by the update itself.
+    _RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+    def __init__(
+        self,
+        update_endpoint: str,
+        max_workers: int = 4,
+        max_retries: int = 3,
+        retry_delay: float = 1.0,
+        timeout: float = 300.0,
+    ) -> None:
+        if max_workers < 1:
+            raise ValueError(f"max_workers must be a positive integer, got {max_workers}")
+        self.update_endpoint = update_endpoint
+        self.max_workers = max_workers
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
+        self.timeout = timeout
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max_workers)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+
+    @contextmanager
+    def updates(self) -> Iterator[Callable[[list[Triple], Sequence[Node]], None]]:
+        """Sends updates to the endpoint until the context is exited.
+
+        Yields a function taking a batch of triples to insert and the subjects whose existing triples are
+        deleted before the insert. The function returns as soon as the update is handed to a worker, and only
+        blocks while `max_workers` updates are running. An update deleting triples waits for the running
+        updates, and the next updates wait for it, so that triples inserted by earlier batches are never deleted.
+        On exit, the running updates are waited for, and the first failed update is raised.
+        """
+        pending: set[Future] = set()
+
+        def wait_for(return_when: str) -> None:
+            done, not_done = wait(pending, return_when=return_when)
+            pending.intersection_update(not_done)
+            for future in done:
+                future.result()
+
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="neat-sparql") as executor:
+
+            def send(batch: list[Triple], delete_subjects: Sequence[Node]) -> None:
+                if delete_subjects:
+                    wait_for("ALL_COMPLETED")
+                    self._post(self._delete_update(delete_subjects) + " ;\n" + self._insert_update(batch))
+                    return
+                if len(pending) >= self.max_workers:
+                    wait_for(FIRST_COMPLETED)
+                pending.add(executor.submit(self._post, self._insert_update(batch)))
+
+            try:
+                yield send
+                wait_for("ALL_COMPLETED")
+            finally:
+                for future in pending:
+                    future.cancel()
+
+    @classmethod
+    def _insert_update(cls, batch: list[Triple]) -> str:
+        triples = "\n".join(
+            f"{cls._to_sparql(subject)} {cls._to_sparql(predicate)} {cls._to_sparql(object_)} ."
+            for subject, predicate, object_ in batch
+        )
+        return f"INSERT DATA {{\n{triples}\n}}"
+
+    @classmethod
+    def _delete_update(cls, subjects: Sequence[Node]) -> str:
+        values = " ".join(cls._to_sparql(subject) for subject in subjects)
+        return f"DELETE {{ ?s ?p ?o }} WHERE {{ VALUES ?s {{ {values} }} ?s ?p ?o }}"
+
+    @staticmethod
+    def _to_sparql(term: Node) -> str:
+        # Blank nodes are scoped to a single update, so they would not be the same node across batches.
+        if isinstance(term, BNode):
+            raise NeatValueError(f"Cannot write blank node {term} to a remote SPARQL store")
+        return term.n3()  # type: ignore[attr-defined]
+
+    def _post(self, update: str) -> None:
+        for attempt in range(self.max_retries + 1):
+            try:
+                response = self._session.post(
+                    self.update_endpoint,
+                    data=update.encode("utf-8"),
+                    headers={"Content-Type": "application/sparql-update; charset=utf-8"},
+                    timeout=self.timeout,
+                )
+            except (requests.ConnectionError, requests.Timeout):
+                if attempt == self.max_retries:
+                    raise
+            else:
+                if response.status_code not in self._RETRY_STATUS_CODES or attempt == self.max_retries:
+                    response.raise_for_status()
+                    return
+            time.sleep(self.retry_delay * 2**attempt)
+
+    def close(self) -> None:
+        """Closes the connections of the HTTP session."""
+        self._session.close()
@@ -0,0 +1,151 @@
+from collections import Counter
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from typing import cast
+
+from rdflib import RDF, Graph, URIRef
+from rdflib import Literal as RdfLiteral
+from rdflib.query import ResultRow
+from rdflib.term import Node
+
+from cognite.neat._constants import UNKNOWN_TYPE
+from cognite.neat._graph.models import Triple
+
+_INSTANCES_BY_TYPE_QUERY = """SELECT ?type (COUNT(?s) AS ?count)
+                              WHERE { ?s a ?type . }
+                              GROUP BY ?type"""
+
+_TRIPLES_BY_PREDICATE_QUERY = """SELECT ?predicate (COUNT(?s) AS ?count)
+                                 WHERE { ?s ?predicate ?o . }
+                                 GROUP BY ?predicate"""
+
+_VALUE_TYPES_QUERY = """SELECT ?sourceType ?property ?valueType (COUNT(?o) AS ?count)
+                        WHERE {{
+                            ?s ?property ?o .
+                            ?s a ?sourceType .
+                            OPTIONAL {{ ?o a ?type }}
+
+                            # Key part to determine value type: either object, data or unknown
+                            BIND(   IF(isLiteral(?o),DATATYPE(?o),
+                                    IF(BOUND(?type), ?type,
+                                                    <{unknownType}>)) AS ?valueType)
+                        }}
+                        GROUP BY ?sourceType ?property ?valueType"""
+
+
+class GraphStatistics:
+    """Statistics index of the triples in a graph store.
+
+    The index holds the number of instances per type, the number of triples per predicate and, per
+    (type, property) pair, a histogram of the value types of the property. The value type is the datatype
+    of a literal, the type of an object, or UNKNOWN_TYPE for objects without a type.
+
+    The statistics are computed from the graph the first time they are needed, and then kept up to date
+    as the graph store writes new subjects. Any other change made by the graph store invalidates the index,
+    and the statistics are computed again on next use. The value type histograms depend on the types of
+    the objects, which can be written after the triples referring to them, so they are recomputed after
+    every change. The index does not see changes made directly on the graph.
+
+    Args:
+        graph: The graph of the graph store.
+        cache: Whether to keep the statistics between uses. Set to False for graphs that can be changed
+            without the graph store seeing it, such as remote SPARQL endpoints.
+    """
+
+    def __init__(self, graph: Graph, cache: bool = True):
+        self.graph = graph
+        self.cache = cache
+        self._instances_by_type: Counter[URIRef] | None = None
+        self._triples_by_predicate: Counter[URIRef] | None = None
+        self._value_types: dict[tuple[URIRef, URIRef], Counter[URIRef]] | None = None
+
+    @property
+    def instances_by_type(self) -> Counter[URIRef]:
+        """Number of instances per type."""
+        if self._instances_by_type is None or not self.cache:
+            self._compute_counts()
+        return Counter(self._instances_by_type)
+
+    @property
+    def triples_by_predicate(self) -> Counter[URIRef]:
+        """Number of triples per predicate."""
+        if self._triples_by_predicate is None or not self.cache:
+            self._compute_counts()
+        return Counter(self._triples_by_predicate)
+
+    @property
+    def value_types(self) -> dict[tuple[URIRef, URIRef], Counter[URIRef]]:
+        """Number of values per value type, for each (type, property) pair."""
+        if self._value_types is None or not self.cache:
+            self._compute_value_types()
+        return {key: Counter(counts) for key, counts in cast(dict, self._value_types).items()}
+
+    def invalidate(self) -> None:
+        """Discards the statistics, they are computed again on next use."""
+        self._instances_by_type = None
+        self._triples_by_predicate = None
+        self._value_types = None
+
+    @contextmanager
+    def write(self) -> Iterator[Callable[[list[Triple]], None]]:
+        """Keeps the statistics up to date while the graph store writes triples to the graph.
+
+        Yields a function that must be called with every batch of triples before the batch is added.
+        The counts are updated as long as all the subjects in the batches are new to the graph.
+        A subject that is already in the graph invalidates the index.
+        """
+        # The triples of a subject can be split over two consecutive batches.
+        previous_new_subjects: set[Node] = set()
+
+        def count_batch(batch: list[Triple]) -> None:
+            nonlocal previous_new_subjects
+            # Without caching the counts are recomputed on every use, so there is nothing to keep up to date.
+            if not self.cache or self._instances_by_type is None or self._triples_by_predicate is None:
+                return
+            new_subjects: set[Node] = set()
+            for subject in dict.fromkeys(subject for subject, _, _ in batch):
+                if subject not in previous_new_subjects and next(self.graph.triples((subject, None, None)), None):
+                    self.invalidate()
+                    return
+                new_subjects.add(subject)
+
+            for triple in set(batch):
+                subject, predicate, object_ = triple
+                if subject in previous_new_subjects and triple in self.graph:
+                    continue
+                self._triples_by_predicate[predicate] += 1
+                if predicate == RDF.type:
+                    self._instances_by_type[cast(URIRef, object_)] += 1
+            self._value_types = None
+            previous_new_subjects = new_subjects
+
+        try:
+            yield count_batch
+        except Exception:
+            self.invalidate()
+            raise
+
+    def _compute_counts(self) -> None:
+        self._instances_by_type = Counter(
+            {
+                cast(URIRef, type_): cast(RdfLiteral, count).toPython()
+                for type_, count in cast(ResultRow, self.graph.query(_INSTANCES_BY_TYPE_QUERY))
+            }
+        )
+        self._triples_by_predicate = Counter(
+            {
+                cast(URIRef, predicate): cast(RdfLiteral, count).toPython()
+                for predicate, count in cast(ResultRow, self.graph.query(_TRIPLES_BY_PREDICATE_QUERY))
+            }
+        )
+
+    def _compute_value_types(self) -> None:
+        value_types: dict[tuple[URIRef, URIRef], Counter[URIRef]] = {}
+        for source_type, property_, value_type, count in cast(
+            ResultRow, self.graph.query(_VALUE_TYPES_QUERY.format(unknownType=str(UNKNOWN_TYPE)))
+        ):
+            if value_type is None:
+                continue
+            key = (cast(URIRef, source_type), cast(URIRef, property_))
+            value_types.setdefault(key, Counter())[cast(URIRef, value_type)] = cast(RdfLiteral, count).toPython()
+        self._value_types = value_types
@@ -1,5 +1,6 @@
 from collections import Counter
 from collections.abc import Iterable, Sequence
+from itertools import islice
 from typing import TypeVar
 
 T_Element = TypeVar("T_Element")
@@ -17,3 +18,12 @@ def most_occurring_element(list_of_elements: list[T_Element]) -> T_Element:
 def chunker(sequence: Sequence[T_Element], chunk_size: int) -> Iterable[Sequence[T_Element]]:
     for i in range(0, len(sequence), chunk_size):
         yield sequence[i : i + chunk_size]
+
+
+def chunker_iterable(iterable: Iterable[T_Element], chunk_size: int) -> Iterable[list[T_Element]]:
+    """Chunks an iterable of unknown length, consuming it lazily."""
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be a positive integer, got {chunk_size}")
+    iterator = iter(iterable)
+    while chunk := list(islice(iterator, chunk_size)):
+        yield chunk
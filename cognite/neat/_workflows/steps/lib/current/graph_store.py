@@ -1,5 +1,7 @@
+from pathlib import Path
 from typing import ClassVar
 
+from cognite.neat._issues.errors import WorkflowStepNotInitializedError
 from cognite.neat._store import NeatGraphStore
 from cognite.neat._workflows.model import FlowMessage
 from cognite.neat._workflows.steps.data_contracts import (
@@ -8,7 +10,7 @@ from cognite.neat._workflows.steps.data_contracts import (
 )
 from cognite.neat._workflows.steps.step_model import Configurable, Step
 
-__all__ = ["GraphStoreConfiguration"]
+__all__ = ["GraphStoreConfiguration", "GraphStoreSnapshot", "GraphStoreRestore"]
 
 CATEGORY = __name__.split(".")[-1].replace("_", " ").title()
 
@@ -46,3 +48,58 @@ class GraphStoreConfiguration(Step):
             FlowMessage(output_text="Graph store configured successfully"),
             store,
         )
+
+
+class GraphStoreSnapshot(Step):
+    """
+    This step writes a snapshot of the graph store, which can be used as a checkpoint of the workflow
+    """
+
+    description = "This step writes a snapshot of the graph store, including its rules and provenance."
+    version = "private-beta"
+    category = CATEGORY
+    configurables: ClassVar[list[Configurable]] = [
+        Configurable(
+            name="Snapshot path",
+            value="staging/graph_snapshot",
+            label="Relative path of the directory the snapshot is written to",
+        ),
+    ]
+
+    def run(self, store: NeatGraph) -> FlowMessage:  # type: ignore[override, syntax]
+        if self.configs is None or self.data_store_path is None:
+            raise WorkflowStepNotInitializedError(type(self).__name__)
+
+        snapshot_path = self.data_store_path / Path(self.configs["Snapshot path"])
+        store.graph.snapshot(snapshot_path)
+
+        return FlowMessage(output_text=f"Snapshot of graph store written to {self.configs['Snapshot path']}")
+
+
+class GraphStoreRestore(Step):
+    """
+    This step restores the graph store from a snapshot, for example, to resume a workflow from a checkpoint
+    """
+
+    description = "This step restores the graph store from a snapshot, including its rules and provenance."
+    version = "private-beta"
+    category = CATEGORY
+    configurables: ClassVar[list[Configurable]] = [
+        Configurable(
+            name="Snapshot path",
+            value="staging/graph_snapshot",
+            label="Relative path of the directory the snapshot is restored from",
+        ),
+    ]
+
+    def run(self) -> (FlowMessage, NeatGraph):  # type: ignore[override, syntax]
+        if self.configs is None or self.data_store_path is None:
+            raise WorkflowStepNotInitializedError(type(self).__name__)
+
+        snapshot_path = self.data_store_path / Path(self.configs["Snapshot path"])
+        store = NeatGraph(graph=NeatGraphStore.restore(snapshot_path))
+
+        return (
+            FlowMessage(output_text=f"Graph store restored from {self.configs['Snapshot path']}"),
+            store,
+        )
@@ -0,0 +1,115 @@
+"""This script benchmarks the per-node cost of creating DMS nodes in the DMSLoader.
+
+It compares validating every node with the pydantic validation class of the view, which is what the
+loader did before, against the properties parser that the loader uses now. In addition, it measures
+the cost of creating the validation classes of a view against getting them from the cache.
+
+Run it from the root of the repository:
+
+```bash
+python scripts/benchmark_dms_loader.py
+```
+"""
+
+import random
+import time
+from collections.abc import Callable
+from typing import Any
+
+from cognite.client import data_modeling as dm
+from rdflib import XSD, Literal
+from rich import print
+
+from cognite.neat._graph.loaders import DMSLoader
+from cognite.neat._store import NeatGraphStore
+
+NUMBER_OF_NODES = 20_000
+
+
+def _property(name: str, type_: str, is_list: bool = False) -> dict[str, Any]:
+    return {
+        "container": {"space": "my_space", "externalId": "MyContainer", "type": "container"},
+        "containerPropertyIdentifier": name,
+        "type": {"type": type_, "list": is_list},
+        "nullable": True,
+        "autoIncrement": False,
+        "immutable": False,
+        "defaultValue": None,
+    }
+
+
+VIEW = dm.View.load(
+    {
+        "space": "my_space",
+        "externalId": "Pump",
+        "version": "v1",
+        "lastUpdatedTime": 0,
+        "createdTime": 0,
+        "writable": True,
+        "usedFor": "node",
+        "isGlobal": False,
+        "implements": [],
+        "properties": {
+            "name": _property("name", "text"),
+            "description": _property("description", "text"),
+            "capacity": _property("capacity", "float64"),
+            "serialNumber": _property("serialNumber", "int64"),
+            "isActive": _property("isActive", "boolean"),
+            "installed": _property("installed", "timestamp"),
+            "metadata": _property("metadata", "json"),
+            "tags": _property("tags", "text", is_list=True),
+            "location": _property("location", "direct"),
+        },
+    }
+)
+
+
+def create_properties(no: int) -> dict:
+    return {
+        "name": [f"Pump {no}"],
+        "description": [Literal(f"Pump number {no} in the station")],
+        "capacity": [Literal(str(random.uniform(0, 100)), datatype=XSD.double)],
+        "serialNumber": [str(no)],
+        "isActive": ["true"],
+        "installed": ["2024-01-01T12:00:00Z"],
+        "metadata": [f'{{"source": "scada", "id": {no}}}'],
+        "tags": ["pump", f"area_{no % 10}"],
+        "location": [f"station_{no % 100}"],
+    }
+
+
+def measure(function: Callable[[], Any], repeat: int = 1) -> float:
+    """Returns the average number of seconds per call of the function."""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        function()
+    return (time.perf_counter() - start) / repeat
+
+
+def main() -> None:
+    loader = DMSLoader(NeatGraphStore.from_memory_store(), None, "my_instance_space")
+    view_id = VIEW.as_id()
+
+    uncached = measure(lambda: loader._create_validation_classes(VIEW), repeat=50)
+    cached = measure(lambda: loader._get_validation_classes(VIEW), repeat=50)
+    print(f"Validation classes of a view: {uncached * 1e3:,.2f} ms created, {cached * 1e3:,.2f} ms cached")
+
+    pydantic_cls, _, _, properties_parser = loader._get_validation_classes(VIEW)
+    properties_list = [create_properties(no) for no in range(NUMBER_OF_NODES)]
+
+    def create_nodes(use_parser: bool) -> None:
+        for properties in properties_list:
+            loader._create_node(
+                "my_node", dict(properties), pydantic_cls, view_id, properties_parser if use_parser else None
+            )
+
+    before = measure(lambda: create_nodes(False)) / NUMBER_OF_NODES
+    after = measure(lambda: create_nodes(True)) / NUMBER_OF_NODES
+    print(
+        f"Per node: {before * 1e6:,.1f} µs with pydantic validation, {after * 1e6:,.1f} µs with the properties "
+        f"parser ({before / after:.1f}x faster)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""This script benchmarks the memory use and throughput of the in-memory graph stores of NeatGraphStore.
+
+It writes the same generated triples to the rdflib Memory store, the CompactStore and an in-memory Oxigraph
+store, and measures the memory used by the triples, the write rate, the rate of triple pattern lookups by
+subject, and the time of a SPARQL query counting the instances per type.
+
+The memory is measured with tracemalloc, which sees the Python objects and NumPy arrays, but not the
+memory allocated natively by Oxigraph, so it is only reported for the rdflib based stores.
+
+Run it from the root of the repository:
+
+```bash
+python scripts/benchmark_graph_stores.py
+```
+"""
+
+import gc
+import random
+import time
+import tracemalloc
+from collections.abc import Callable, Iterable
+
+from rdflib import RDF, XSD, Literal, Namespace
+from rich import print
+
+from cognite.neat._graph.models import Triple
+from cognite.neat._store import NeatGraphStore
+
+NUMBER_OF_INSTANCES = 50_000
+NUMBER_OF_LOOKUPS = 5_000
+EX = Namespace("http://example.org/")
+
+
+def generate_triples() -> Iterable[Triple]:
+    for no in range(NUMBER_OF_INSTANCES):
+        pump = EX[f"pump_{no}"]
+        yield pump, RDF.type, EX.Pump
+        yield pump, EX.name, Literal(f"Pump {no}")
+        yield pump, EX.capacity, Literal(random.uniform(0, 100), datatype=XSD.double)
+        yield pump, EX.serialNumber, Literal(no)
+        yield pump, EX.location, EX[f"station_{no % 100}"]
+        yield pump, EX.connectedTo, EX[f"pump_{(no + 1) % NUMBER_OF_INSTANCES}"]
+
+
+def measure(create_store: Callable[[], NeatGraphStore]) -> dict[str, str]:
+    # Tracing the memory slows down the writes, so the memory and the write rate are measured separately.
+    gc.collect()
+    tracemalloc.start()
+    store = create_store()
+    store._add_triples(generate_triples())
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del store
+    gc.collect()
+
+    store = create_store()
+    start = time.perf_counter()
+    number_of_triples, _ = store._add_triples(generate_triples())
+    write_seconds = time.perf_counter() - start
+
+    subjects = [EX[f"pump_{random.randrange(NUMBER_OF_INSTANCES)}"] for _ in range(NUMBER_OF_LOOKUPS)]
+    start = time.perf_counter()
+    for subject in subjects:
+        for _ in store.graph.triples((subject, None, None)):
+            pass
+    lookup_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    list(store.graph.query("SELECT ?type (COUNT(?s) AS ?count) WHERE { ?s a ?type } GROUP BY ?type"))
+    query_seconds = time.perf_counter() - start
+
+    return {
+        "store": store.type_,
+        "memory": f"{memory / number_of_triples:,.0f} B/triple" if store.type_ != "OxigraphStore" else "native",
+        "write": f"{number_of_triples / write_seconds:,.0f} triples/s",
+        "lookup": f"{NUMBER_OF_LOOKUPS / lookup_seconds:,.0f} subjects/s",
+        "query": f"{query_seconds:,.2f} s",
+    }
+
+
+def main() -> None:
+    random.seed(42)
+    print(f"{NUMBER_OF_INSTANCES * 6:,} triples")
+    for create_store in [
+        NeatGraphStore.from_memory_store,
+        NeatGraphStore.from_compact_store,
+        NeatGraphStore.from_oxi_store,
+    ]:
+        print(measure(create_store))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+import random
+from pathlib import Path
+
+import pytest
+from cognite.client.data_classes import AssetList
+from rdflib import ConjunctiveGraph, Literal, URIRef
+from rdflib.plugins.stores.memory import Memory
+
+from cognite.neat._graph.examples import nordic44_knowledge_graph
+from cognite.neat._graph.extractors import AssetsExtractor, RdfFileExtractor
+from cognite.neat._store import NeatGraphStore
+from cognite.neat._store._compact import CompactStore
+from tests.data import classic_windfarm as windfarm
+
+GRAPHS = [URIRef("http://example.org/default"), URIRef("http://example.org/a"), URIRef("http://example.org/b")]
+
+
+def _random_term(rng: random.Random, position: str) -> URIRef | Literal:
+    no = rng.randint(0, 20)
+    if position == "object" and rng.random() < 0.4:
+        return Literal(no) if rng.random() < 0.5 else Literal(f"value {no}")
+    return URIRef(f"http://example.org/{no}")
+
+
+@pytest.mark.parametrize("merge_size", [5, 10_000])
+def test_compact_store_matches_memory_store(merge_size: int, monkeypatch: pytest.MonkeyPatch) -> None:
+    # A small merge size merges the append buffer into the indexes many times.
+    monkeypatch.setattr(CompactStore, "_MIN_MERGE_SIZE", merge_size)
+    rng = random.Random(42)
+    expected = ConjunctiveGraph(Memory(), identifier=GRAPHS[0])
+    actual = ConjunctiveGraph(CompactStore(), identifier=GRAPHS[0])
+
+    for _ in range(1_500):
+        triple = (_random_term(rng, "subject"), _random_term(rng, "predicate"), _random_term(rng, "object"))
+        pattern = tuple(term if rng.random() < 0.4 else None for term in triple)
+        context = rng.choice(GRAPHS)
+        action = rng.random()
+        for graph in [expected, actual]:
+            if action < 0.4:
+                graph.get_context(context).add(triple)
+            elif action < 0.5:
+                graph.addN([(*triple, graph.get_context(context)), (triple[0], triple[1], triple[1], graph)])
+            elif action < 0.55:
+                graph.remove(pattern)
+            elif action < 0.6:
+                graph.get_context(context).remove(pattern)
+
+        assert set(actual.triples(pattern)) == set(expected.triples(pattern))
+        assert set(actual.get_context(context).triples(pattern)) == set(expected.get_context(context).triples(pattern))
+
+    assert len(actual) == len(expected)
+    assert {len(actual.get_context(graph)) for graph in GRAPHS} == {
+        len(expected.get_context(graph)) for graph in GRAPHS
+    }
+    query = "SELECT ?p (COUNT(?o) AS ?count) WHERE { ?s ?p ?o } GROUP BY ?p"
+    assert set(actual.query(query)) == set(expected.query(query))
+
+
+def test_compact_graph_store_matches_memory_graph_store(tmp_path: Path) -> None:
+    stores = [NeatGraphStore.from_memory_store(), NeatGraphStore.from_compact_store()]
+    for store in stores:
+        store.write(RdfFileExtractor(nordic44_knowledge_graph, base_uri=URIRef("http://nordic44.com/")))
+        store.write(AssetsExtractor(AssetList([windfarm.root, windfarm.wind_turbine])), named_graph="assets")
+    memory, compact = stores
+
+    assert set(compact.graph) == set(memory.graph)
+    assert set(compact.summary.itertuples(index=False)) == set(memory.summary.itertuples(index=False))
+    assert set(compact.named_graphs) == set(memory.named_graphs)
+
+    compact.drop("assets")
+    memory.drop("assets")
+    assert set(compact.graph) == set(memory.graph)
+
+    compact.snapshot(tmp_path / "snapshot")
+    restored = NeatGraphStore.restore(tmp_path / "snapshot")
+    assert restored.type_ == "CompactStore"
+    assert set(restored.graph) == set(compact.graph)
@@ -0,0 +1,49 @@
+import pytest
+from rdflib import RDF, Literal, URIRef
+
+from cognite.neat._constants import DEFAULT_NAMESPACE
+from cognite.neat._graph.queries import compile_query
+from cognite.neat._issues.errors import NeatValueError
+from cognite.neat._store import NeatGraphStore
+
+NAME_QUERY = compile_query("SELECT ?pump WHERE { ?pump a ?type ; ?name_prop ?name . } ORDER BY ?pump")
+
+
+@pytest.fixture(params=["memory", "oxigraph"])
+def store(request: pytest.FixtureRequest) -> NeatGraphStore:
+    store = NeatGraphStore.from_memory_store() if request.param == "memory" else NeatGraphStore.from_oxi_store()
+    for no, name in enumerate(["Pump 1", 'Pump "2" } ', "Pump 3"]):
+        store.graph.add((DEFAULT_NAMESPACE[f"pump_{no}"], RDF.type, DEFAULT_NAMESPACE.Pump))
+        store.graph.add((DEFAULT_NAMESPACE[f"pump_{no}"], DEFAULT_NAMESPACE.name, Literal(name)))
+    return store
+
+
+def test_run_with_bindings(store: NeatGraphStore) -> None:
+    def pumps(name: str) -> list[URIRef]:
+        rows = NAME_QUERY.run(
+            store.graph, type=DEFAULT_NAMESPACE.Pump, name_prop=DEFAULT_NAMESPACE.name, name=Literal(name)
+        )
+        return [row[0] for row in rows]  # type: ignore[index]
+
+    assert pumps("Pump 1") == [DEFAULT_NAMESPACE.pump_0]
+    # Values are bound as terms, not substituted into the query text
+    assert pumps('Pump "2" } ') == [DEFAULT_NAMESPACE.pump_1]
+    assert pumps("Pump 4") == []
+
+    rows = NAME_QUERY.run(store.graph, type=DEFAULT_NAMESPACE.Pump, name_prop=DEFAULT_NAMESPACE.name)
+    assert len(list(rows)) == 3
+
+    with pytest.raises(NeatValueError):
+        NAME_QUERY.with_values({"type": URIRef("http://example.org/Pump> . ?s ?p ?o . #")})
+
+
+def test_compile_query_once() -> None:
+    text = "ASK WHERE { ?s a ?type }"
+
+    query = compile_query(text)
+
+    assert compile_query(text) is query
+    assert query.prepared is query.prepared
+    assert query.with_values({"type": DEFAULT_NAMESPACE.Pump}) == (
+        f"ASK WHERE {{ VALUES (?type) {{ (<{DEFAULT_NAMESPACE.Pump}>) }} ?s a ?type }}"
+    )
@@ -1,10 +1,14 @@
-from cognite.client.data_classes import AssetList
+from typing import Any, Literal
+
+import pytest
+from cognite.client.data_classes import Asset, AssetList
 from cognite.client.testing import monkeypatch_cognite_client
 
 from cognite.neat._constants import DEFAULT_NAMESPACE
 from cognite.neat._graph.extractors import AssetsExtractor
 from cognite.neat._store import NeatGraphStore
 from tests.config import CLASSIC_CDF_EXTRACTOR_DATA
+from tests.data import classic_windfarm as windfarm
 
 
 def test_asset_extractor_with_lambda_unpacked_metadata():
@@ -53,3 +57,51 @@ def test_asset_extractor_with_packed_metadata():
 
     assert len(store.graph) == 43
     assert len(list(store.graph.query(f"Select ?s Where {{ ?s <{DEFAULT_NAMESPACE['metadata']}> ?m}}"))) == 4
+
+
+@pytest.mark.parametrize("store_type", ["memory", "oxigraph"])
+def test_asset_extractor_incremental(store_type: Literal["memory", "oxigraph"]) -> None:
+    assets = AssetList([windfarm.root, windfarm.wind_turbine, windfarm.wind_turbine2])
+    renamed = Asset.load({**windfarm.wind_turbine.dump(), "name": "WT-01 renamed", "lastUpdatedTime": 100})
+    calls: list[dict[str, Any]] = []
+
+    def list_assets(**kwargs: Any) -> AssetList:
+        calls.append(kwargs)
+        if "last_updated_time" not in kwargs:
+            return assets
+        return AssetList(
+            [asset for asset in [renamed] if asset.last_updated_time >= kwargs["last_updated_time"]["min"]]
+        )
+
+    with monkeypatch_cognite_client() as client_mock:
+        client_mock.assets.aggregate_count.return_value = len(assets)
+        client_mock.assets.side_effect = list_assets
+
+    store = NeatGraphStore.from_memory_store() if store_type == "memory" else NeatGraphStore.from_oxi_store()
+    store.write(AssetsExtractor.from_dataset(client_mock, "source_ds", incremental=True))
+    triple_count = len(store.graph)
+    scope = "AssetsExtractor(data_set=source_ds)"
+    assert store.provenance.watermark(scope) == windfarm.wind_turbine2.last_updated_time
+
+    store.write(AssetsExtractor.from_dataset(client_mock, "source_ds", incremental=True))
+
+    assert calls[-1]["last_updated_time"] == {"min": windfarm.wind_turbine2.last_updated_time}
+    assert store.provenance.watermark(scope) == renamed.last_updated_time
+    turbine = DEFAULT_NAMESPACE[f"Asset_{renamed.id}"]
+    assert {str(name) for name in store.graph.objects(turbine, DEFAULT_NAMESPACE.name)} == {"WT-01 renamed"}
+    # The triples of the updated asset are replaced, not added
+    assert len(store.graph) == triple_count
+    profile = store.provenance[-1].profile
+    assert profile is not None
+    assert profile.triples_added == profile.triples_removed > 0
+
+    # Nothing is updated since the last extraction, the watermark is kept
+    store.write(AssetsExtractor.from_dataset(client_mock, "source_ds", incremental=True))
+    assert store.provenance.watermark(scope) == renamed.last_updated_time
+    assert len(store.graph) == triple_count
+
+    # Dropping the named graph of the extraction invalidates the watermark
+    store.drop(store.provenance.named_graphs[-1])
+    store.write(AssetsExtractor.from_dataset(client_mock, "source_ds", incremental=True))
+    assert "last_updated_time" not in calls[-1]
+    assert len(store.graph) == triple_count
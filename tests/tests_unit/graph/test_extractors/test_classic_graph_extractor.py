@@ -0,0 +1,88 @@
+import pytest
+from cognite.client import CogniteClient
+from cognite.client.data_classes import (
+    AssetList,
+    CountAggregate,
+    DataSetList,
+    EventList,
+    FileMetadataList,
+    LabelDefinitionList,
+    RelationshipList,
+    SequenceList,
+    TimeSeriesList,
+)
+from cognite.client.testing import monkeypatch_cognite_client
+from rdflib import Graph
+
+from cognite.neat._graph.extractors import ClassicGraphExtractor
+from tests.data import classic_windfarm as windfarm
+
+
+def _windfarm_client() -> CogniteClient:
+    def relationships(source_external_ids: list[str], source_types: list[str]) -> RelationshipList:
+        return RelationshipList(
+            [
+                relationship
+                for relationship in windfarm.RELATIONSHIPS
+                if relationship.source_external_id in source_external_ids
+                and relationship.source_type.casefold() in {source_type.casefold() for source_type in source_types}
+            ]
+        )
+
+    def retrieve_assets(external_ids: list[str], ignore_unknown_ids: bool) -> AssetList:
+        return AssetList([asset for asset in windfarm.ASSETS if asset.external_id in external_ids])
+
+    def retrieve_labels(external_id: list[str], ignore_unknown_ids: bool) -> LabelDefinitionList:
+        return LabelDefinitionList([label for label in windfarm.LABELS if label.external_id in external_id])
+
+    def retrieve_data_sets(ids: list[int], ignore_unknown_ids: bool) -> DataSetList:
+        return DataSetList([data_set for data_set in windfarm.DATASETS if data_set.id in ids])
+
+    with monkeypatch_cognite_client() as client_mock:
+        wind_farm_assets = AssetList([windfarm.root, windfarm.wind_turbine, windfarm.wind_turbine2])
+        for api, items in [
+            (client_mock.assets, wind_farm_assets),
+            (client_mock.time_series, TimeSeriesList(windfarm.TIME_SERIES)),
+            (client_mock.sequences, SequenceList(windfarm.SEQUENCES)),
+            (client_mock.events, EventList(windfarm.EVENTS)),
+            (client_mock.files, FileMetadataList(windfarm.FILES)),
+        ]:
+            if api is client_mock.files:
+                api.aggregate.return_value = [CountAggregate(len(items))]
+            else:
+                api.aggregate_count.return_value = len(items)
+            api.return_value = items
+        client_mock.relationships.side_effect = relationships
+        client_mock.assets.retrieve_multiple.side_effect = retrieve_assets
+        client_mock.labels.retrieve.side_effect = retrieve_labels
+        client_mock.data_sets.retrieve_multiple.side_effect = retrieve_data_sets
+    return client_mock
+
+
+@pytest.mark.parametrize("max_workers", [2, 8])
+def test_concurrent_extraction_matches_serial_extraction(max_workers: int) -> None:
+    client = _windfarm_client()
+    serial_extractor = ClassicGraphExtractor(client, root_asset_external_id=windfarm.root.external_id)
+    expected = Graph()
+    for triple in serial_extractor.extract():
+        expected.add(triple)
+
+    extractor = ClassicGraphExtractor(client, root_asset_external_id=windfarm.root.external_id, max_workers=max_workers)
+    actual = Graph()
+    for triple in extractor.extract():
+        actual.add(triple)
+
+    assert set(actual) == set(expected)
+    # The target of the relationships is not under the root asset, and has to be fetched as an end node.
+    assert extractor._target_external_ids_by_type["Asset_"] == {windfarm.metmast.external_id}
+    assert extractor._source_external_ids_by_type == serial_extractor._source_external_ids_by_type
+    assert extractor._labels == serial_extractor._labels
+    assert extractor._data_set_ids == serial_extractor._data_set_ids
+
+
+def test_concurrent_extraction_raises_errors_from_workers() -> None:
+    client = _windfarm_client()
+    client.events.side_effect = RuntimeError("Rate limit exceeded")
+
+    with pytest.raises(RuntimeError, match="Rate limit exceeded"):
+        list(ClassicGraphExtractor(client, root_asset_external_id=windfarm.root.external_id, max_workers=4).extract())
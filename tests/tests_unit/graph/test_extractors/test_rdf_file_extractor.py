@@ -0,0 +1,72 @@
+import bz2
+import gzip
+from pathlib import Path
+
+import pytest
+from rdflib import Graph, Literal, Namespace
+
+from cognite.neat._graph.extractors import RdfFileExtractor
+from cognite.neat._store import NeatGraphStore
+
+EX = Namespace("http://example.org/")
+
+
+def _write_directory(directory: Path) -> Graph:
+    """Writes one graph split over files of different formats and compressions, and returns the graph."""
+    parts = []
+    for no in range(4):
+        part = Graph()
+        for pump in range(25):
+            part.add((EX[f"pump_{no}_{pump}"], EX.name, Literal(f"Pump {no}.{pump}")))
+            part.add((EX[f"pump_{no}_{pump}"], EX.connectedTo, EX[f"pump_{no}_{pump + 1}"]))
+        parts.append(part)
+    directory.mkdir()
+    parts[0].serialize(directory / "part_0.ttl", format="turtle")
+    (directory / "part_1.nt.gz").write_bytes(gzip.compress(parts[1].serialize(format="nt", encoding="utf-8")))
+    (directory / "part_2.rdf.bz2").write_bytes(bz2.compress(parts[2].serialize(format="xml", encoding="utf-8")))
+    parts[3].serialize(directory / "part_3.nt", format="nt")
+    (directory / "README.md").write_text("Not an RDF file")
+
+    expected = Graph()
+    for part in parts:
+        expected += part
+    return expected
+
+
+@pytest.mark.parametrize(
+    "store_type, max_workers",
+    [
+        pytest.param("memory", 1, id="memory"),
+        pytest.param("memory", 2, id="memory-process-pool"),
+        pytest.param("oxigraph", 1, id="oxigraph"),
+    ],
+)
+def test_extract_directory(store_type: str, max_workers: int, tmp_path: Path) -> None:
+    expected = _write_directory(tmp_path / "drop")
+    store = NeatGraphStore.from_memory_store() if store_type == "memory" else NeatGraphStore.from_oxi_store()
+    # Small chunks to read the N-Triples files in several chunks.
+    store._NTRIPLES_CHUNK_SIZE = 10
+
+    extractor = RdfFileExtractor(tmp_path / "drop", max_workers=max_workers)
+    assert not extractor.issue_list.has_errors
+    store.write(extractor)
+
+    assert {(s, p, str(o)) for s, p, o in store.graph} == {(s, p, str(o)) for s, p, o in expected}
+    assert store.named_graphs == [store.provenance[-1].named_graph]
+    # Counting the triples of a named graph in Oxigraph iterates over them, so the count is left out.
+    expected_added = len(expected) if store_type == "memory" else None
+    assert store.provenance[-1].profile.triples_added == expected_added
+
+
+def test_extract_compressed_file(tmp_path: Path) -> None:
+    expected = Graph()
+    expected.add((EX.pump, EX.name, Literal("Pump")))
+    (tmp_path / "graph.ttl.gz").write_bytes(gzip.compress(expected.serialize(format="turtle", encoding="utf-8")))
+    store = NeatGraphStore.from_memory_store()
+
+    extractor = RdfFileExtractor(tmp_path / "graph.ttl.gz")
+    assert extractor.mime_type == "text/turtle"
+    assert extractor.compression == "gzip"
+    store.write(extractor)
+
+    assert set(store.graph) == set(expected)
@@ -1,6 +1,9 @@
+import pytest
 from cognite.client.data_classes import AssetList
 from cognite.client.testing import monkeypatch_cognite_client
+from rdflib import RDF, BNode, Literal
 
+from cognite.neat._constants import DEFAULT_NAMESPACE
 from cognite.neat._graph.extractors import AssetsExtractor
 from cognite.neat._rules.importers import InferenceImporter
 from cognite.neat._rules.transformers import ImporterPipeline
@@ -24,3 +27,70 @@ def test_asset_extractor():
 
     assert len([instance for instance in store.read("Asset")]) == 4
     assert len(store.graph) == 73
+
+
+def test_batched_read_matches_describe_read():
+    store = NeatGraphStore.from_oxi_store()
+    store.write(AssetsExtractor.from_file(CLASSIC_CDF_EXTRACTOR_DATA / "assets.yaml", unpack_metadata=True))
+    store.add_rules(ImporterPipeline.verify(InferenceImporter.from_graph_store(store)))
+
+    def as_comparable(instances):
+        # The order of values of a multi-value property is not defined
+        return {
+            identifier: {key: sorted(values) for key, values in properties.items()}
+            for identifier, properties in instances
+        }
+
+    expected = as_comparable(store.read("Asset", page_size=None))
+
+    assert len(expected) == 4
+    # Small page size forces instances to be split across page boundaries
+    assert as_comparable(store.read("Asset", page_size=7)) == expected
+    assert as_comparable(store.read("Asset")) == expected
+
+
+@pytest.mark.parametrize("store_type", ["memory", "oxigraph"])
+@pytest.mark.parametrize("page_size", [1, 3, 10_000])
+def test_keyset_paging_matches_listing(store_type: str, page_size: int):
+    store = NeatGraphStore.from_memory_store() if store_type == "memory" else NeatGraphStore.from_oxi_store()
+    store.write(AssetsExtractor.from_file(CLASSIC_CDF_EXTRACTOR_DATA / "assets.yaml", unpack_metadata=True))
+    # An instance with more triples than fit in a page, and ids which are not in insertion order
+    pump = DEFAULT_NAMESPACE["Asset_0-pump"]
+    store.graph.add((pump, RDF.type, DEFAULT_NAMESPACE.Asset))
+    for no in range(5):
+        store.graph.add((pump, DEFAULT_NAMESPACE.name, Literal(f"Pump {no}")))
+    asset = DEFAULT_NAMESPACE.Asset
+    queries = store.queries
+
+    ids = list(queries.iterate_instances_ids_of_class(asset, page_size=page_size))
+    rows = list(queries.iterate_instances_of_type(asset, page_size=page_size))
+
+    assert ids == sorted(queries.list_instances_ids_of_class(asset), key=str)
+    assert len(ids) == 5
+    assert sorted(map(tuple, rows)) == sorted(map(tuple, queries.list_instances_of_type(asset)))
+    # The rows of an instance are consecutive
+    instances = [row[0] for row in rows]
+    assert [instance for no, instance in enumerate(instances) if no == 0 or instances[no - 1] != instance] == ids
+
+
+@pytest.mark.parametrize("store_type", ["memory", "oxigraph"])
+def test_paging_includes_blank_node_instances(store_type: str):
+    store = NeatGraphStore.from_memory_store() if store_type == "memory" else NeatGraphStore.from_oxi_store()
+    store.write(AssetsExtractor.from_file(CLASSIC_CDF_EXTRACTOR_DATA / "assets.yaml", unpack_metadata=True))
+    asset = DEFAULT_NAMESPACE.Asset
+    # The assets are identified by IRIs, this one by a blank node
+    blank_node = BNode()
+    store.graph.add((blank_node, RDF.type, asset))
+    store.graph.add((blank_node, DEFAULT_NAMESPACE.name, Literal("Anonymous")))
+    store.graph_changed()
+    store.add_rules(ImporterPipeline.verify(InferenceImporter.from_graph_store(store)))
+    queries = store.queries
+
+    ids = list(queries.iterate_instances_ids_of_class(asset, page_size=2))
+    rows = list(queries.iterate_instances_of_type(asset, page_size=2))
+
+    assert len(ids) == 5
+    assert ids[-1] == blank_node
+    assert sorted(map(tuple, rows)) == sorted(map(tuple, queries.list_instances_of_type(asset)))
+    assert len(list(store.read("Asset", page_size=None))) == 5
+    assert len(list(store.read("Asset", page_size=7))) == 5
@@ -1,9 +1,14 @@
+import random
+import threading
+import time
+
 import pytest
 from cognite.client.data_classes import (
     AssetWrite,
     LabelDefinitionWrite,
     RelationshipWrite,
 )
+from cognite.client.testing import monkeypatch_cognite_client
 from rdflib import URIRef
 
 from cognite.neat._graph.examples import nordic44_knowledge_graph
@@ -83,3 +88,53 @@ class TestAssetLoader:
         assert len(assets) == 630
         assert len(relationships) == 572
         assert assets[0] == loader.orphanage
+
+    def test_pipelined_upload_respects_parent_order(
+        self, asset_rules: AssetRules, asset_store: NeatGraphStore, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(AssetLoader, "_UPLOAD_BATCH_SIZE", 50)
+        lock = threading.Lock()
+        uploaded: set[str] = set()
+        missing_parents: list[str] = []
+
+        def upsert(items: list[AssetWrite], mode: str) -> list[AssetWrite]:
+            external_ids = {item.external_id for item in items}
+            with lock:
+                missing_parents.extend(
+                    item.parent_external_id
+                    for item in items
+                    if item.parent_external_id
+                    and item.parent_external_id not in uploaded
+                    and item.parent_external_id not in external_ids
+                )
+            time.sleep(random.uniform(0, 0.01))
+            with lock:
+                uploaded.update(external_ids)
+            return items
+
+        with monkeypatch_cognite_client() as client:
+            client.assets.upsert.side_effect = upsert
+            client.relationships.upsert.side_effect = lambda items, mode: items
+            client.labels.create.side_effect = lambda items: items
+
+        chain = AssetLoader(asset_store, asset_rules, 1983)
+        # A hierarchy within a single class, where every batch holds the parent of the next one.
+        chain._load = lambda stop_on_exception=False: (  # type: ignore[method-assign]
+            AssetWrite(
+                external_id=f"asset_{no}", name=f"asset_{no}", parent_external_id=f"asset_{no - 1}" if no else None
+            )
+            for no in range(200)
+        )
+        chain.load_into_cdf(client, check_client=False, max_workers=4)
+
+        serial = AssetLoader(asset_store, asset_rules, 1983, use_orphanage=True, use_labels=True).load_into_cdf(
+            client, check_client=False
+        )
+        pipelined = AssetLoader(asset_store, asset_rules, 1983, use_orphanage=True, use_labels=True).load_into_cdf(
+            client, check_client=False, max_workers=4
+        )
+
+        assert missing_parents == []
+        assert [(result.name, result.upserted) for result in pipelined] == [
+            (result.name, result.upserted) for result in serial
+        ]
@@ -1,5 +1,13 @@
+import random
+from collections import OrderedDict
+from typing import Any
+
+from cognite.client import data_modeling as dm
+from rdflib import XSD, Literal, URIRef
+
 from cognite.neat._graph.extractors import AssetsExtractor, RdfFileExtractor
 from cognite.neat._graph.loaders import DMSLoader
+from cognite.neat._graph.models import InstanceType
 from cognite.neat._rules.catalog import imf_attributes
 from cognite.neat._rules.importers import ExcelImporter, InferenceImporter
 from cognite.neat._rules.transformers import ImporterPipeline, InformationToDMS
@@ -40,4 +48,113 @@ def test_imf_attribute_nodes():
     knowledge_nodes = list(loader.load())
 
     assert len(knowledge_nodes) == 56
-    assert knowledge_nodes[0].sources[0].properties["predicate"].startswith("http://")
+    assert knowledge_nodes[0].sources[0].properties["predicate"].startswith(("http://", "https://"))
+
+
+def _property(name: str, type_: str, nullable: bool = True, is_list: bool = False, default: Any = None) -> dict:
+    return {
+        "container": {"space": "my_space", "externalId": "MyContainer", "type": "container"},
+        "containerPropertyIdentifier": name,
+        "type": {"type": type_, "list": is_list},
+        "nullable": nullable,
+        "autoIncrement": False,
+        "immutable": False,
+        "defaultValue": default,
+    }
+
+
+MY_VIEW = dm.View.load(
+    {
+        "space": "my_space",
+        "externalId": "MyView",
+        "version": "v1",
+        "lastUpdatedTime": 0,
+        "createdTime": 0,
+        "writable": True,
+        "usedFor": "node",
+        "isGlobal": False,
+        "implements": [],
+        "properties": {
+            "name": _property("name", "text", nullable=False),
+            "count": _property("count", "int64"),
+            "value": _property("value", "float64", default=1.5),
+            "flag": _property("flag", "boolean"),
+            "timestamp": _property("timestamp", "timestamp"),
+            "day": _property("day", "date"),
+            "metadata": _property("metadata", "json"),
+            "tags": _property("tags", "text", is_list=True),
+            "parent": _property("parent", "direct"),
+            "children": _property("children", "direct", is_list=True),
+            "numbers": _property("numbers", "int32", is_list=True),
+        },
+    }
+)
+
+CANDIDATE_VALUES: dict[str, list[list[Any]]] = {
+    "name": [["pump"], [Literal("pump")], [URIRef("http://example.org/pump")], ["a", "b"], []],
+    "count": [["1"], [Literal("42", datatype=XSD.integer)], [" 7 "], ["1.0"], ["one"], ["1", "2"]],
+    "value": [["1.5"], [Literal("2.5e3", datatype=XSD.double)], ["inf"], ["NaN"], ["1,5"]],
+    "flag": [["true"], ["False"], ["1"], ["yes"], [Literal(True)], ["maybe"]],
+    "timestamp": [["2024-01-01T12:00:00Z"], ["2024-01-01T12:00:00+02:00"], ["2024-01-01"], ["1700000000"], ["x"]],
+    "day": [["2024-01-01"], ["2024-01-01T00:00:00"], ["01.01.2024"]],
+    "metadata": [['{"a": 1}'], ["[1, 2]"], ["not json"], ['{"a": 1}', '{"b": 2}']],
+    "tags": [["a"], ["a", "b"], [Literal("c")]],
+    "parent": [["pump_1"], ["pump_1", "pump_2"]],
+    "children": [["pump_1"], ["pump_1", "pump_2"]],
+    "numbers": [["1"], ["1", "2"], ["1", "two"]],
+}
+
+
+def test_properties_parser_matches_pydantic_validation():
+    loader = DMSLoader(NeatGraphStore.from_memory_store(), None, "my_instance_space")
+    pydantic_cls, _, _, properties_parser = loader._get_validation_classes(MY_VIEW)
+    assert loader._get_validation_classes(MY_VIEW)[0] is pydantic_cls
+
+    random_ = random.Random(42)
+    valid_count = 0
+    for _ in range(1000):
+        properties: dict[str | InstanceType, list[str]] = {
+            prop_name: random_.choice(values)
+            for prop_name, values in CANDIDATE_VALUES.items()
+            # Leave out properties now and then, to check defaults and required properties.
+            if random_.random() < 0.9
+        }
+        try:
+            validated = dict(pydantic_cls.model_validate(properties).model_dump().items())
+        except ValueError:
+            assert properties_parser.parse(properties) is None
+            continue
+
+        valid_count += 1
+        # Valid instances should always take the fast path
+        assert properties_parser.parse(properties) is not None
+        node = loader._create_node("my_node", dict(properties), pydantic_cls, MY_VIEW.as_id(), properties_parser)
+        parsed = node.sources[0].properties
+        assert list(parsed) == list(validated)
+        # Compare the representations, as NaN is not equal to itself
+        assert {key: (type(value), repr(value)) for key, value in parsed.items()} == {
+            key: (type(value), repr(value)) for key, value in validated.items()
+        }
+    assert valid_count > 10
+
+
+def test_validation_classes_are_cached_per_view_definition(monkeypatch) -> None:
+    monkeypatch.setattr(DMSLoader, "_validation_classes_by_key", OrderedDict())
+    monkeypatch.setattr(DMSLoader, "_max_validation_classes", 2)
+    loader = DMSLoader(NeatGraphStore.from_memory_store(), None, "my_instance_space")
+    pydantic_cls = loader._get_validation_classes(MY_VIEW)[0]
+
+    # An updated definition of the view is not served the classes of the previous definition.
+    updated_view = dm.View.load({**MY_VIEW.dump(), "lastUpdatedTime": 1})
+    updated_view.properties["name"] = dm.MappedProperty.load(_property("name", "text"))
+    updated_cls = loader._get_validation_classes(updated_view)[0]
+    assert updated_cls is not pydantic_cls
+    assert updated_cls.model_fields["name"].is_required() is False
+
+    # The least recently used classes are evicted.
+    assert loader._get_validation_classes(MY_VIEW)[0] is pydantic_cls
+    other_view = dm.View.load({**MY_VIEW.dump(), "externalId": "OtherView"})
+    loader._get_validation_classes(other_view)
+    assert loader._get_validation_classes(MY_VIEW)[0] is pydantic_cls
+    assert loader._get_validation_classes(updated_view)[0] is not updated_cls
+    assert len(DMSLoader._validation_classes_by_key) == 2
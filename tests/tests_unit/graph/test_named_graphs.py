@@ -0,0 +1,72 @@
+import pytest
+from cognite.client.data_classes import AssetList, EventList
+from rdflib import RDF
+
+from cognite.neat._constants import DEFAULT_NAMESPACE
+from cognite.neat._graph.extractors import AssetsExtractor, EventsExtractor
+from cognite.neat._issues.errors import NeatValueError
+from cognite.neat._store import NeatGraphStore
+from tests.data import classic_windfarm as windfarm
+
+
+def _create_store(store_type: str) -> NeatGraphStore:
+    return NeatGraphStore.from_memory_store() if store_type == "memory" else NeatGraphStore.from_oxi_store()
+
+
+def _assets_extractor() -> AssetsExtractor:
+    return AssetsExtractor(AssetList([windfarm.root, windfarm.wind_turbine, windfarm.wind_turbine2]))
+
+
+def _events_extractor() -> EventsExtractor:
+    return EventsExtractor(EventList(windfarm.EVENTS))
+
+
+@pytest.mark.parametrize("store_type", ["memory", "oxigraph"])
+def test_write_partitions_store_into_named_graphs(store_type: str) -> None:
+    store = _create_store(store_type)
+    store.write(_assets_extractor())
+    store.write(_events_extractor())
+    store.write(_assets_extractor(), named_graph="assets")
+
+    assets_graph = DEFAULT_NAMESPACE["graph/AssetsExtractor"]
+    events_graph = DEFAULT_NAMESPACE["graph/EventsExtractor"]
+    named_assets_graph = DEFAULT_NAMESPACE["graph/assets"]
+    assert set(store.named_graphs) == {assets_graph, events_graph, named_assets_graph}
+    assert [change.named_graph for change in store.provenance[-3:]] == [assets_graph, events_graph, named_assets_graph]
+
+    asset_type = DEFAULT_NAMESPACE.Asset
+    assert len(store.queries.list_instances_ids_of_class(asset_type)) == 3
+    assert len(store.queries.scope([events_graph]).list_instances_ids_of_class(asset_type)) == 0
+    assert len(store.queries.scope([assets_graph, events_graph]).list_instances_ids_of_class(asset_type)) == 3
+    event_count = len(list(store.graph.subjects(RDF.type, DEFAULT_NAMESPACE.Event)))
+    assert event_count == len(windfarm.EVENTS)
+
+    store.drop(assets_graph)
+
+    assert set(store.named_graphs) == {events_graph, named_assets_graph}
+    assert store.provenance[-1].activity.used == "NeatGraphStore.drop"
+    # The assets are still in the other named graph
+    assert len(store.queries.list_instances_ids_of_class(asset_type)) == 3
+
+    store.drop("assets")
+
+    assert store.named_graphs == [events_graph]
+    assert len(store.queries.list_instances_ids_of_class(asset_type)) == 0
+    assert len(list(store.graph.subjects(RDF.type, DEFAULT_NAMESPACE.Event))) == event_count
+    with pytest.raises(NeatValueError):
+        store.drop("assets")
+
+
+@pytest.mark.parametrize("store_type", ["memory", "oxigraph"])
+def test_replace_named_graph(store_type: str) -> None:
+    store = _create_store(store_type)
+    store.write(_assets_extractor(), named_graph="source")
+    store.write(_events_extractor())
+
+    store.replace("source", AssetsExtractor(AssetList([windfarm.root])))
+
+    source_queries = store.queries.scope([DEFAULT_NAMESPACE["graph/source"]])
+    assert source_queries.list_instances_ids_of_class(DEFAULT_NAMESPACE.Asset) == [
+        DEFAULT_NAMESPACE[f"Asset_{windfarm.root.id}"]
+    ]
+    assert len(list(store.graph.subjects(RDF.type, DEFAULT_NAMESPACE.Event))) == len(windfarm.EVENTS)
@@ -1,4 +1,11 @@
+import pytest
+
+from cognite.neat._graph.extractors import AssetsExtractor
+from cognite.neat._graph.transformers import AddAssetDepth
+from cognite.neat._rules.importers import InferenceImporter
+from cognite.neat._rules.transformers import ImporterPipeline
 from cognite.neat._store import NeatGraphStore
+from tests.config import CLASSIC_CDF_EXTRACTOR_DATA
 
 
 def test_provenance():
@@ -6,3 +13,46 @@ def test_provenance():
 
     assert store.provenance[0].activity.used == "NeatGraphStore.__init__"
     assert store.provenance[0].description == "Initialize graph store as Memory"
+
+
+@pytest.mark.parametrize("store_type", ["memory", "oxigraph"])
+@pytest.mark.parametrize("batch_size", [1, 7, 10_000])
+def test_write_in_batches(store_type: str, batch_size: int):
+    expected_store, store = (
+        (NeatGraphStore.from_memory_store(), NeatGraphStore.from_memory_store())
+        if store_type == "memory"
+        else (NeatGraphStore.from_oxi_store(), NeatGraphStore.from_oxi_store())
+    )
+    for triple in AssetsExtractor.from_file(CLASSIC_CDF_EXTRACTOR_DATA / "assets.yaml").extract():
+        expected_store.graph.add(triple)
+
+    store.write(AssetsExtractor.from_file(CLASSIC_CDF_EXTRACTOR_DATA / "assets.yaml"), batch_size=batch_size)
+
+    assert set(store.graph) == set(expected_store.graph)
+    assert store.provenance[-1].description.startswith(
+        f"Extracted triples to graph store using AssetsExtractor ({len(store.graph):,} triples written, "
+    )
+    assert store.provenance[-1].description.endswith(" triples/s)")
+
+
+@pytest.mark.parametrize("store_type", ["memory", "oxigraph"])
+def test_profile(store_type: str):
+    store = NeatGraphStore.from_memory_store() if store_type == "memory" else NeatGraphStore.from_oxi_store()
+    store.write(AssetsExtractor.from_file(CLASSIC_CDF_EXTRACTOR_DATA / "assets.yaml"), named_graph="assets")
+    number_of_triples = len(store.graph)
+    store.transform(AddAssetDepth())
+    store.add_rules(ImporterPipeline.verify(InferenceImporter.from_graph_store(store)))
+    store.drop("assets")
+
+    profile = store.provenance.profile()
+
+    assert list(profile["Activity"]) == [change.activity.used for change in store.provenance]
+    rows = profile.set_index("Activity")
+    assert rows.loc["AssetsExtractor", "Triples added"] == number_of_triples
+    assert rows.loc["AssetsExtractor", "Triples removed"] == 0
+    assert rows.loc["AddAssetDepth", "Triples added"] == store.provenance[2].profile.triples_added > 0
+    # The transformer writes to the default graph, so the dropped named graph only holds the extracted triples
+    assert rows.loc["NeatGraphStore.drop", "Triples removed"] == number_of_triples
+    assert (rows.loc[["AssetsExtractor", "AddAssetDepth", "NeatGraphStore.drop"], "CPU seconds"] >= 0).all()
+    # The initialization of the store is not profiled
+    assert profile["CPU seconds"].isna().iloc[0]
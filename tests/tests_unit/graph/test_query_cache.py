@@ -0,0 +1,76 @@
+import pytest
+from cognite.client.data_classes import AssetList, EventList
+from rdflib import RDF
+
+from cognite.neat._constants import DEFAULT_NAMESPACE
+from cognite.neat._graph.extractors import AssetsExtractor, EventsExtractor
+from cognite.neat._graph.queries import QueryCache
+from cognite.neat._graph.transformers import AddAssetDepth
+from cognite.neat._store import NeatGraphStore
+from tests.config import CLASSIC_CDF_EXTRACTOR_DATA
+from tests.data import classic_windfarm as windfarm
+
+
+@pytest.mark.parametrize("store_type", ["memory", "oxigraph"])
+def test_query_results_are_cached_until_the_graph_changes(store_type: str) -> None:
+    store = NeatGraphStore.from_memory_store() if store_type == "memory" else NeatGraphStore.from_oxi_store()
+    store.write(AssetsExtractor(AssetList([windfarm.root, windfarm.wind_turbine])))
+
+    assert store.queries.has_type(DEFAULT_NAMESPACE.Asset)
+    assert not store.queries.has_type(DEFAULT_NAMESPACE.Event)
+    assert not store.queries.has_type(DEFAULT_NAMESPACE.Event)
+    info = store.query_cache.info()
+    assert (info.hits, info.misses, info.entries) == (1, 2, 2)
+
+    # Writes by the store, and direct writes to the graph followed by graph_changed, change the generation.
+    store.write(EventsExtractor(EventList(windfarm.EVENTS)))
+    assert store.queries.has_type(DEFAULT_NAMESPACE.Event)
+    store.graph.add((DEFAULT_NAMESPACE.my_pump, RDF.type, DEFAULT_NAMESPACE.Pump))
+    store.graph_changed()
+    assert store.queries.has_type(DEFAULT_NAMESPACE.Pump)
+    assert store.query_cache.hits == 1
+
+    misses = store.query_cache.misses
+    assert store.queries.query(f"ASK WHERE {{ ?s a <{DEFAULT_NAMESPACE.Pump}> }}", use_cache=False) is True
+    assert store.query_cache.misses == misses
+
+
+@pytest.mark.parametrize("store_type", ["memory", "oxigraph"])
+def test_every_change_by_the_store_changes_the_generation(store_type: str) -> None:
+    store = NeatGraphStore.from_memory_store() if store_type == "memory" else NeatGraphStore.from_oxi_store()
+    generations = [store.generation]
+    store.write(AssetsExtractor.from_file(CLASSIC_CDF_EXTRACTOR_DATA / "assets.yaml"), named_graph="assets")
+    generations.append(store.generation)
+    assert store.queries.has_type(DEFAULT_NAMESPACE.Asset)
+
+    store.transform(AddAssetDepth())
+    generations.append(store.generation)
+    store.drop("assets")
+    generations.append(store.generation)
+    assert not store.queries.has_type(DEFAULT_NAMESPACE.Asset)
+
+    # A direct write to the graph is not seen by the store until it is told about it.
+    assert not store.queries.has_type(DEFAULT_NAMESPACE.Pump)
+    store.graph.add((DEFAULT_NAMESPACE.my_pump, RDF.type, DEFAULT_NAMESPACE.Pump))
+    assert not store.queries.has_type(DEFAULT_NAMESPACE.Pump)
+    store.graph_changed()
+    generations.append(store.generation)
+    assert store.queries.has_type(DEFAULT_NAMESPACE.Pump)
+
+    assert generations == sorted(set(generations))
+
+
+def test_query_cache_evicts_least_recently_used_results() -> None:
+    cache = QueryCache(max_entries=2, max_bytes=1_000)
+    cache.put("a", [1])
+    cache.put("b", [2])
+    assert cache.get("a") == [1]
+    cache.put("c", [3])
+
+    assert cache.get("b") is None
+    assert cache.get("a") == [1]
+    assert cache.get("c") == [3]
+
+    cache.put("large", ["x" * 1_000])
+    assert cache.get("large") is None
+    assert cache.info().entries == 2
@@ -0,0 +1,47 @@
+from pathlib import Path
+
+import pytest
+from cognite.client.data_classes import AssetList
+
+from cognite.neat._graph.extractors import AssetsExtractor
+from cognite.neat._rules.importers import InferenceImporter
+from cognite.neat._rules.transformers import ImporterPipeline
+from cognite.neat._store import NeatGraphStore
+from tests.data import classic_windfarm as windfarm
+
+
+@pytest.mark.parametrize("store_type", ["memory", "oxigraph"])
+def test_snapshot_and_restore(store_type: str, tmp_path: Path) -> None:
+    store = NeatGraphStore.from_memory_store() if store_type == "memory" else NeatGraphStore.from_oxi_store()
+    store.write(AssetsExtractor(AssetList([windfarm.root, windfarm.wind_turbine, windfarm.wind_turbine2])))
+    store.write(AssetsExtractor(AssetList([windfarm.measurment_root])), named_graph="measurements")
+    store.add_rules(ImporterPipeline.verify(InferenceImporter.from_graph_store(store)))
+
+    store.snapshot(tmp_path / "snapshot")
+    restored = NeatGraphStore.restore(tmp_path / "snapshot")
+
+    assert restored.type_ == store.type_
+    assert set(restored.graph) == set(store.graph)
+    assert set(restored.named_graphs) == set(store.named_graphs)
+    assert restored.rules == store.rules
+    assert dict(restored.graph.namespaces()) == dict(store.graph.namespaces())
+    activities = [change.activity.used for change in restored.provenance]
+    assert activities[: len(store.provenance)] == [change.activity.used for change in store.provenance]
+    assert activities[-1] == "NeatGraphStore.restore"
+    assert len(list(restored.read("Asset"))) == 4
+    assert [change.profile for change in restored.provenance][: len(store.provenance)] == [
+        change.profile for change in store.provenance
+    ]
+
+
+def test_restore_into_on_disk_store(tmp_path: Path) -> None:
+    store = NeatGraphStore.from_memory_store()
+    store.write(AssetsExtractor(AssetList([windfarm.root, windfarm.wind_turbine])))
+    store.snapshot(tmp_path / "snapshot")
+
+    restored = NeatGraphStore.restore(tmp_path / "snapshot", storage_dir=tmp_path / "store")
+
+    assert restored.type_ == "OxigraphStore"
+    # Oxigraph types plain literals as xsd:string, so the triples are compared by count
+    assert len(restored.graph) == len(store.graph)
+    assert restored.rules is None
@@ -0,0 +1,162 @@
+import json
+import threading
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+from urllib.parse import parse_qs, urlparse
+
+import pyoxigraph
+import pytest
+from cognite.client.data_classes import AssetList
+from rdflib import BNode, Literal, URIRef
+
+from cognite.neat._constants import DEFAULT_NAMESPACE
+from cognite.neat._graph.extractors import AssetsExtractor
+from cognite.neat._issues.errors import NeatValueError
+from cognite.neat._store import NeatGraphStore
+from tests.data import classic_windfarm as windfarm
+
+
+class SparqlServer(ThreadingHTTPServer):
+    """A local SPARQL endpoint backed by an in-memory Oxigraph store.
+
+    Every `fail_every`th update is answered with 503 Service Unavailable.
+    """
+
+    def __init__(self) -> None:
+        super().__init__(("127.0.0.1", 0), SparqlRequestHandler)
+        self.oxi_store = pyoxigraph.Store()
+        self.fail_every = 0
+        self.updates = 0
+        self.connections = 0
+        self._lock = threading.Lock()
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+    def should_fail(self) -> bool:
+        with self._lock:
+            self.updates += 1
+            return self.fail_every > 0 and self.updates % self.fail_every == 0
+
+
+def _to_json(term: Any) -> dict[str, str]:
+    if isinstance(term, pyoxigraph.NamedNode):
+        return {"type": "uri", "value": term.value}
+    if isinstance(term, pyoxigraph.BlankNode):
+        return {"type": "bnode", "value": term.value}
+    return {"type": "literal", "value": term.value, "datatype": term.datatype.value}
+
+
+class SparqlRequestHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server: SparqlServer
+
+    def setup(self) -> None:
+        super().setup()
+        self.server.connections += 1
+
+    def do_GET(self) -> None:
+        query = parse_qs(urlparse(self.path).query)["query"][0]
+        results = self.server.oxi_store.query(query)
+        if isinstance(results, bool):
+            body = {"head": {}, "boolean": results}
+        else:
+            variables = [variable.value for variable in results.variables]
+            bindings = [
+                {variable: _to_json(solution[variable]) for variable in variables if solution[variable] is not None}
+                for solution in results
+            ]
+            body = {"head": {"vars": variables}, "results": {"bindings": bindings}}
+        self._respond(200, json.dumps(body).encode(), "application/sparql-results+json")
+
+    def do_POST(self) -> None:
+        update = self.rfile.read(int(self.headers["Content-Length"])).decode()
+        if self.server.should_fail():
+            self._respond(503, b"Service Unavailable", "text/plain")
+            return
+        self.server.oxi_store.update(update)
+        self._respond(204, b"", "text/plain")
+
+    def _respond(self, status: int, body: bytes, content_type: str) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args: Any) -> None:
+        pass
+
+
+@pytest.fixture()
+def sparql_server() -> Iterator[SparqlServer]:
+    server = SparqlServer()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _sparql_store(server: SparqlServer) -> NeatGraphStore:
+    store = NeatGraphStore.from_sparql_store(
+        query_endpoint=f"{server.url}/query", update_endpoint=f"{server.url}/update", returnFormat="json"
+    )
+    assert store.sparql_writer is not None
+    store.sparql_writer.retry_delay = 0.0
+    return store
+
+
+def test_write_in_batched_updates(sparql_server: SparqlServer) -> None:
+    sparql_server.fail_every = 3
+    store = _sparql_store(sparql_server)
+    expected = NeatGraphStore.from_memory_store()
+    assets = AssetList([windfarm.root, windfarm.wind_turbine, windfarm.wind_turbine2, windfarm.measurment_root])
+    expected.write(AssetsExtractor(assets))
+
+    store.write(AssetsExtractor(assets), batch_size=5)
+
+    number_of_triples = len(expected.graph)
+    assert len(sparql_server.oxi_store) == number_of_triples
+    assert {(str(s), str(p), str(o)) for s, p, o in store.graph} == {
+        (str(s), str(p), str(o)) for s, p, o in expected.graph
+    }
+    batches = -(-number_of_triples // 5)
+    # Every third update fails and is retried, over a few kept-alive connections
+    assert sparql_server.updates == batches + batches // 2
+    assert sparql_server.connections <= 1 + store.sparql_writer.max_workers
+    profile = store.provenance[-1].profile
+    assert profile is not None
+    assert (profile.triples_added, profile.triples_removed) == (number_of_triples, 0)
+
+
+def test_replace_subjects_in_batched_updates(sparql_server: SparqlServer) -> None:
+    store = _sparql_store(sparql_server)
+    pump, other = DEFAULT_NAMESPACE.pump, DEFAULT_NAMESPACE.other
+    store._add_triples([(pump, DEFAULT_NAMESPACE.name, Literal("Pump")), (other, DEFAULT_NAMESPACE.name, Literal("1"))])
+
+    written, removed = store._add_triples(
+        [(pump, DEFAULT_NAMESPACE.name, Literal(f"Pump {no}")) for no in range(7)],
+        batch_size=3,
+        replace_subjects=True,
+    )
+
+    assert (written, removed) == (7, 1)
+    assert {str(name) for name in store.graph.objects(pump, DEFAULT_NAMESPACE.name)} == {
+        f"Pump {no}" for no in range(7)
+    }
+    assert len(sparql_server.oxi_store) == 8
+
+
+def test_failing_update_is_raised(sparql_server: SparqlServer) -> None:
+    sparql_server.fail_every = 1
+    store = _sparql_store(sparql_server)
+
+    with pytest.raises(Exception, match="503"):
+        store._add_triples([(DEFAULT_NAMESPACE.pump, DEFAULT_NAMESPACE.name, Literal("Pump"))])
+    assert sparql_server.updates == 1 + store.sparql_writer.max_retries
+
+    with pytest.raises(NeatValueError):
+        store._add_triples([(BNode(), DEFAULT_NAMESPACE.name, URIRef("http://example.org/pump"))])
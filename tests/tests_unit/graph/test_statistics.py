@@ -0,0 +1,96 @@
+import pytest
+from cognite.client.data_classes import AssetList, EventList
+from rdflib import RDF, Literal
+
+from cognite.neat._constants import DEFAULT_NAMESPACE
+from cognite.neat._graph.extractors import AssetsExtractor, EventsExtractor
+from cognite.neat._graph.queries import Queries
+from cognite.neat._store import NeatGraphStore
+from cognite.neat._store._statistics import GraphStatistics
+from tests.data import classic_windfarm as windfarm
+
+
+def _create_store(store_type: str) -> NeatGraphStore:
+    return NeatGraphStore.from_memory_store() if store_type == "memory" else NeatGraphStore.from_oxi_store()
+
+
+def _assert_statistics_match_graph(store: NeatGraphStore) -> None:
+    scanned = GraphStatistics(store.graph, cache=False)
+    assert store.statistics.instances_by_type == scanned.instances_by_type
+    assert store.statistics.triples_by_predicate == scanned.triples_by_predicate
+    assert store.statistics.value_types == scanned.value_types
+
+
+@pytest.mark.parametrize("store_type", ["memory", "oxigraph"])
+def test_statistics_are_updated_by_writes(store_type: str) -> None:
+    store = _create_store(store_type)
+    assert store.statistics.instances_by_type == {}
+
+    # A small batch size splits the triples of the assets over several batches.
+    store.write(AssetsExtractor(AssetList([windfarm.root, windfarm.wind_turbine, windfarm.wind_turbine2])), 7)
+    assert store.statistics._instances_by_type is not None
+    _assert_statistics_match_graph(store)
+
+    store.write(EventsExtractor(EventList(windfarm.EVENTS)), batch_size=5)
+    # The events are new subjects, so the index is updated instead of invalidated.
+    assert store.statistics._instances_by_type is not None
+    _assert_statistics_match_graph(store)
+    assert store.statistics.instances_by_type[DEFAULT_NAMESPACE.Event] == len(windfarm.EVENTS)
+
+    # Writing the same assets again updates existing subjects, which invalidates the index.
+    store.write(AssetsExtractor(AssetList([windfarm.root])), named_graph="assets")
+    assert store.statistics._instances_by_type is None
+    _assert_statistics_match_graph(store)
+
+
+@pytest.mark.parametrize("store_type", ["memory", "oxigraph"])
+def test_statistics_are_invalidated_by_changes_to_the_graph(store_type: str) -> None:
+    store = _create_store(store_type)
+    store.write(AssetsExtractor(AssetList([windfarm.root, windfarm.wind_turbine])), named_graph="assets")
+    assert store.statistics.instances_by_type[DEFAULT_NAMESPACE.Asset] == 2
+
+    # Direct changes to the graph, including bulk additions and SPARQL updates, are seen after graph_changed.
+    store.graph.add((DEFAULT_NAMESPACE.my_pump, RDF.type, DEFAULT_NAMESPACE.Pump))
+    store.graph.addN([(DEFAULT_NAMESPACE.your_pump, RDF.type, DEFAULT_NAMESPACE.Pump, store.graph)])
+    store.graph.update(f"INSERT DATA {{ <{DEFAULT_NAMESPACE.our_pump}> a <{DEFAULT_NAMESPACE.Pump}> }}")
+    assert DEFAULT_NAMESPACE.Pump not in store.statistics.instances_by_type
+    store.graph_changed()
+    assert store.statistics.instances_by_type[DEFAULT_NAMESPACE.Pump] == 3
+    assert ("Pump", 3) in store.summary.itertuples(index=False, name=None)
+    _assert_statistics_match_graph(store)
+
+    store.graph.remove((DEFAULT_NAMESPACE.our_pump, None, None))
+    store.graph_changed()
+    store.drop("assets")
+    assert store.statistics.instances_by_type == {DEFAULT_NAMESPACE.Pump: 2}
+    _assert_statistics_match_graph(store)
+
+
+def test_multi_value_type_property_reads_from_statistics() -> None:
+    store = _create_store("memory")
+    store.write(AssetsExtractor(AssetList([windfarm.root, windfarm.wind_turbine])))
+    store.graph.add((DEFAULT_NAMESPACE.my_pump, RDF.type, DEFAULT_NAMESPACE.Pump))
+    store.graph.add((DEFAULT_NAMESPACE.my_pump, DEFAULT_NAMESPACE.value, Literal(1)))
+    store.graph.add((DEFAULT_NAMESPACE.your_pump, RDF.type, DEFAULT_NAMESPACE.Pump))
+    store.graph.add((DEFAULT_NAMESPACE.your_pump, DEFAULT_NAMESPACE.value, Literal("high")))
+
+    from_index = {
+        (source_type, property_): set(value_types)
+        for source_type, property_, value_types in store.queries.multi_value_type_property()
+    }
+    scanned = {
+        (source_type, property_): set(value_types)
+        for source_type, property_, value_types in Queries(store.graph).multi_value_type_property()
+    }
+
+    assert from_index == scanned
+    assert (DEFAULT_NAMESPACE.Pump, DEFAULT_NAMESPACE.value) in from_index
+
+
+def test_sparql_store_statistics_are_not_cached() -> None:
+    # A remote endpoint can be changed by others, the store is created without connecting to the endpoint.
+    store = NeatGraphStore.from_sparql_store(
+        query_endpoint="http://localhost:7878/query", update_endpoint="http://localhost:7878/update"
+    )
+
+    assert store.statistics.cache is False
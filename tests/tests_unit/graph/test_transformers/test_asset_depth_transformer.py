@@ -1,4 +1,5 @@
 import pytest
+from rdflib import RDF
 
 from cognite.neat._constants import DEFAULT_NAMESPACE
 from cognite.neat._graph import extractors, transformers
@@ -67,3 +68,27 @@ def test_asset_depth_transformer_warning():
         match="Cannot transform graph store with AddAssetDepth, already applied",
     ):
         store.transform(transformer)
+
+
+def test_asset_depth_transformer_cycles_and_orphans():
+    store = NeatGraphStore.from_memory_store()
+    root, child, orphan, cycle_a, cycle_b = (
+        DEFAULT_NAMESPACE[name] for name in ["root", "child", "orphan", "cycle_a", "cycle_b"]
+    )
+    for asset in [root, child, orphan, cycle_a, cycle_b]:
+        store.graph.add((asset, RDF.type, DEFAULT_NAMESPACE.Asset))
+    store.graph.add((root, DEFAULT_NAMESPACE.root, root))
+    store.graph.add((child, DEFAULT_NAMESPACE.parent, root))
+    store.graph.add((cycle_a, DEFAULT_NAMESPACE.parent, cycle_b))
+    store.graph.add((cycle_b, DEFAULT_NAMESPACE.parent, cycle_a))
+
+    transformer = transformers.AddAssetDepth()
+    with pytest.warns(UserWarning) as records:
+        transformer.transform(store.graph)
+
+    messages = [str(record.message) for record in records]
+    assert any("1 assets are not connected to a root asset: orphan" in message for message in messages)
+    assert any("2 assets are part of a cycle" in message for message in messages)
+    depth_by_asset = dict(store.graph.subject_objects(DEFAULT_NAMESPACE.depth))
+    assert {asset: depth.toPython() for asset, depth in depth_by_asset.items()} == {root: 1, child: 2}
+    assert transformer.triples_added == 2
@@ -16,7 +16,12 @@ def test_asset_relationship_connector_transformer():
     store.write(extractors.RelationshipsExtractor.from_file(CLASSIC_CDF_EXTRACTOR_DATA / "relationships.yaml"))
 
     # Connect assets and time series
-    store.transform(transformers.AssetRelationshipConnector())
+    transformer = transformers.AssetRelationshipConnector()
+    store.transform(transformer)
+
+    assert transformer.triples_added == 8
+    assert transformer.triples_removed == 4
+    assert store.provenance[-1].description.endswith("(8 triples added, 4 triples removed)")
 
     result = list(
         store.graph.query(
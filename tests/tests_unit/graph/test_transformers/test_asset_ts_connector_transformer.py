@@ -16,7 +16,11 @@ def test_asset_ts_connector_transformer():
     store.write(extractors.TimeSeriesExtractor.from_file(CLASSIC_CDF_EXTRACTOR_DATA / "timeseries.yaml"))
 
     # Connect assets and time series
-    store.transform(transformers.AssetTimeSeriesConnector())
+    transformer = transformers.AssetTimeSeriesConnector()
+    store.transform(transformer)
+
+    assert transformer.triples_added == 2
+    assert transformer.triples_removed == 0
 
     result = list(store.graph.query(f"SELECT ?asset ?ts WHERE {{ ?asset <{DEFAULT_NAMESPACE.timeSeries}> ?ts}}"))
 
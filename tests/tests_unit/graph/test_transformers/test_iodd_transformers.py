@@ -18,6 +18,7 @@ def test_two_hop_flattener():
     triples = [triple for triple in store.graph.triples((None, None, None))]
 
     assert len(triples) == 386
+    assert (flatten_iodd.triples_added, flatten_iodd.triples_removed) == (4, 10)
 
 
 def test_prune_dangling_nodes():
@@ -0,0 +1,43 @@
+import pytest
+from rdflib import RDF, Literal
+
+from cognite.neat._constants import DEFAULT_NAMESPACE
+from cognite.neat._graph.transformers._prune_graph import PruneDanglingNodes
+from cognite.neat._store import NeatGraphStore
+
+
+@pytest.fixture()
+def store() -> NeatGraphStore:
+    """A pump pointing to disc_0, and an orphaned chain disc_1 -> disc_2 -> disc_3"""
+    store = NeatGraphStore.from_memory_store()
+    store.graph.add((DEFAULT_NAMESPACE.pump, RDF.type, DEFAULT_NAMESPACE.Pump))
+    store.graph.add((DEFAULT_NAMESPACE.pump, DEFAULT_NAMESPACE.disc, DEFAULT_NAMESPACE.disc_0))
+    for no in range(4):
+        store.graph.add((DEFAULT_NAMESPACE[f"disc_{no}"], RDF.type, DEFAULT_NAMESPACE.Disc))
+        store.graph.add((DEFAULT_NAMESPACE[f"disc_{no}"], DEFAULT_NAMESPACE.name, Literal(f"Disc {no}")))
+    for no in range(1, 3):
+        store.graph.add((DEFAULT_NAMESPACE[f"disc_{no}"], DEFAULT_NAMESPACE.next, DEFAULT_NAMESPACE[f"disc_{no + 1}"]))
+    return store
+
+
+def test_prune_until_fixpoint(store: NeatGraphStore) -> None:
+    transformer = PruneDanglingNodes(node_prune_types=[DEFAULT_NAMESPACE.Disc])
+
+    transformer.transform(store.graph)
+
+    assert set(store.graph.subjects(RDF.type, DEFAULT_NAMESPACE.Disc)) == {DEFAULT_NAMESPACE.disc_0}
+    assert transformer.removed_by_round == [(1, 3), (1, 3), (1, 2)]
+    assert transformer.triples_removed == 8
+
+
+def test_prune_max_rounds(store: NeatGraphStore) -> None:
+    transformer = PruneDanglingNodes(node_prune_types=[DEFAULT_NAMESPACE.Disc], max_rounds=1)
+
+    transformer.transform(store.graph)
+
+    assert set(store.graph.subjects(RDF.type, DEFAULT_NAMESPACE.Disc)) == {
+        DEFAULT_NAMESPACE.disc_0,
+        DEFAULT_NAMESPACE.disc_2,
+        DEFAULT_NAMESPACE.disc_3,
+    }
+    assert transformer.removed_by_round == [(1, 3)]
@@ -0,0 +1,48 @@
+from rdflib import Literal
+
+from cognite.neat._constants import DEFAULT_NAMESPACE
+from cognite.neat._graph.transformers import ReduceHopTraversal
+from cognite.neat._rules.analysis import InformationAnalysis
+from cognite.neat._rules.models.information import InformationProperty
+from cognite.neat._store import NeatGraphStore
+from tests.data import car
+
+
+def test_reduce_hop_traversal() -> None:
+    rules = car.CAR_RULES.model_copy(deep=True)
+    rules.properties.extend(
+        [
+            # The names of the colors of the cars made by a manufacturer
+            InformationProperty(
+                class_="neat:Manufacturer",
+                property_="car_colors",
+                value_type="string",
+                max_count=10,
+                transformation="neat:Manufacturer<-neat:Car->neat:Color(neat:name)",
+            ),
+            InformationProperty(
+                class_="neat:Car",
+                property_="car_color",
+                value_type="neat:Color",
+                transformation="neat:Car->neat:Color",
+            ),
+        ]
+    )
+    store = NeatGraphStore.from_memory_store()
+    store._add_triples(car.TRIPLES)
+    store.add_rules(rules)
+    assert InformationAnalysis(rules).has_hop_transformations()
+    transformer = ReduceHopTraversal(rules)
+
+    store.transform(transformer)
+
+    assert set(store.graph.objects(DEFAULT_NAMESPACE.Toyota, DEFAULT_NAMESPACE.car_colors)) == {Literal("blue")}
+    assert set(store.graph.objects(DEFAULT_NAMESPACE.Ford, DEFAULT_NAMESPACE.car_colors)) == {Literal("red")}
+    assert set(store.graph.objects(DEFAULT_NAMESPACE.Car1, DEFAULT_NAMESPACE.car_color)) == {DEFAULT_NAMESPACE.Blue}
+    assert transformer.triples_added == 4
+    # The rules of the caller are left as they are
+    assert InformationAnalysis(rules).has_hop_transformations()
+
+    # The store reads the materialized property instead of refusing the Hop rdfpath
+    colors = {instance_id: properties["car_colors"] for instance_id, properties in store.read("Manufacturer")}
+    assert colors == {"Toyota": ["blue"], "Ford": ["red"]}
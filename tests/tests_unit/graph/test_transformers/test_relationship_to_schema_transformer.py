@@ -0,0 +1,45 @@
+import warnings
+
+from cognite.client.data_classes import Relationship, RelationshipList
+
+from cognite.neat._constants import CLASSIC_CDF_NAMESPACE
+from cognite.neat._graph import extractors, transformers
+from cognite.neat._issues.warnings import ResourceNotFoundWarning
+from cognite.neat._store import NeatGraphStore
+from tests.data import classic_windfarm
+
+
+def test_relationship_to_schema_transformer() -> None:
+    store = NeatGraphStore.from_memory_store()
+    store.write(extractors.AssetsExtractor(classic_windfarm.ASSETS, namespace=CLASSIC_CDF_NAMESPACE))
+    missing_target = [
+        Relationship(
+            external_id=f"WT-0{no}_to_Missing",
+            source_external_id=source.external_id,
+            source_type="Asset",
+            target_external_id="Missing",
+            target_type="Asset",
+        )
+        for no, source in enumerate([classic_windfarm.wind_turbine, classic_windfarm.wind_turbine2], 1)
+    ]
+    relationships = RelationshipList([*classic_windfarm.RELATIONSHIPS, *missing_target])
+    store.write(extractors.RelationshipsExtractor(relationships, namespace=CLASSIC_CDF_NAMESPACE))
+    transformer = transformers.RelationshipToSchemaTransformer()
+
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        store.transform(transformer)
+
+    # The relationships referring to the same missing asset are reported together
+    not_found = [warning.message for warning in caught if isinstance(warning.message, ResourceNotFoundWarning)]
+    assert len(not_found) == 1
+    assert not_found[0].identifier == "Missing"
+
+    edges = set(store.graph.subjects(predicate=CLASSIC_CDF_NAMESPACE.end_node))
+    assert edges == {CLASSIC_CDF_NAMESPACE["WT-01_to_MetMast"], CLASSIC_CDF_NAMESPACE["WT-02_to_MetMast"]}
+    assert store.graph.value(CLASSIC_CDF_NAMESPACE["WT-01_to_MetMast"], CLASSIC_CDF_NAMESPACE.end_node) == (
+        store.graph.value(CLASSIC_CDF_NAMESPACE["WT-02_to_MetMast"], CLASSIC_CDF_NAMESPACE.end_node)
+    )
+    # The relationships with a missing target are left as they are
+    assert len(set(store.graph.subjects(CLASSIC_CDF_NAMESPACE.source_external_id))) == len(missing_target)
+    assert (transformer.triples_added, transformer.triples_removed) == (12, 16)
@@ -1,3 +1,7 @@
+import pytest
+from rdflib import RDF, XSD, Literal
+
+from cognite.neat._constants import DEFAULT_NAMESPACE
 from cognite.neat._graph.examples import nordic44_knowledge_graph
 from cognite.neat._graph.extractors import RdfFileExtractor
 from cognite.neat._graph.transformers._value_type import SplitMultiValueProperty
@@ -16,3 +20,57 @@ def test_split_multi_value_property():
 
     rules = ImporterPipeline.verify(InferenceImporter.from_graph_store(store))
     assert len(InformationAnalysis(rules).multi_value_properties) == 0
+
+
+@pytest.mark.parametrize("store_type", ["memory", "oxigraph"])
+def test_split_by_value_type(store_type: str) -> None:
+    store = NeatGraphStore.from_memory_store() if store_type == "memory" else NeatGraphStore.from_oxi_store()
+    store.graph.add((DEFAULT_NAMESPACE.pump, RDF.type, DEFAULT_NAMESPACE.Pump))
+    store.graph.add((DEFAULT_NAMESPACE.motor, RDF.type, DEFAULT_NAMESPACE.Motor))
+    for value in [
+        Literal(1.0),
+        Literal("2 kW", datatype=XSD.string),
+        DEFAULT_NAMESPACE.motor,
+        DEFAULT_NAMESPACE.unknown,
+    ]:
+        store.graph.add((DEFAULT_NAMESPACE.pump, DEFAULT_NAMESPACE.power, value))
+    transformer = SplitMultiValueProperty()
+
+    store.transform(transformer)
+
+    assert set(store.graph.predicate_objects(DEFAULT_NAMESPACE.pump)) == {
+        (RDF.type, DEFAULT_NAMESPACE.Pump),
+        (DEFAULT_NAMESPACE.power_double, Literal(1.0)),
+        (DEFAULT_NAMESPACE.power_string, Literal("2 kW", datatype=XSD.string)),
+        (DEFAULT_NAMESPACE.power_Motor, DEFAULT_NAMESPACE.motor),
+        (DEFAULT_NAMESPACE.power_UnknownType, DEFAULT_NAMESPACE.unknown),
+    }
+    assert transformer.triples_by_property == {
+        DEFAULT_NAMESPACE.power_double: 1,
+        DEFAULT_NAMESPACE.power_string: 1,
+        DEFAULT_NAMESPACE.power_Motor: 1,
+        DEFAULT_NAMESPACE.power_UnknownType: 1,
+    }
+    assert (transformer.triples_added, transformer.triples_removed) == (4, 4)
+
+
+@pytest.mark.parametrize("store_type", ["memory", "oxigraph"])
+def test_split_object_of_several_types(store_type: str) -> None:
+    store = NeatGraphStore.from_memory_store() if store_type == "memory" else NeatGraphStore.from_oxi_store()
+    store.graph.add((DEFAULT_NAMESPACE.pump, RDF.type, DEFAULT_NAMESPACE.Pump))
+    # The drive is both a motor and a generator
+    store.graph.add((DEFAULT_NAMESPACE.drive, RDF.type, DEFAULT_NAMESPACE.Motor))
+    store.graph.add((DEFAULT_NAMESPACE.drive, RDF.type, DEFAULT_NAMESPACE.Generator))
+    store.graph.add((DEFAULT_NAMESPACE.pump, DEFAULT_NAMESPACE.connectedTo, DEFAULT_NAMESPACE.drive))
+    store.graph.add((DEFAULT_NAMESPACE.pump, DEFAULT_NAMESPACE.connectedTo, Literal("grid", datatype=XSD.string)))
+    transformer = SplitMultiValueProperty()
+
+    store.transform(transformer)
+
+    assert set(store.graph.predicate_objects(DEFAULT_NAMESPACE.pump)) == {
+        (RDF.type, DEFAULT_NAMESPACE.Pump),
+        (DEFAULT_NAMESPACE.connectedTo_Motor, DEFAULT_NAMESPACE.drive),
+        (DEFAULT_NAMESPACE.connectedTo_Generator, DEFAULT_NAMESPACE.drive),
+        (DEFAULT_NAMESPACE.connectedTo_string, Literal("grid", datatype=XSD.string)),
+    }
+    assert (transformer.triples_added, transformer.triples_removed) == (3, 2)
@@ -1,3 +1,7 @@
+import pytest
+from rdflib import RDF, BNode, Literal
+
+from cognite.neat._constants import DEFAULT_NAMESPACE
 from cognite.neat._graph.examples import nordic44_knowledge_graph
 from cognite.neat._graph.extractors import AssetsExtractor, RdfFileExtractor
 from cognite.neat._rules.analysis import InformationAnalysis
@@ -65,3 +69,44 @@ def test_json_value_type_inference():
     assert len(rules.classes) == 1
 
     assert isinstance(properties["metadata"].value_type, Json)
+
+
+def test_rdf_inference_with_sampled_instances():
+    store = NeatGraphStore.from_oxi_store()
+    store.write(RdfFileExtractor(nordic44_knowledge_graph, base_uri="http://nordic44.com/"))
+
+    all_properties = {
+        (prop.class_, prop.property_)
+        for prop in ImporterPipeline.verify(InferenceImporter.from_graph_store(store)).properties
+    }
+    sampled_rules = [
+        ImporterPipeline.verify(
+            InferenceImporter.from_graph_store(store, max_number_of_instance=2, sample_instances=True)
+        )
+        for _ in range(2)
+    ]
+    sampled_properties = {(prop.class_, prop.property_) for prop in sampled_rules[0].properties}
+
+    # The sample is reproducible, the order of the properties is not
+    assert {(prop.class_, prop.property_): prop for prop in sampled_rules[0].properties} == {
+        (prop.class_, prop.property_): prop for prop in sampled_rules[1].properties
+    }
+    assert len(sampled_rules[0].classes) == 59
+    assert sampled_properties <= all_properties
+    assert len(sampled_properties) > 0
+
+
+@pytest.mark.parametrize("store_type", ["memory", "oxigraph"])
+@pytest.mark.parametrize("max_number_of_instance, expected_names", [(-1, 3), (2, 2)])
+def test_rdf_inference_reads_selected_instances(store_type: str, max_number_of_instance: int, expected_names: int):
+    store = NeatGraphStore.from_memory_store() if store_type == "memory" else NeatGraphStore.from_oxi_store()
+    # The instance ids are read before their triples, including blank nodes, which cannot be given as values.
+    for pump in [DEFAULT_NAMESPACE.pump_1, DEFAULT_NAMESPACE.pump_2, BNode()]:
+        store.graph.add((pump, RDF.type, DEFAULT_NAMESPACE.Pump))
+        store.graph.add((pump, DEFAULT_NAMESPACE.name, Literal("Pump")))
+
+    importer = InferenceImporter.from_graph_store(store, max_number_of_instance=max_number_of_instance)
+    rules = ImporterPipeline.verify(importer)
+
+    assert [prop.property_ for prop in rules.properties] == ["name"]
+    assert f"which occurs <{expected_names}> times" in rules.properties[0].comment
@@ -0,0 +1,37 @@
+import gc
+from pathlib import Path
+
+import pytest
+
+from cognite.neat import NeatSession
+from cognite.neat._rules.models import DMSRules, InformationRules
+from cognite.neat._session._state import SessionState
+from cognite.neat._session.exceptions import NeatSessionError
+from tests.config import DOC_RULES
+
+
+def test_reopen_persistent_session(tmp_path: Path) -> None:
+    neat = NeatSession(verbose=False, path=tmp_path)
+    neat.read.excel(DOC_RULES / "information-architect-david.xlsx")
+    neat.verify()
+    neat.convert("dms")
+    assert not neat.read.rdf.examples.nordic44.has_errors
+    triple_count = len(neat._state.store.graph)
+    activities = [change.activity.used for change in neat._state.store.provenance]
+    # Releases the lock on the on-disk store
+    del neat
+    gc.collect()
+
+    reopened = NeatSession(verbose=False, path=tmp_path)
+
+    assert [type(rules) for rules in reopened._state.verified_rules] == [InformationRules, DMSRules]
+    assert len(reopened._state.store.graph) == triple_count
+    reopened_activities = [change.activity.used for change in reopened._state.store.provenance]
+    assert reopened_activities[: len(activities)] == activities
+    assert reopened._state.store.rules == reopened._state.last_verified_information_rules
+    assert reopened._state.store.provenance.activity_took_place("RdfFileExtractor")
+
+
+def test_persistent_session_requires_oxigraph(tmp_path: Path) -> None:
+    with pytest.raises(NeatSessionError, match="oxigraph"):
+        SessionState(store_type="memory", path=tmp_path)